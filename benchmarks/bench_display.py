@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark putting a camera view on screen: smoothscaled against drawn to fit.
+
+For each screen size it times, per frame:
+
+- smoothscale: the old path. Render at the camera's tile size, transpose,
+  ``surfarray.make_surface``, then ``transform.smoothscale`` to the screen
+- fit: ``get_screen_frame`` at the tile size that fits the screen, copied
+  into a persistent surface by ``FrameBlitter``
+
+Usage:
+    SDL_VIDEODRIVER=dummy python benchmarks/bench_display.py --frames 100
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pygame
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game.core.display import FrameBlitter
+from src.game.sar.env import PickupVictimEnv
+
+
+def smoothscale(env, surface, screen):
+    frame = np.transpose(env.render(), (1, 0, 2))
+    scaled = pygame.transform.smoothscale(
+        pygame.surfarray.make_surface(frame), screen
+    )
+    surface.blit(scaled, (0, 0))
+
+
+def per_frame(draw, env, frames, seed=0):
+    """
+    Seconds per frame over random steps, excluding the step time.
+
+    The steps are replayed once first, so that tiles are drawn into the
+    atlas before timing; this measures the steady state of a running GUI.
+    """
+    actions = np.random.default_rng(seed).choice([0, 1, 2, 2, 2], size=frames)
+    for timed in (False, True):
+        env.reset(seed=seed)
+        draw()
+        elapsed = 0.0
+        for action in actions.tolist():
+            env.step(action)
+            start = time.perf_counter()
+            draw()
+            elapsed += time.perf_counter() - start
+    return elapsed / frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--screens", type=int, nargs="+", default=[800, 1080, 1440])
+    args = parser.parse_args()
+
+    pygame.init()
+    env = PickupVictimEnv(room_size=8, num_rows=3, num_cols=3, render_mode="rgb_array")
+    print(f"12x12 edge-follow view, {env.camera.tile_size} px camera tiles")
+    print(f"{'screen':<8} {'smoothscale ms':>15} {'fit ms':>8} {'speedup':>8}")
+    for size in args.screens:
+        screen = (size, size)
+        surface = pygame.Surface(screen)
+        blitter = FrameBlitter(surface)
+        before = per_frame(lambda: smoothscale(env, surface, screen), env, args.frames)
+        after = per_frame(
+            lambda: blitter.blit(env.get_screen_frame(screen)), env, args.frames
+        )
+        print(
+            f"{size:<8} {before * 1e3:>15.2f} {after * 1e3:>8.2f} "
+            f"{before / after:>7.1f}x"
+        )
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Benchmark PickupVictimEnv.step with the object and array backends.
+
+Only step() calls are timed; resets after episode ends are excluded.
+
+Usage:
+    python benchmarks/bench_engine.py --steps 20000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game.sar.env import PickupVictimEnv
+from src.game.sar.utils import VictimPlacer
+
+ENV_KWARGS = dict(
+    room_size=8,
+    num_rows=3,
+    num_cols=3,
+    victim_placer=VictimPlacer(num_fake_victims=3, num_real_victims=1),
+    render_mode=None,
+)
+
+
+def time_steps(backend, steps, seed=0):
+    env = PickupVictimEnv(backend=backend, **ENV_KWARGS)
+    actions = np.random.default_rng(seed).integers(0, 6, size=steps).tolist()
+    random.seed(seed)
+    env.reset(seed=seed)
+
+    elapsed = 0.0
+    for action in actions:
+        start = time.perf_counter()
+        _, _, terminated, truncated, _ = env.step(action)
+        elapsed += time.perf_counter() - start
+        if terminated or truncated:
+            env.reset()
+    return steps / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--steps", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{'backend':>8} {'steps/sec':>12} {'us/step':>8} {'speedup':>8}")
+    base = None
+    for backend in ("object", "array"):
+        rate = time_steps(backend, args.steps)
+        base = base or rate
+        print(f"{backend:>8} {rate:>12.0f} {1e6 / rate:>8.1f} {rate / base:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
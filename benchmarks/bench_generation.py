@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Benchmark parallel PickupVictimEnv level generation.
+
+Generates the same seeds with an increasing number of worker processes and
+checks that every worker count produces identical levels.
+
+Usage:
+    python benchmarks/bench_generation.py --levels 200 --workers 1 2 4
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game.sar.generation import generate_levels
+
+ENV_KWARGS = dict(room_size=8, num_rows=3, num_cols=3, render_mode=None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--levels", type=int, default=200)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    seeds = range(args.seed, args.seed + args.levels)
+    reference = None
+    print(f"{'workers':>8} {'seconds':>9} {'levels/s':>9} {'identical':>10}")
+    for workers in args.workers:
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            levels = {
+                seed: b"".join(array.tobytes() for array in level)
+                for seed, *level in generate_levels(
+                    seeds, num_workers=workers, **ENV_KWARGS
+                )
+            }
+        elapsed = time.perf_counter() - start
+        if reference is None:
+            reference = levels
+        print(
+            f"{workers:>8} {elapsed:>9.2f} {args.levels / elapsed:>9.1f} "
+            f"{str(levels == reference):>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark PickupVictimEnv reset latency against lava density.
+
+Reports the median and p90 reset time and the number of generation
+attempts (gen_mission calls) per reset; attempts above 1 are layouts thrown
+away by RejectSampling or connect_all timeouts.
+
+Usage:
+    python benchmarks/bench_lava.py --resets 30
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game.core.profiling import PhaseProfiler
+from src.game.sar.env import PickupVictimEnv
+
+# (label, LavaPlacer settings)
+DENSITIES = [
+    ("p=0.0", dict(add_lava=False)),
+    ("p=0.3", dict(lava_probability=0.3)),
+    ("p=0.6", dict(lava_probability=0.6)),
+    ("p=0.9", dict(lava_probability=0.9)),
+    ("2/room", dict(lava_per_room=2)),
+    ("4/room", dict(lava_per_room=4)),
+    ("8/room", dict(lava_per_room=8)),
+]
+
+
+def time_resets(resets, seed, **lava_kwargs):
+    env = PickupVictimEnv(
+        room_size=6,
+        num_rows=3,
+        num_cols=3,
+        unblocking=False,
+        render_mode=None,
+        **lava_kwargs,
+    )
+    profiler = PhaseProfiler()
+    profiler.attach(env)
+    random.seed(seed)
+
+    # MiniGrid prints every rejected layout
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(resets):
+            env.reset(seed=seed + i)
+
+    stats = profiler.stats(["reset", "gen_mission"])
+    samples = np.fromiter(profiler.samples["reset"], float)
+    return {
+        "p50_ms": stats["reset"]["p50"] * 1e3,
+        "p90_ms": float(np.percentile(samples, 90)) * 1e3,
+        "attempts": stats["gen_mission"]["count"] / resets,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--resets", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'lava':>8} {'p50 ms':>9} {'p90 ms':>9} {'attempts':>9}")
+    for label, kwargs in DENSITIES:
+        r = time_resets(args.resets, args.seed, **kwargs)
+        print(
+            f"{label:>8} {r['p50_ms']:>9.1f} {r['p90_ms']:>9.1f} "
+            f"{r['attempts']:>9.2f}",
+            flush=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
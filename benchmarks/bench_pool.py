@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark PickupVictimEnv resets with and without a level pool.
+
+Generates a pool, saves it, loads it back memory-mapped and compares the
+reset latency of a plain env against an env resetting from the pool.
+
+Usage:
+    python benchmarks/bench_pool.py --levels 50 --resets 500
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game.sar.env import PickupVictimEnv
+from src.game.sar.pool import LevelPool
+
+ENV_KWARGS = dict(room_size=8, num_rows=3, num_cols=3, render_mode=None)
+
+
+def time_resets(env, resets, seeds):
+    times = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(resets):
+            start = time.perf_counter()
+            env.reset(seed=seeds[i % len(seeds)])
+            times.append(time.perf_counter() - start)
+    return np.array(times) * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--levels", type=int, default=50)
+    parser.add_argument("--resets", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    random.seed(args.seed)
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        pool = LevelPool.generate(args.levels, seed=args.seed, **ENV_KWARGS)
+    generate_s = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as path:
+        pool.save(path)
+        size_kb = sum(f.stat().st_size for f in Path(path).iterdir()) / 1024
+        pool = LevelPool.load(path)
+
+        seeds = list(range(args.seed, args.seed + args.levels))
+        plain = time_resets(PickupVictimEnv(**ENV_KWARGS), args.levels, seeds)
+        pooled = time_resets(
+            PickupVictimEnv(level_pool=pool, **ENV_KWARGS), args.resets, seeds
+        )
+
+    print(f"generated {args.levels} levels in {generate_s:.1f} s ({size_kb:.0f} KiB)")
+    print(f"{'reset':>8} {'p50 ms':>9} {'p90 ms':>9}")
+    for label, times in (("plain", plain), ("pooled", pooled)):
+        print(
+            f"{label:>8} {np.percentile(times, 50):>9.3f} "
+            f"{np.percentile(times, 90):>9.3f}"
+        )
+    print(pool.stats())
+
+
+if __name__ == "__main__":
+    main()
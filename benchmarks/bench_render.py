@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark camera frames/sec: tile-by-tile rendering against the gather renderer.
+
+Each mode renders the camera view of every env in a PickupVictimVecEnv after
+each step:
+
+- tiles: ``env.render()`` per env, copying atlas tiles one by one
+- gather: ``env.render()`` per env with ``gather=True``
+- batch: ``vec.render()``, one gather for the whole (N, H, W, 3) batch
+
+Usage:
+    python benchmarks/bench_render.py --num-envs 16 --steps 200
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game.core.camera import CameraConfig, EdgeFollowCamera
+from src.game.sar.env import PickupVictimEnv
+from src.game.sar.vector import PickupVictimVecEnv
+
+
+def make_vec(args, gather):
+    def env_fn():
+        return PickupVictimEnv(
+            room_size=8,
+            num_rows=3,
+            num_cols=3,
+            backend="array",
+            render_mode="rgb_array",
+            camera_strategy=EdgeFollowCamera(CameraConfig(tile_size=args.tile_size)),
+            gather=gather,
+        )
+
+    return PickupVictimVecEnv(args.num_envs, env_fn=env_fn)
+
+
+def time_frames(vec, mode, actions):
+    """Rendered frames/sec over the steps, excluding the step time."""
+    vec.reset(seed=0)
+    rendering = 0.0
+    for step_actions in actions:
+        vec.step(step_actions)
+        start = time.perf_counter()
+        if mode == "batch":
+            vec.render()
+        else:
+            for env in vec.envs:
+                env.render()
+        rendering += time.perf_counter() - start
+    return len(actions) * vec.num_envs / rendering
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--num-envs", type=int, default=16)
+    parser.add_argument("--steps", type=int, default=200)
+    parser.add_argument("--tile-size", type=int, default=8)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    actions = rng.integers(0, 6, size=(args.steps, args.num_envs))
+
+    print(f"{args.num_envs} envs, 12x12 view, {args.tile_size} px tiles")
+    print(f"{'mode':<8} {'frames/s':>10} {'speedup':>8}")
+    baseline = None
+    for mode in ("tiles", "gather", "batch"):
+        vec = make_vec(args, gather=mode == "gather")
+        fps = time_frames(vec, mode, actions)
+        baseline = baseline or fps
+        print(f"{mode:<8} {fps:>10.0f} {fps / baseline:>7.1f}x")
+        vec.close()
+
+
+if __name__ == "__main__":
+    main()
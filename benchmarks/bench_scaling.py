@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark PickupVictimEnv reset time as the room grid grows.
+
+Resets square room grids from 3x3 up to 40x40 and reports the latency per
+reset and per room, so linear scaling shows as a flat ms/room column, along
+with the generation restarts and the most expensive generation step.
+``--lazy-rooms`` resets with lazy rooms, which fill only the rooms in view;
+the objects column shows how many room objects each reset created.
+
+Usage:
+    python benchmarks/bench_scaling.py --sizes 3 5 10 20 40 --resets 3
+    python benchmarks/bench_scaling.py --sizes 32 40 --lazy-rooms
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game.sar.env import PickupVictimEnv
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[3, 5, 10, 20, 30, 40]
+    )
+    parser.add_argument("--resets", type=int, default=3)
+    parser.add_argument("--room-size", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--lazy-rooms", action="store_true")
+    args = parser.parse_args()
+
+    print(
+        f"{'grid':>7} {'rooms':>6} {'p50 ms':>9} {'ms/room':>8} "
+        f"{'objects':>8} {'restarts':>9}  slowest step"
+    )
+    for size in args.sizes:
+        env = PickupVictimEnv(
+            room_size=args.room_size,
+            num_rows=size,
+            num_cols=size,
+            lazy_rooms=args.lazy_rooms,
+            render_mode=None,
+        )
+        times = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            for i in range(args.resets):
+                start = time.perf_counter()
+                env.reset(seed=args.seed + i)
+                times.append(time.perf_counter() - start)
+        objects = sum(len(room.objs) for row in env.room_grid for room in row)
+        env.close()
+
+        p50 = 1e3 * float(np.percentile(times, 50))
+        summary = env.generation_stats.summary()
+        print(
+            f"{size:>3}x{size:<3} {size * size:>6} {p50:>9.1f} "
+            f"{p50 / size**2:>8.3f} {objects:>8} "
+            f"{summary['restarts_per_level']:>9.2f}  "
+            f"{summary['top_time']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
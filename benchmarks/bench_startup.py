@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark worker startup: import plus environment construction time.
+
+Each sample runs in a fresh interpreter, as a spawned worker would.
+
+Usage:
+    python benchmarks/bench_startup.py --samples 5
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+WORKER_SNIPPET = """
+import json, sys, time
+start = time.perf_counter()
+from src.game.sar.env import PickupVictimEnv
+imported = time.perf_counter()
+env = PickupVictimEnv(render_mode={render_mode!r})
+constructed = time.perf_counter()
+pygame = sys.modules.get("pygame")
+print(json.dumps({{
+    "import_s": imported - start,
+    "construct_s": constructed - imported,
+    "display_initialized": bool(pygame and pygame.display.get_init()),
+}}))
+"""
+
+
+def sample(render_mode):
+    code = WORKER_SNIPPET.format(render_mode=render_mode)
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--samples", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'render_mode':>12} {'import ms':>10} {'construct ms':>13} {'display':>8}")
+    for render_mode in (None, "rgb_array"):
+        runs = [sample(render_mode) for _ in range(args.samples)]
+        import_ms = statistics.median(r["import_s"] for r in runs) * 1000
+        construct_ms = statistics.median(r["construct_s"] for r in runs) * 1000
+        display = any(r["display_initialized"] for r in runs)
+        print(
+            f"{str(render_mode):>12} {import_ms:>10.1f} {construct_ms:>13.2f} "
+            f"{str(display):>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark tile rendering before and after the tile atlas.
+
+For the 4 victim and 8 fake victim shapes it times:
+
+- drawing the shape into a supersampled tile: the old per-pixel
+  ``fill_coords`` predicates against ``VictimBase.render``'s cached masks
+- a first draw (cache miss): ``Grid.render_tile`` with its cache cleared,
+  against the atlas's ``render_tile`` once the masks exist
+- a lookup (cache hit): ``Grid.render_tile`` against ``TileAtlas.tile``
+
+Usage:
+    python benchmarks/bench_tiles.py --tile-size 32 --repeats 3
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from minigrid.core.constants import COLORS
+from minigrid.core.grid import Grid
+from minigrid.utils.rendering import fill_coords, point_in_rect
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game.core.atlas import TileAtlas, render_tile
+from src.game.sar.objects import FakeVictim, Victim
+
+
+def legacy_render(victim, img):
+    for coords in victim._get_render_coords():
+        fill_coords(img, point_in_rect(*coords), COLORS[victim.color])
+    return img
+
+
+def per_call(fn, items, repeats):
+    """Best-of-``repeats`` seconds per item."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for item in items:
+            fn(item)
+        best = min(best, (time.perf_counter() - start) / len(items))
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tile-size", type=int, default=32)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    tile_size = args.tile_size
+    size = tile_size * 3
+    victims = [Victim(direction) for direction in Victim._COORDS]
+    victims += [FakeVictim(*key) for key in FakeVictim._COORDS]
+
+    def blank(_=None):
+        return np.zeros((size, size, 3), dtype=np.uint8)
+
+    # Masks are built on first use; time the steady state
+    for victim in victims:
+        victim.render(blank())
+        render_tile(victim, tile_size=tile_size)
+
+    def cold_render_tile(victim):
+        Grid.tile_cache.clear()
+        Grid.render_tile(victim, tile_size=tile_size)
+
+    atlas = TileAtlas()
+    atlas.warm(victims, tile_size=tile_size, agent_dirs=(None,))
+    Grid.tile_cache.clear()
+    for victim in victims:
+        Grid.render_tile(victim, tile_size=tile_size)
+
+    cases = [
+        (
+            "shape draw",
+            lambda v: legacy_render(v, blank()),
+            lambda v: v.render(blank()),
+        ),
+        (
+            "first draw",
+            cold_render_tile,
+            lambda v: render_tile(v, tile_size=tile_size),
+        ),
+        (
+            "lookup",
+            lambda v: Grid.render_tile(v, tile_size=tile_size),
+            lambda v: atlas.tile(v, tile_size=tile_size),
+        ),
+    ]
+
+    print(f"{len(victims)} victim shapes, {tile_size} px tiles, {size} px supersampled")
+    print(f"{'':<12} {'before us':>10} {'after us':>10} {'speedup':>8}")
+    for name, before_fn, after_fn in cases:
+        before = per_call(before_fn, victims, args.repeats)
+        after = per_call(after_fn, victims, args.repeats)
+        print(
+            f"{name:<12} {before * 1e6:>10.1f} {after * 1e6:>10.1f} "
+            f"{before / after:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark steps/sec of SharedMemoryVecEnv against the number of workers.
+
+Usage:
+    python benchmarks/bench_vector.py --envs-per-worker 8 --steps 500
+"""
+
+import argparse
+import multiprocessing as mp
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game.sar.utils import VictimPlacer
+from src.game.sar.vector import PickupVictimVecEnv, SharedMemoryVecEnv
+
+ENV_KWARGS = dict(
+    room_size=8,
+    num_rows=3,
+    num_cols=3,
+    victim_placer=VictimPlacer(num_fake_victims=3, num_real_victims=1),
+    render_mode=None,
+)
+
+
+def worker_counts(max_workers):
+    """1, 2, 4, ... up to max_workers (always including max_workers)."""
+    counts, n = [], 1
+    while n < max_workers:
+        counts.append(n)
+        n *= 2
+    counts.append(max_workers)
+    return counts
+
+
+def time_steps(vec, num_envs, steps, seed=0):
+    rng = np.random.default_rng(seed)
+    actions = rng.integers(0, 6, size=(steps, num_envs))
+    vec.reset(seed=seed)
+
+    start = time.perf_counter()
+    for t in range(steps):
+        vec.step(actions[t])
+    elapsed = time.perf_counter() - start
+    return num_envs * steps / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--envs-per-worker", type=int, default=8)
+    parser.add_argument("--steps", type=int, default=500)
+    parser.add_argument("--max-workers", type=int, default=mp.cpu_count())
+    args = parser.parse_args()
+
+    print(f"{'workers':>8} {'envs':>6} {'steps/sec':>12} {'speedup':>8}")
+
+    # Single-process reference
+    vec = PickupVictimVecEnv(args.envs_per_worker, **ENV_KWARGS)
+    base = time_steps(vec, args.envs_per_worker, args.steps)
+    vec.close()
+    print(f"{'inproc':>8} {args.envs_per_worker:>6} {base:>12.0f} {1.0:>8.2f}")
+
+    for workers in worker_counts(args.max_workers):
+        num_envs = workers * args.envs_per_worker
+        vec = SharedMemoryVecEnv(num_envs, num_workers=workers, **ENV_KWARGS)
+        try:
+            rate = time_steps(vec, num_envs, args.steps)
+        finally:
+            vec.close()
+        print(f"{workers:>8} {num_envs:>6} {rate:>12.0f} {rate / base:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite: PickupVictimEnv and the configs/config.yml difficulty tiers.
+
+For each case it measures resets/sec, steps/sec, render FPS per camera
+strategy, GameRecorder overhead and peak traced memory, keeping the best of a
+few runs, writes the results to JSON and optionally compares them against a
+stored baseline.
+
+Rates depend on the machine and on its load at the time, so before each run
+of a case the suite also times a fixed calibration workload; when comparing,
+a case's rates are scaled by the ratio of the baseline's calibration speed
+for that case to this run's before looking for regressions.
+
+The stored baseline, benchmarks/baseline.json, should be refreshed at the tip
+of the branch whenever a change moves performance on purpose (a full run, not
+--quick, so the sizes match the default comparison):
+
+    python benchmarks/suite.py --save-baseline benchmarks/baseline.json
+
+Usage:
+    python benchmarks/suite.py --output results.json
+    python benchmarks/suite.py --baseline benchmarks/baseline.json --threshold 0.2
+    python benchmarks/suite.py --quick --output results.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import yaml
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Add project root to path
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.game.core.camera import AgentCenteredCamera, EdgeFollowCamera, FullviewCamera
+from src.game.sar.env import PickupVictimEnv
+from src.game.sar.utils import VictimPlacer
+from src.game.test_environments import MultiRoomDifficultyEnv
+from src.game_recorder import GameRecorder
+
+CONFIG_PATH = PROJECT_ROOT / "configs" / "config.yml"
+
+CAMERAS = {
+    "fullview": FullviewCamera,
+    "agent_centered": AgentCenteredCamera,
+    "edge_follow": EdgeFollowCamera,
+}
+
+# Whether a larger value of a metric is better (rates) or worse (costs)
+HIGHER_IS_BETTER = {
+    "resets_per_sec": True,
+    "steps_per_sec": True,
+    "recorder_overhead": False,
+    "peak_memory_mb": False,
+}
+
+# Actions sampled for stepping: left, right, forward x2, pickup, toggle
+ACTIONS = np.array([0, 1, 2, 2, 3, 5])
+
+# Work per measurement at full scale; --quick divides these by 10
+SIZES = {"resets": 20, "steps": 2000, "frames": 50}
+
+
+def pickup_victim_env(camera=None):
+    return PickupVictimEnv(
+        room_size=8,
+        num_rows=3,
+        num_cols=3,
+        victim_placer=VictimPlacer(num_fake_victims=3, num_real_victims=2),
+        render_mode="rgb_array",
+        camera_strategy=camera,
+    )
+
+
+def difficulty_env(config):
+    def make(camera=None):
+        return MultiRoomDifficultyEnv(config, render_mode="rgb_array")
+
+    return make
+
+
+def load_cases():
+    """Case name -> (env factory, supports camera strategies and recorder)."""
+    with open(CONFIG_PATH) as f:
+        tiers = yaml.safe_load(f)["game_difficulties"]
+
+    cases = {"pickup_victim": (pickup_victim_env, True)}
+    for tier, config in tiers.items():
+        cases[f"multiroom_{tier}"] = (difficulty_env(config), False)
+    return cases
+
+
+def calibrate(repeats=5):
+    """
+    Speed of this machine on a fixed Python and NumPy workload, in runs/sec.
+
+    The best of ``repeats`` runs is kept, as it is the least disturbed by
+    other load.
+    """
+    rng = np.random.default_rng(0)
+    planes = rng.integers(0, 10, size=(64, 64, 3), dtype=np.uint8)
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        total = 0
+        for i in range(20000):
+            total += (i * 7) % 13
+        for _ in range(200):
+            total += int(planes[planes[..., 0] > 4].sum())
+        best = min(best, time.perf_counter() - start)
+    return 1.0 / best
+
+
+def seed_all(seed):
+    # Level generation only uses the env's np_random; this covers the rest
+    random.seed(seed)
+    np.random.seed(seed)
+
+
+def rollout(env, steps, seed, recorder=None):
+    """
+    Step with a fixed action sequence, resetting when episodes end.
+
+    Returns the time spent stepping (and recording); resets are excluded.
+    """
+    actions = np.random.default_rng(seed).choice(ACTIONS, size=steps).tolist()
+    env.reset(seed=seed)
+    if recorder is not None:
+        recorder.start()
+
+    elapsed = 0.0
+    for action in actions:
+        start = time.perf_counter()
+        _, reward, terminated, truncated, _ = env.step(action)
+        if recorder is not None:
+            recorder.step(action, reward)
+        elapsed += time.perf_counter() - start
+        if terminated or truncated:
+            env.reset()
+            if recorder is not None:
+                recorder.start()
+    return elapsed
+
+
+def measure_resets(make, n, seed):
+    env = make()
+    seed_all(seed)
+    start = time.perf_counter()
+    for i in range(n):
+        env.reset(seed=seed + i)
+    return n / (time.perf_counter() - start)
+
+
+def measure_steps(make, n, seed):
+    env = make()
+    seed_all(seed)
+    return n / rollout(env, n, seed)
+
+
+def measure_render(make, n, seed, camera=None):
+    env = make(camera)
+    seed_all(seed)
+    env.reset(seed=seed)
+    state = env.get_state()
+
+    def frames():
+        for i in range(n):
+            env.step(int(ACTIONS[i % 3]))
+            env.render()
+
+    # Replay the same frames twice so tile cache misses are not timed
+    frames()
+    env.set_state(state)
+    start = time.perf_counter()
+    frames()
+    return n / (time.perf_counter() - start)
+
+
+def measure_recorder_overhead(make, n, seed):
+    """Relative slowdown of stepping with GameRecorder attached."""
+    env = make()
+    seed_all(seed)
+    plain = rollout(env, n, seed)
+    seed_all(seed)
+    recorded = rollout(env, n, seed, recorder=GameRecorder(env))
+    return recorded / plain - 1.0
+
+
+def measure_peak_memory(make, sizes, seed):
+    """Peak traced Python memory over a reset, a rollout and some renders."""
+    seed_all(seed)
+    tracemalloc.start()
+    try:
+        env = make()
+        rollout(env, sizes["steps"] // 4, seed)
+        for _ in range(sizes["frames"] // 4 or 1):
+            env.render()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 2**20
+
+
+def run_case(make, with_cameras, sizes, seed):
+    result = {
+        "resets_per_sec": measure_resets(make, sizes["resets"], seed),
+        "steps_per_sec": measure_steps(make, sizes["steps"], seed),
+    }
+    if with_cameras:
+        for name, camera in CAMERAS.items():
+            result[f"render_fps_{name}"] = measure_render(
+                make, sizes["frames"], seed, camera()
+            )
+        result["recorder_overhead"] = measure_recorder_overhead(
+            make, sizes["steps"], seed
+        )
+    else:
+        result["render_fps_default"] = measure_render(make, sizes["frames"], seed)
+    result["peak_memory_mb"] = measure_peak_memory(make, sizes, seed)
+    return result
+
+
+def higher_is_better(metric):
+    return metric.startswith("render_fps") or HIGHER_IS_BETTER[metric]
+
+
+def compare(results, baseline, threshold, speed=None):
+    """
+    Compare results against a baseline.
+
+    Args:
+        speed: Optional case -> calibration speed of this run relative to the
+            baseline's; the case's rates are divided by it before comparing
+
+    Returns:
+        list: (case, metric, baseline, current, relative change) for every
+        metric that got worse by more than ``threshold``
+    """
+    regressions = []
+    speed = speed or {}
+    for case, metrics in results.items():
+        for metric, value in metrics.items():
+            base = baseline.get(case, {}).get(metric)
+            if base is None:
+                continue
+            if higher_is_better(metric):
+                value = value / speed.get(case, 1.0)
+            if metric == "recorder_overhead":
+                # Overheads hover around zero, so compare absolute differences
+                change = value - base
+            elif base == 0:
+                continue
+            else:
+                change = (value - base) / abs(base)
+            worse = -change if higher_is_better(metric) else change
+            if worse > threshold:
+                regressions.append((case, metric, base, value, change))
+    return regressions
+
+
+def best_of(runs):
+    """
+    Per metric, the best value over repeated runs of a case.
+
+    The recorder overhead is a difference of two timings whose noise is
+    centred on zero, so the median is kept instead.
+    """
+    best = {}
+    for metric in runs[0]:
+        values = [run[metric] for run in runs]
+        if metric == "recorder_overhead":
+            best[metric] = float(np.median(values))
+        else:
+            best[metric] = max(values) if higher_is_better(metric) else min(values)
+    return best
+
+
+def print_results(results):
+    for case, metrics in results.items():
+        print(f"\n{case}")
+        for metric, value in metrics.items():
+            print(f"  {metric:<26} {value:>12.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", help="Write results JSON here")
+    parser.add_argument("--baseline", help="Baseline JSON to compare against")
+    parser.add_argument("--save-baseline", help="Write results as a new baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Allowed relative regression before failing (default: 0.2)",
+    )
+    parser.add_argument("--cases", nargs="*", help="Only run these cases")
+    parser.add_argument("--quick", action="store_true", help="10x less work")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        default=3,
+        help="Runs per case; the best value of each metric is kept (default: 3)",
+    )
+    args = parser.parse_args()
+
+    sizes = {k: max(v // 10, 2) if args.quick else v for k, v in SIZES.items()}
+    cases = load_cases()
+    if args.cases:
+        cases = {name: cases[name] for name in args.cases}
+
+    results, calibration = {}, {}
+    for name, (make, with_cameras) in cases.items():
+        print(f"running {name}...", file=sys.stderr)
+        runs, speeds = [], []
+        for _ in range(args.repeats):
+            speeds.append(calibrate())
+            runs.append(run_case(make, with_cameras, sizes, args.seed))
+        results[name] = best_of(runs)
+        calibration[name] = max(speeds)
+    print_results(results)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": sizes,
+            "seed": args.seed,
+            "repeats": args.repeats,
+            "calibration": calibration,
+        },
+        "results": results,
+    }
+    for path in (args.output, args.save_baseline):
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            Path(path).write_text(json.dumps(report, indent=2) + "\n")
+
+    if args.baseline:
+        stored = json.loads(Path(args.baseline).read_text())
+        base_calibration = stored["meta"].get("calibration", {})
+        speed = {
+            name: value / base_calibration.get(name, value)
+            for name, value in calibration.items()
+        }
+        print("\nMachine speed relative to the baseline:")
+        for name, value in speed.items():
+            print(f"  {name:<26} {value:>11.2f}x")
+        regressions = compare(results, stored["results"], args.threshold, speed)
+        if regressions:
+            print(f"\nRegressions beyond {args.threshold:.0%}:")
+            for case, metric, base, value, change in regressions:
+                print(f"  {case}.{metric}: {base:.3f} -> {value:.3f} ({change:+.1%})")
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Sweep PickupVictimEnv generation settings and report retries and latency.
+
+Every combination of the swept settings is reset ``--resets`` times with
+fixed seeds. One line per configuration gives the generation restarts and
+in-step retries per level, the latency and the source of most restarts (see
+GenerationStats). A heatmap of a chosen metric over locked_room_prob (rows)
+and lava_probability (columns) follows for each grid size and num_dists.
+
+Usage:
+    python benchmarks/sweep_generation.py --sizes 6x3x3 8x3x3 \\
+        --locked-room-prob 0.2 0.5 --lava-probability 0 0.5 1
+"""
+
+import argparse
+import contextlib
+import io
+import itertools
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game.sar.env import PickupVictimEnv
+
+# Shades for the heatmap, low to high
+SHADES = " .:-=+*#%@"
+
+METRICS = {
+    "ms": "p50 reset latency (ms)",
+    "restarts": "generation restarts per level",
+    "retries": "in-step retries per level",
+}
+
+
+def parse_size(text):
+    """'ROOMxROWSxCOLS' -> (room_size, num_rows, num_cols)."""
+    try:
+        room_size, num_rows, num_cols = (int(v) for v in text.split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected ROOMxROWSxCOLS, got {text!r}")
+    return room_size, num_rows, num_cols
+
+
+def measure(size, num_dists, locked_room_prob, lava_probability, resets, seed):
+    room_size, num_rows, num_cols = size
+    try:
+        env = PickupVictimEnv(
+            room_size=room_size,
+            num_rows=num_rows,
+            num_cols=num_cols,
+            num_dists=num_dists,
+            locked_room_prob=locked_room_prob,
+            lava_probability=lava_probability,
+            add_lava=lava_probability > 0,
+            render_mode=None,
+        )
+    except ValueError as error:
+        # More locked rooms than the layout can hold
+        return {"error": str(error)}
+
+    times = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(resets):
+            start = time.perf_counter()
+            env.reset(seed=seed + i)
+            times.append(time.perf_counter() - start)
+    env.close()
+
+    summary = env.generation_stats.summary()
+    return {
+        "ms": 1e3 * float(np.percentile(times, 50)),
+        "p90": 1e3 * float(np.percentile(times, 90)),
+        "restarts": summary["restarts_per_level"],
+        "retries": summary["retries_per_level"],
+        "top": summary["top_rejection"] if summary["restarts_per_level"] else "-",
+    }
+
+
+def print_heatmap(results, metric, size, num_dists, locked_probs, lava_probs):
+    values = [
+        results[size, num_dists, locked, lava].get(metric)
+        for locked in locked_probs
+        for lava in lava_probs
+    ]
+    values = [v for v in values if v is not None]
+    top = max(values, default=0) or 1
+
+    room_size, num_rows, num_cols = size
+    print(
+        f"\n{METRICS[metric]}: {room_size}x{num_rows}x{num_cols}, "
+        f"num_dists={num_dists} (rows: locked_room_prob, "
+        "columns: lava_probability)"
+    )
+    print(f"{'':>8}" + "".join(f"{lava:>10}" for lava in lava_probs))
+    for locked in locked_probs:
+        cells = []
+        for lava in lava_probs:
+            value = results[size, num_dists, locked, lava].get(metric)
+            if value is None:
+                cells.append(f"{'n/a':>10}")
+                continue
+            shade = SHADES[min(len(SHADES) - 1, int(value / top * len(SHADES)))]
+            cells.append(f"{value:>8.2f} {shade}")
+        print(f"{locked:>8}" + "".join(cells))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=parse_size, nargs="+", default=[(8, 3, 3)],
+        help="grid sizes as ROOMxROWSxCOLS",
+    )
+    parser.add_argument(
+        "--locked-room-prob", type=float, nargs="+", default=[0.2, 0.5, 0.8]
+    )
+    parser.add_argument(
+        "--lava-probability", type=float, nargs="+", default=[0.0, 0.5, 1.0]
+    )
+    parser.add_argument("--num-dists", type=int, nargs="+", default=[18])
+    parser.add_argument("--resets", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--metric", choices=sorted(METRICS), default="ms")
+    args = parser.parse_args()
+
+    results = {}
+    print(
+        f"{'size':>8} {'dists':>6} {'locked':>7} {'lava':>6} {'p50 ms':>8} "
+        f"{'p90 ms':>8} {'restarts':>9} {'retries':>8}  top rejection"
+    )
+    for size, num_dists, locked, lava in itertools.product(
+        args.sizes, args.num_dists, args.locked_room_prob, args.lava_probability
+    ):
+        result = measure(size, num_dists, locked, lava, args.resets, args.seed)
+        results[size, num_dists, locked, lava] = result
+        label = "x".join(str(v) for v in size)
+        if "error" in result:
+            print(f"{label:>8} {num_dists:>6} {locked:>7} {lava:>6}  {result['error']}")
+            continue
+        print(
+            f"{label:>8} {num_dists:>6} {locked:>7} {lava:>6} {result['ms']:>8.2f} "
+            f"{result['p90']:>8.2f} {result['restarts']:>9.2f} "
+            f"{result['retries']:>8.2f}  {result['top']}"
+        )
+
+    for size, num_dists in itertools.product(args.sizes, args.num_dists):
+        print_heatmap(
+            results, args.metric, size, num_dists,
+            args.locked_room_prob, args.lava_probability,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Search and Rescue game package.
+
+Importing the package is cheap: the public names below are resolved on first
+access, so the simulation core (``game.sar``, ``game.core``) can be used
+without importing pygame_gui or initialising pygame, and the GUI is only
+loaded when ``SAREnvGUI`` is requested.
+"""
+
+import importlib
+
+# Public name -> submodule that defines it (relative to this package)
+_LAZY_ATTRS = {
+    "SAREnv": ".core.env",
+    "SARLevelGen": ".core.level",
+    "EnvState": ".core.state",
+    "PhaseProfiler": ".core.profiling",
+    "CameraConfig": ".core.camera",
+    "AgentCenteredCamera": ".core.camera",
+    "EdgeFollowCamera": ".core.camera",
+    "FullviewCamera": ".core.camera",
+    "PickupVictimEnv": ".sar.env",
+    "LevelPool": ".sar.pool",
+    "LayoutCache": ".sar.cache",
+    "GenerationStats": ".sar.telemetry",
+    "LevelMutator": ".sar.mutation",
+    "generate_levels": ".sar.generation",
+    "LavaPlacer": ".sar.utils",
+    "VictimPlacer": ".sar.utils",
+    "PickupVictimVecEnv": ".sar.vector",
+    "SharedMemoryVecEnv": ".sar.vector",
+    "SAREnvGUI": ".gui.main",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
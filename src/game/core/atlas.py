@@ -0,0 +1,182 @@
+import math
+
+import numpy as np
+from minigrid.core.constants import OBJECT_TO_IDX, TILE_PIXELS
+from minigrid.core.world_object import WorldObj
+from minigrid.utils.rendering import (
+    downsample,
+    highlight_img,
+    point_in_rect,
+    point_in_triangle,
+    rotate_fn,
+)
+
+# Boolean pixel masks of shapes, by (shape key, height, width)
+_masks = {}
+
+# Code of an empty cell, as in Grid.encode
+EMPTY_CODE = (OBJECT_TO_IDX["empty"], 0, 0)
+
+
+def shape_mask(key, fn, height, width):
+    """
+    Pixels of a (height, width) image that ``fill_coords(img, fn, color)``
+    would fill, computed once per key and size.
+
+    The predicate is evaluated exactly as ``fill_coords`` does, at pixel
+    centres, so filling ``img[mask]`` gives the same pixels.
+
+    Args:
+        key: Hashable name of the shape ``fn`` describes
+        fn: Predicate over (x, y) in [0, 1]
+        height, width: Image size in pixels
+
+    Returns:
+        np.ndarray: Read-only (height, width) bool mask
+    """
+    mask = _masks.get((key, height, width))
+    if mask is None:
+        mask = np.zeros((height, width), dtype=bool)
+        for y in range(height):
+            yf = (y + 0.5) / height
+            for x in range(width):
+                mask[y, x] = bool(fn((x + 0.5) / width, yf))
+        mask.flags.writeable = False
+        _masks[key, height, width] = mask
+    return mask
+
+
+def rects_mask(rects, height, width):
+    """``shape_mask`` of a union of ``point_in_rect`` rectangles."""
+    rects = tuple(tuple(rect) for rect in rects)
+    mask = _masks.get((rects, height, width))
+    if mask is None:
+        mask = np.zeros((height, width), dtype=bool)
+        for rect in rects:
+            mask |= shape_mask(("rect", rect), point_in_rect(*rect), height, width)
+        mask.flags.writeable = False
+        _masks[rects, height, width] = mask
+    return mask
+
+
+def _agent_fn(agent_dir):
+    # The agent triangle of Grid.render_tile
+    tri_fn = point_in_triangle((0.12, 0.19), (0.87, 0.50), (0.12, 0.81))
+    return rotate_fn(tri_fn, cx=0.5, cy=0.5, theta=0.5 * math.pi * agent_dir)
+
+
+def render_tile(obj, agent_dir=None, highlight=False, tile_size=TILE_PIXELS, subdivs=3):
+    """
+    Render one tile, pixel-identical to ``Grid.render_tile`` once cast to
+    uint8 as ``Grid.render`` does.
+
+    The grid lines and agent triangle are filled from cached masks instead
+    of evaluating their predicates per pixel; the object draws itself.
+
+    Returns:
+        np.ndarray: (tile_size, tile_size, 3) uint8 tile
+    """
+    size = tile_size * subdivs
+    img = np.zeros((size, size, 3), dtype=np.uint8)
+
+    # Grid lines (top and left edges)
+    img[rects_mask(((0, 0.031, 0, 1), (0, 1, 0, 0.031)), size, size)] = (100, 100, 100)
+
+    if obj is not None:
+        obj.render(img)
+
+    if agent_dir is not None:
+        mask = shape_mask(("agent", agent_dir), _agent_fn(agent_dir), size, size)
+        img[mask] = (255, 0, 0)
+
+    if highlight:
+        highlight_img(img)
+
+    return downsample(img, subdivs).astype(np.uint8)
+
+
+class TileAtlas:
+    """
+    Rendered tiles keyed by (object type, color, state, agent direction,
+    highlight, tile size).
+
+    Each tile is drawn once, with ``render_tile``, and shared by every
+    renderer that asks for it. Tiles can be looked up from an object or from
+    its ``encode()`` code, so renderers working on encoded grids need no
+    objects; codes are turned back into objects with ``decode`` on a miss.
+    Tiles are read-only.
+    """
+
+    def __init__(self, decode=None):
+        """
+        Create an empty atlas.
+
+        Args:
+            decode: Function (type, color, state) -> WorldObj or None for
+                code lookups (default: ``WorldObj.decode``)
+        """
+        self.decode = decode or WorldObj.decode
+        self.tiles = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.tiles)
+
+    def tile(self, obj, agent_dir=None, highlight=False, tile_size=TILE_PIXELS):
+        """Tile of an object (None for an empty cell)."""
+        code = EMPTY_CODE if obj is None else obj.encode()
+        return self.tile_for_code(code, agent_dir, highlight, tile_size, obj)
+
+    def tile_for_code(
+        self, code, agent_dir=None, highlight=False, tile_size=TILE_PIXELS, obj=None
+    ):
+        """
+        Tile of an encoded cell.
+
+        Args:
+            code: (type, color, state) as in ``Grid.encode``
+            agent_dir: Direction of the agent drawn on the tile, or None
+            highlight: Whether the tile is highlighted
+            tile_size: Tile size in pixels
+            obj: The object, if at hand, to skip decoding on a miss
+
+        Returns:
+            np.ndarray: Read-only (tile_size, tile_size, 3) uint8 tile
+        """
+        key = (*code, agent_dir, bool(highlight), tile_size)
+        tile = self.tiles.get(key)
+        if tile is not None:
+            self.hits += 1
+            return tile
+
+        self.misses += 1
+        if obj is None and code[0] != EMPTY_CODE[0]:
+            obj = self.decode(*code)
+        tile = render_tile(obj, agent_dir, highlight, tile_size)
+        tile.flags.writeable = False
+        self.tiles[key] = tile
+        return tile
+
+    def warm(self, objects, tile_size=TILE_PIXELS, agent_dirs=(None, 0, 1, 2, 3)):
+        """
+        Draw the tiles of some objects ahead of time, with and without the
+        agent and highlight.
+
+        Args:
+            objects: Objects (None for an empty cell)
+            tile_size: Tile size in pixels
+            agent_dirs: Agent overlays to draw
+        """
+        for obj in objects:
+            for agent_dir in agent_dirs:
+                for highlight in (False, True):
+                    self.tile(obj, agent_dir, highlight, tile_size)
+
+    def clear(self):
+        """Drop all tiles."""
+        self.tiles.clear()
+
+
+# Atlas shared by the renderers (render_window, TileFramebuffer)
+TILE_ATLAS = TileAtlas()
@@ -4,6 +4,9 @@ from typing import Tuple
 
 import numpy as np
 
+from .atlas import TILE_ATLAS
+from .gather import window_codes
+
 
 @dataclass
 class CameraConfig:
@@ -14,23 +17,154 @@ class CameraConfig:
     tile_size: int = 64
 
 
+def fit_tile_size(view_tiles, screen_size):
+    """
+    Largest tile size at which a view of (width, height) tiles fits a
+    (width, height) screen in pixels, so frames need no rescaling.
+    """
+    width, height = view_tiles
+    return max(1, min(screen_size[0] // width, screen_size[1] // height))
+
+
+def render_window(grid, tile_size, agent_pos, agent_dir, top_x, top_y, width, height):
+    """
+    Render only the tiles of a window of the grid.
+
+    Pixel-identical to slicing ``grid.render(tile_size, agent_pos, agent_dir)``
+    to the window, including its clipping at the grid's right and bottom
+    edges, but draws width x height tiles instead of the whole grid, taken
+    from the shared tile atlas.
+
+    Args:
+        grid: Grid to render
+        tile_size: Tile size in pixels
+        agent_pos: Agent position, drawn with ``agent_dir`` if in the window
+        agent_dir: Agent direction
+        top_x, top_y: Top-left tile of the window
+        width, height: Window size in tiles
+
+    Returns:
+        np.ndarray: (height * tile_size, width * tile_size, 3) image, fewer
+        rows or columns where the window runs past the grid
+    """
+    x0, y0 = max(top_x, 0), max(top_y, 0)
+    x1, y1 = min(top_x + width, grid.width), min(top_y + height, grid.height)
+    img = np.zeros(
+        (max(y1 - y0, 0) * tile_size, max(x1 - x0, 0) * tile_size, 3), dtype=np.uint8
+    )
+    agent = tuple(int(v) for v in agent_pos) if agent_pos is not None else None
+    for j in range(y0, y1):
+        ymin = (j - y0) * tile_size
+        for i in range(x0, x1):
+            xmin = (i - x0) * tile_size
+            img[ymin : ymin + tile_size, xmin : xmin + tile_size, :] = TILE_ATLAS.tile(
+                grid.get(i, j),
+                agent_dir=agent_dir if agent == (i, j) else None,
+                tile_size=tile_size,
+            )
+    return img
+
+
 class CameraStrategy(ABC):
-    """Abstract base class for different camera behaviors."""
+    """
+    Abstract base class for different camera behaviors.
+
+    ``get_window`` places the camera and returns the tiles in view;
+    ``get_crop`` renders them. ``get_crop`` takes an optional
+    ``framebuffer`` (a TileFramebuffer): the crop is then a view into its
+    full-map image, which only redraws changed tiles, instead of a freshly
+    drawn window. It also takes an optional ``gather`` (a GatherRenderer),
+    which draws the window's encoded cells with a single NumPy gather, and
+    an optional ``screen_size``, which replaces ``tile_size`` with the
+    largest tile size that fits the view on that screen.
+    """
 
     @abstractmethod
-    def get_crop(self, grid, agent_pos, agent_dir, **kwargs) -> np.ndarray:
-        """Return a cropped view of the grid."""
+    def get_window(self, grid, agent_pos, agent_dir, **kwargs):
+        """Return the (top_x, top_y, width, height) tiles in view."""
         pass
 
+    def get_crop(
+        self,
+        grid,
+        agent_pos,
+        agent_dir,
+        framebuffer=None,
+        gather=None,
+        screen_size=None,
+        **kwargs,
+    ) -> np.ndarray:
+        """Return a cropped view of the grid."""
+        window = self.get_window(grid, agent_pos, agent_dir, **kwargs)
+        tile_size = self.tile_size
+        if screen_size is not None:
+            tile_size = fit_tile_size(window[2:], screen_size)
+        return self._crop(
+            grid, tile_size, agent_pos, agent_dir, *window, framebuffer, gather
+        )
+
+    @staticmethod
+    def _crop(
+        grid,
+        tile_size,
+        agent_pos,
+        agent_dir,
+        top_x,
+        top_y,
+        width,
+        height,
+        framebuffer=None,
+        gather=None,
+    ):
+        if gather is not None:
+            codes = window_codes(grid, top_x, top_y, width, height)
+            return gather.render(
+                codes,
+                tile_size,
+                (agent_pos[0] - max(top_x, 0), agent_pos[1] - max(top_y, 0)),
+                agent_dir,
+            )
+        if framebuffer is None:
+            # Draw only the tiles in view
+            return render_window(
+                grid, tile_size, agent_pos, agent_dir, top_x, top_y, width, height
+            )
+        img = framebuffer.render(grid, tile_size, agent_pos, agent_dir)
+        return img[
+            top_y * tile_size : (top_y + height) * tile_size,
+            top_x * tile_size : (top_x + width) * tile_size,
+            :,
+        ]
+
 
 class FullviewCamera(CameraStrategy):
     def __init__(self, tile_size=32):
         self.tile_size = tile_size
 
-    def get_crop(self, grid, agent_pos, agent_dir, **kwargs):
-        full_img = grid.render(
-            self.tile_size, agent_pos, agent_dir, highlight_mask=None
-        )
+    def get_window(self, grid, agent_pos, agent_dir, **kwargs):
+        return 0, 0, grid.width, grid.height
+
+    def get_crop(
+        self,
+        grid,
+        agent_pos,
+        agent_dir,
+        framebuffer=None,
+        gather=None,
+        screen_size=None,
+        **kwargs,
+    ):
+        tile_size = self.tile_size
+        if screen_size is not None:
+            tile_size = fit_tile_size((grid.width, grid.height), screen_size)
+        if gather is not None:
+            window = self.get_window(grid, agent_pos, agent_dir)
+            return self._crop(
+                grid, tile_size, agent_pos, agent_dir, *window, gather=gather
+            )
+        if framebuffer is not None:
+            return framebuffer.render(grid, tile_size, agent_pos, agent_dir)
+        full_img = grid.render(tile_size, agent_pos, agent_dir, highlight_mask=None)
         return full_img
 
 
@@ -41,8 +175,8 @@ class AgentCenteredCamera(CameraStrategy):
         self.extra_tiles = extra_tiles
         self.tile_size = tile_size
 
-    def get_crop(self, grid, agent_pos, agent_dir, room=None, **kwargs) -> np.ndarray:
-        """Get a crop centered on the agent's current room."""
+    def get_window(self, grid, agent_pos, agent_dir, room=None, **kwargs):
+        """Get a window centered on the agent's current room."""
         agent_x, agent_y = agent_pos
         room_w, room_h = room.size
 
@@ -55,16 +189,7 @@ class AgentCenteredCamera(CameraStrategy):
         top_x = max(0, min(top_x, grid.width - width_tiles))
         top_y = max(0, min(top_y, grid.height - height_tiles))
 
-        bot_x = top_x + width_tiles
-        bot_y = top_y + height_tiles
-
-        px_min, px_max = top_x * self.tile_size, bot_x * self.tile_size
-        py_min, py_max = top_y * self.tile_size, bot_y * self.tile_size
-
-        full_img = grid.render(
-            self.tile_size, agent_pos, agent_dir, highlight_mask=None
-        )
-        return full_img[py_min:py_max, px_min:px_max, :]
+        return top_x, top_y, width_tiles, height_tiles
 
 
 class EdgeFollowCamera(CameraStrategy):
@@ -76,6 +201,10 @@ class EdgeFollowCamera(CameraStrategy):
         self.top_y = 0
         self.initialized = False
 
+    @property
+    def tile_size(self):
+        return self.config.tile_size
+
     def _initialize(self, agent_x, agent_y):
         """Initialize camera position."""
         view_w, view_h = self.config.view_tiles
@@ -112,26 +241,15 @@ class EdgeFollowCamera(CameraStrategy):
         self.top_x = max(0, min(self.top_x, grid_width - view_w))
         self.top_y = max(0, min(self.top_y, grid_height - view_h))
 
-    def get_crop(
+    def get_window(
         self, grid, agent_pos, agent_dir, grid_width=None, grid_height=None, **kwargs
-    ) -> np.ndarray:
-        """Get a crop that follows the agent with edge-following behavior."""
+    ):
+        """Get a window that follows the agent with edge-following behavior."""
         agent_x, agent_y = agent_pos
         self._update_position(agent_x, agent_y, grid_width, grid_height)
 
         view_w, view_h = self.config.view_tiles
-        tile_size = self.config.tile_size
-
-        # Render full grid
-        full_img = grid.render(tile_size, agent_pos, agent_dir, highlight_mask=None)
-
-        # Calculate pixel boundaries
-        px_min = self.top_x * tile_size
-        px_max = (self.top_x + view_w) * tile_size
-        py_min = self.top_y * tile_size
-        py_max = (self.top_y + view_h) * tile_size
-
-        return full_img[py_min:py_max, px_min:px_max, :]
+        return self.top_x, self.top_y, view_w, view_h
 
     def reset(self):
         """Reset camera state."""
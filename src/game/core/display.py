@@ -0,0 +1,57 @@
+import numpy as np
+
+
+class FrameBlitter:
+    """
+    Copies frames into a fixed area of a pygame Surface.
+
+    Frames that fit the area are written with ``surfarray.blit_array``
+    through a subsurface view, centred, with no transpose copy, intermediate
+    Surface or scaling; render them at a tile size from ``fit_tile_size``
+    so they land on the area. Frames that do not fit are smoothscaled into
+    the area as before. The subsurfaces are made once per frame shape.
+    """
+
+    def __init__(self, surface, size=None, offset=(0, 0)):
+        """
+        Create a blitter drawing into part of a surface.
+
+        Args:
+            surface: pygame Surface to draw into (e.g. the display)
+            size: (width, height) of the area in pixels (default: the
+                whole surface)
+            offset: (x, y) of the area's top-left corner
+        """
+        self.surface = surface
+        self.size = tuple(size or surface.get_size())
+        self.area = surface.subsurface((offset, self.size))
+        self._views = {}
+        self._shape = None
+
+    def blit(self, frame):
+        """
+        Draw a (height, width, 3) uint8 frame into the area.
+
+        Returns:
+            pygame.Surface: The area that was drawn into
+        """
+        import pygame
+
+        height, width = frame.shape[:2]
+        area_w, area_h = self.size
+        if width > area_w or height > area_h:
+            self._shape = None
+            surface = pygame.surfarray.make_surface(np.transpose(frame, (1, 0, 2)))
+            return pygame.transform.smoothscale(surface, self.size, self.area)
+
+        view = self._views.get((width, height))
+        if view is None:
+            left, top = (area_w - width) // 2, (area_h - height) // 2
+            view = self.area.subsurface((left, top, width, height))
+            self._views[width, height] = view
+        if self._shape != (width, height):
+            # Clear the border left around a frame smaller than the area
+            self.area.fill((0, 0, 0))
+            self._shape = (width, height)
+        pygame.surfarray.blit_array(view, frame.swapaxes(0, 1))
+        return self.area
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import numpy as np
-import pygame
 from minigrid.core.mission import MissionSpace
 from minigrid.minigrid_env import MiniGridEnv
 
+from .camera import fit_tile_size
+from .display import FrameBlitter
+from .framebuffer import TileFramebuffer
+from .state import StateMixin
 
-class SAREnv(MiniGridEnv):
+
+class SAREnv(StateMixin, MiniGridEnv):
     def __init__(
         self,
         grid_size=10,
@@ -14,7 +18,9 @@ class SAREnv(MiniGridEnv):
         agent_start_pos=(1, 1),
         agent_start_dir=0,
         window=None,
+        fullscreen=False,
         max_steps: int | None = None,
+        framebuffer=False,
         **kwargs,
     ):
         self.agent_start_pos = agent_start_pos
@@ -32,53 +38,97 @@ class SAREnv(MiniGridEnv):
             **kwargs,
         )
         self.window = window
+        self.fullscreen = fullscreen
         self.screen_size = screen_size
+        # Copies "human" frames into the window (see render)
+        self._blitter = None
+        # Persistent full-map image that redraws only changed tiles
+        self.framebuffer = TileFramebuffer() if framebuffer else None
 
     @staticmethod
     def _gen_mission():
         return "grand mission"
 
-    def render(self):
-        # Set the desired resolution (higher than tile_size-based resolution)
-        render_resolution = (
-            self.screen_size
-        )  # Could be user-defined or a constant like 1024
+    def get_full_render(self, highlight, tile_size):
+        """
+        ``MiniGridEnv.get_full_render``, drawn into the framebuffer when the
+        env keeps one. The frame is then the buffer itself.
+        """
+        if self.framebuffer is None:
+            return super().get_full_render(highlight, tile_size)
+        return self.framebuffer.render(
+            self.grid,
+            tile_size,
+            self.agent_pos,
+            self.agent_dir,
+            highlight_mask=self._highlight_mask() if highlight else None,
+        )
 
-        # Get the base image (e.g. from the environment)
-        frame = self.get_frame(
-            self.highlight, self.tile_size, self.agent_pov
-        )  # shape: (H, W, C)
+    def _highlight_mask(self):
+        """Cells the agent sees, as highlighted by ``get_full_render``."""
+        _, vis_mask = self.gen_obs_grid()
+        f_vec, r_vec = self.dir_vec, self.right_vec
+        size = self.agent_view_size
+        top_left = (
+            np.asarray(self.agent_pos) + f_vec * (size - 1) - r_vec * (size // 2)
+        )
+        vis_i, vis_j = np.nonzero(vis_mask)
+        abs_i = top_left[0] - f_vec[0] * vis_j + r_vec[0] * vis_i
+        abs_j = top_left[1] - f_vec[1] * vis_j + r_vec[1] * vis_i
+        inside = (abs_i >= 0) & (abs_i < self.width)
+        inside &= (abs_j >= 0) & (abs_j < self.height)
+
+        highlight_mask = np.zeros((self.width, self.height), dtype=bool)
+        highlight_mask[abs_i[inside], abs_j[inside]] = True
+        return highlight_mask
+
+    def get_screen_frame(self, screen_size):
+        """
+        ``get_frame`` at the largest tile size that fits the frame on a
+        (width, height) screen, so it can be shown without rescaling.
+        """
+        if self.agent_pov:
+            view = (self.agent_view_size, self.agent_view_size)
+        else:
+            view = (self.width, self.height)
+        return self.get_frame(
+            self.highlight, fit_tile_size(view, screen_size), self.agent_pov
+        )
 
+    def render(self):
+        """
+        Render the environment.
+
+        In "human" mode the frame is drawn at the tile size that fits it on
+        the screen and copied straight into the window, instead of being
+        smoothscaled from ``tile_size`` every frame.
+        """
         if self.render_mode == "rgb_array":
-            return frame
+            return self.get_frame(self.highlight, self.tile_size, self.agent_pov)
 
         elif self.render_mode == "human":
-            # Transpose to match Pygame's (width, height) format
-            frame = np.transpose(frame, (1, 0, 2))  # (W, H, C)
+            import pygame
+
+            screen = (self.screen_size, self.screen_size)
 
             # Initialize rendering window once
             if self.window is None:
                 pygame.init()
                 pygame.display.init()
-                self.window = pygame.display.set_mode(
-                    (render_resolution, render_resolution)
-                )
+                if self.fullscreen:
+                    self.window = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+                else:
+                    self.window = pygame.display.set_mode(screen)
                 pygame.display.set_caption("minigrid")
+            if self._blitter is None or self._blitter.surface is not self.window:
+                self._blitter = FrameBlitter(self.window, screen)
 
             # Initialize clock
             if self.clock is None:
                 self.clock = pygame.time.Clock()
 
-            # Convert frame to Pygame surface
-            surface = pygame.surfarray.make_surface(frame)
-
-            # High-resolution scaling
-            upscale_surface = pygame.transform.smoothscale(
-                surface, (render_resolution, render_resolution)
-            )
+            self._blitter.blit(self.get_screen_frame(screen))
 
-            # Blit and update display
-            self.window.blit(upscale_surface, (0, 0))
             pygame.display.flip()
             pygame.event.pump()
             self.clock.tick(self.metadata.get("render_fps", 30))
@@ -0,0 +1,110 @@
+import numpy as np
+
+from .atlas import TILE_ATLAS
+
+
+class TileFramebuffer:
+    """
+    Full-map image kept between frames, redrawing only the tiles that
+    changed.
+
+    ``render`` returns the same image as ``grid.render`` with the same
+    arguments, but after the first frame it only redraws cells whose object
+    or state changed, the agent's old and new cells and cells whose
+    highlight flipped. Changes are found from the grid's ``dirty`` set when
+    it keeps one (SARGrid, which records every ``set`` and ``refresh``),
+    and otherwise by comparing ``grid.encode()`` with the last frame's. A
+    new grid, a new tile size or a grid that dropped its ``dirty`` set
+    (e.g. after ``set_state``) is redrawn in full.
+
+    The returned image is the buffer itself, so it changes with the next
+    call; copy it to keep a frame.
+    """
+
+    def __init__(self):
+        self.img = None
+        self.grid = None
+        self.tile_size = None
+        self._encoding = None
+        self._agent = None
+        self._highlight = None
+        # Tiles drawn by the last render
+        self.redrawn = 0
+
+    def invalidate(self):
+        """Redraw everything on the next render."""
+        self.grid = None
+
+    def render(self, grid, tile_size, agent_pos, agent_dir, highlight_mask=None):
+        """
+        Bring the buffer up to date with the grid and return it.
+
+        Args:
+            grid: Grid to render
+            tile_size: Tile size in pixels
+            agent_pos: Agent position
+            agent_dir: Agent direction
+            highlight_mask: Optional (width, height) bool array of cells to
+                highlight, as for ``grid.render``
+
+        Returns:
+            np.ndarray: (height * tile_size, width * tile_size, 3) image
+        """
+        agent_pos = None if agent_pos is None else tuple(int(v) for v in agent_pos)
+        agent = (agent_pos, agent_dir)
+        if highlight_mask is None:
+            highlight_mask = np.zeros((grid.width, grid.height), dtype=bool)
+        tracked = hasattr(grid, "dirty")
+
+        if (
+            grid is not self.grid
+            or tile_size != self.tile_size
+            or (tracked and grid.dirty is None)
+        ):
+            self.grid = grid
+            self.tile_size = tile_size
+            self.img = np.zeros(
+                (grid.height * tile_size, grid.width * tile_size, 3), dtype=np.uint8
+            )
+            if tracked:
+                grid.dirty = set()
+            else:
+                self._encoding = grid.encode()
+            cells = [(i, j) for j in range(grid.height) for i in range(grid.width)]
+        else:
+            if tracked:
+                changed = grid.dirty
+                grid.dirty = set()
+            else:
+                encoding = grid.encode()
+                diff = np.argwhere((encoding != self._encoding).any(axis=2))
+                changed = set(map(tuple, diff.tolist()))
+                self._encoding = encoding
+            if agent != self._agent:
+                changed.update(
+                    pos for pos in (self._agent[0], agent_pos) if pos is not None
+                )
+            flipped = np.argwhere(highlight_mask != self._highlight)
+            changed.update(map(tuple, flipped.tolist()))
+            cells = changed
+
+        self._agent = agent
+        self._highlight = highlight_mask.copy()
+        for i, j in cells:
+            self._draw(i, j)
+        self.redrawn = len(cells)
+        return self.img
+
+    def _draw(self, i, j):
+        grid, tile_size = self.grid, self.tile_size
+        if not (0 <= i < grid.width and 0 <= j < grid.height):
+            return
+        agent_pos, agent_dir = self._agent
+        tile = TILE_ATLAS.tile(
+            grid.get(i, j),
+            agent_dir=agent_dir if agent_pos == (i, j) else None,
+            highlight=bool(self._highlight[i, j]),
+            tile_size=tile_size,
+        )
+        ymin, xmin = j * tile_size, i * tile_size
+        self.img[ymin : ymin + tile_size, xmin : xmin + tile_size, :] = tile
@@ -1,11 +1,14 @@
 import numpy as np
-import pygame
 from minigrid.envs.babyai.core.levelgen import LevelGen
 
 from .camera import CameraStrategy, EdgeFollowCamera
+from .display import FrameBlitter
+from .framebuffer import TileFramebuffer
+from .gather import GatherRenderer
+from .state import StateMixin
 
 
-class SARLevelGen(LevelGen):
+class SARLevelGen(StateMixin, LevelGen):
     """Search and Rescue level generator with pluggable camera system."""
 
     def __init__(
@@ -22,11 +25,10 @@ class SARLevelGen(LevelGen):
         instr_kinds=["action", "and", "seq"],
         window=None,
         camera_strategy=None,
+        framebuffer=False,
+        gather=False,
         **kwargs,
     ):
-        if window is None:
-            self.window = pygame.display.set_mode([800, 800])
-
         super().__init__(
             room_size,
             num_rows,
@@ -41,8 +43,19 @@ class SARLevelGen(LevelGen):
             **kwargs,
         )
 
+        # No display is opened here; render() creates one on demand in
+        # "human" mode, so headless and rgb_array envs never touch SDL
+        self.window = window
+        # Copies "human" frames into the window (see render)
+        self._blitter = None
+
         # Use strategy pattern for camera
         self.camera = camera_strategy or EdgeFollowCamera()
+        # Persistent full-map image that redraws only changed tiles; camera
+        # views are then slices of it
+        self.framebuffer = TileFramebuffer() if framebuffer else None
+        # Draw camera views from the encoded cells with one NumPy gather
+        self.gather = GatherRenderer() if gather else None
         self.saved_victims = 0
 
     def gen_mission(self):
@@ -67,44 +80,64 @@ class SARLevelGen(LevelGen):
             instr_kinds=self.instr_kinds,
         )
 
-    def get_camera_view(self, **kwargs) -> np.ndarray:
-        """Get current camera view using the configured strategy."""
-        room = self.room_from_pos(*self.agent_pos)
-        return self.camera.get_crop(
+    def _camera_kwargs(self):
+        return dict(
             grid=self.grid,
             agent_pos=self.agent_pos,
             agent_dir=self.agent_dir,
-            room=room,
+            room=self.room_from_pos(*self.agent_pos),
             grid_width=self.width,
             grid_height=self.height,
+        )
+
+    def get_camera_view(self, **kwargs) -> np.ndarray:
+        """Get current camera view using the configured strategy."""
+        return self.camera.get_crop(
+            framebuffer=self.framebuffer,
+            gather=self.gather,
+            **self._camera_kwargs(),
             **kwargs,
         )
 
+    def get_screen_frame(self, screen_size):
+        """
+        Camera view at the largest tile size that fits it on a (width,
+        height) screen, so it can be shown without rescaling.
+        """
+        return self.get_camera_view(screen_size=screen_size)
+
+    def get_camera_window(self):
+        """
+        Move the camera as ``get_camera_view`` would and return the
+        (top_x, top_y, width, height) tiles in view, without drawing them.
+        """
+        return self.camera.get_window(**self._camera_kwargs())
+
     def render(self):
-        """Render the environment."""
-        img = self.get_camera_view()
+        """
+        Render the environment.
 
+        In "human" mode the view is drawn at the tile size that fits it on
+        the screen and copied straight into the window, instead of being
+        smoothscaled from the camera's tile size every frame.
+        """
         if self.render_mode == "human":
-            img = np.transpose(img, axes=(1, 0, 2))
+            import pygame
 
+            screen = (self.screen_size, self.screen_size)
             if self.window is None:
                 pygame.init()
                 pygame.display.init()
-                self.window = pygame.display.set_mode(
-                    (self.screen_size, self.screen_size)
-                )
-
-            surf = pygame.surfarray.make_surface(img)
-            surf = pygame.transform.smoothscale(
-                surf, (self.screen_size, self.screen_size)
-            )
+                self.window = pygame.display.set_mode(screen)
+            if self._blitter is None or self._blitter.surface is not self.window:
+                self._blitter = FrameBlitter(self.window, screen)
 
-            self.window.blit(surf, (0, 0))
+            self._blitter.blit(self.get_screen_frame(screen))
             pygame.event.pump()
             pygame.display.flip()
 
         elif self.render_mode == "rgb_array":
-            return img
+            return self.get_camera_view()
 
     def switch_camera(self, camera_strategy: CameraStrategy):
         """Switch to a different camera strategy at runtime."""
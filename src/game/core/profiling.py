@@ -0,0 +1,216 @@
+import sys
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+
+
+class PhaseProfiler:
+    """
+    Opt-in wall-time profiler for the phases of an episode.
+
+    ``attach(env)`` wraps the instance's methods (reset, step, gen_mission,
+    check_objs_reachable, gen_obs, render, ...) so that each call is timed
+    under a phase name. Nothing is wrapped unless a profiler is attached, so a
+    disabled profiler costs nothing. Phases nest: the time of ``gen_obs`` is
+    also included in the ``step`` that called it.
+
+    ``gen_mission`` is called once per generation attempt, so its count minus
+    the ``reset`` count is the number of rejected layouts.
+    """
+
+    # Phase name -> env method timed under it
+    ENV_PHASES = {
+        "reset": "reset",
+        "step": "step",
+        "gen_mission": "gen_mission",
+        "check_objs_reachable": "check_objs_reachable",
+        "gen_obs": "gen_obs",
+        "render": "render",
+        "camera": "get_camera_view",
+    }
+
+    # Phase name -> (env attribute holding the object, method name)
+    _OWNED_PHASES = {
+        "rescue": ("resuce_action", "execute"),
+        "verify": ("instrs", "verify"),
+        "engine_gen_obs": ("engine", "gen_obs"),
+    }
+
+    def __init__(self, max_samples=10000, dump_interval=None, stream=None):
+        """
+        Args:
+            max_samples: Recent samples kept per phase for percentiles
+            dump_interval: Seconds between automatic reports, or None
+            stream: Where reports are written (default: stderr)
+        """
+        self.max_samples = max_samples
+        self.dump_interval = dump_interval
+        self.stream = stream
+        self._next_dump = None
+        self.reset()
+
+    def reset(self):
+        """Discard all recorded timings."""
+        self.counts = {}
+        self.totals = {}
+        self.samples = {}
+        if self.dump_interval is not None:
+            self._next_dump = time.perf_counter() + self.dump_interval
+
+    # Recording -------------------------------------------------------------
+
+    def record(self, name, seconds):
+        """Add one timing sample for a phase."""
+        if name not in self.counts:
+            self.counts[name] = 0
+            self.totals[name] = 0.0
+            self.samples[name] = deque(maxlen=self.max_samples)
+        self.counts[name] += 1
+        self.totals[name] += seconds
+        self.samples[name].append(seconds)
+
+    @contextmanager
+    def phase(self, name):
+        """Time a block of code as a phase, e.g. ``with profiler.phase("ui"):``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def wrap(self, name, func):
+        """Return ``func`` timed under the phase ``name``."""
+        record = self.record
+        clock = time.perf_counter
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(name, clock() - start)
+
+        timed.__wrapped__ = func
+        return timed
+
+    # Attaching to environments ---------------------------------------------
+
+    def attach(self, env):
+        """
+        Instrument an environment instance.
+
+        Args:
+            env: PickupVictimEnv, SARLevelGen or SAREnv instance
+
+        Returns:
+            The env, for chaining
+        """
+        if getattr(env, "profiler", None) is self:
+            return env
+        env.profiler = self
+
+        for name, method in self.ENV_PHASES.items():
+            if name == "step":
+                continue
+            if hasattr(env, method):
+                setattr(env, method, self.wrap(name, getattr(env, method)))
+
+        # step also drives the periodic dump
+        step = self.wrap("step", env.step)
+
+        def instrumented_step(action):
+            # Generating, loading or mutating a level replaces instrs (and
+            # may replace the other owned objects), so check before each step
+            self._wrap_owned(env)
+            result = step(action)
+            if self._next_dump is not None and time.perf_counter() >= self._next_dump:
+                self.dump()
+            return result
+
+        env.step = instrumented_step
+        self._wrap_owned(env)
+        return env
+
+    def _wrap_owned(self, env):
+        for name, (attr, method) in self._OWNED_PHASES.items():
+            owner = getattr(env, attr, None)
+            if owner is None or not hasattr(owner, method):
+                continue
+            func = getattr(owner, method)
+            if not hasattr(func, "__wrapped__"):
+                setattr(owner, method, self.wrap(name, func))
+
+    def detach(self, env):
+        """Remove the instrumentation added by ``attach``."""
+        if getattr(env, "profiler", None) is not self:
+            return
+        for method in self.ENV_PHASES.values():
+            env.__dict__.pop(method, None)
+        for attr, method in self._OWNED_PHASES.values():
+            owner = getattr(env, attr, None)
+            if owner is not None:
+                owner.__dict__.pop(method, None)
+        env.profiler = None
+
+    def merge(self, other):
+        """Add another profiler's timings to this one."""
+        for name, count in other.counts.items():
+            if name not in self.counts:
+                self.counts[name] = 0
+                self.totals[name] = 0.0
+                self.samples[name] = deque(maxlen=self.max_samples)
+            self.counts[name] += count
+            self.totals[name] += other.totals[name]
+            self.samples[name].extend(other.samples[name])
+        return self
+
+    # Aggregates ------------------------------------------------------------
+
+    def stats(self, names=None):
+        """
+        Aggregate timings per phase.
+
+        Args:
+            names: Phases to include (default: all recorded phases)
+
+        Returns:
+            dict: phase -> {"count", "total", "mean", "p50", "p99"}, in seconds;
+            percentiles are over the most recent ``max_samples`` calls
+        """
+        result = {}
+        for name in self.counts if names is None else names:
+            count = self.counts.get(name)
+            if not count:
+                continue
+            p50, p99 = np.percentile(np.fromiter(self.samples[name], float), [50, 99])
+            result[name] = {
+                "count": count,
+                "total": self.totals[name],
+                "mean": self.totals[name] / count,
+                "p50": float(p50),
+                "p99": float(p99),
+            }
+        return result
+
+    def report(self):
+        """Format ``stats()`` as a table in milliseconds, slowest total first."""
+        stats = self.stats()
+        lines = [
+            f"{'phase':<22} {'count':>8} {'total ms':>10} {'p50 ms':>9} {'p99 ms':>9}"
+        ]
+        for name, s in sorted(stats.items(), key=lambda item: -item[1]["total"]):
+            lines.append(
+                f"{name:<22} {s['count']:>8} {s['total'] * 1e3:>10.1f} "
+                f"{s['p50'] * 1e3:>9.3f} {s['p99'] * 1e3:>9.3f}"
+            )
+        return "\n".join(lines)
+
+    def dump(self):
+        """Write the report to the stream and schedule the next dump."""
+        stream = self.stream or sys.stderr
+        stream.write(self.report() + "\n")
+        stream.flush()
+        if self.dump_interval is not None:
+            self._next_dump = time.perf_counter() + self.dump_interval
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from typing import Any, NamedTuple
+
+import numpy as np
+from minigrid.core.world_object import Door
+
+
+class EnvState(NamedTuple):
+    """
+    Immutable snapshot of an environment's dynamic state.
+
+    Grid cells are stored as a tuple of references to the (shared) world
+    objects; the object attributes that change during an episode, door
+    open/locked flags and the positions of objects that can be carried, are
+    recorded separately and written back on restore. The level structure
+    (rooms, instructions, mission, time limit) is captured too, so a
+    snapshot also restores into an env that has been reset since.
+    """
+
+    grid_type: type
+    width: int
+    height: int
+    cells: tuple
+    doors: tuple
+    grid_state: Any
+    agent_pos: tuple
+    agent_dir: int
+    carrying: Any
+    step_count: int
+    rng_state: Any
+    attrs: tuple
+    movables: tuple
+    level: tuple
+    rooms: tuple
+
+
+# Mask of the low 64 bits of PCG64's 128-bit words
+_WORD = (1 << 64) - 1
+
+
+def encode_rng_state(rng):
+    """
+    State of a PCG64 Generator (as used by gymnasium) as six uint64 words.
+
+    Returns:
+        np.ndarray: state and increment (high and low words each), then
+        ``has_uint32`` and ``uinteger``
+    """
+    state = rng.bit_generator.state
+    if state["bit_generator"] != "PCG64":
+        raise ValueError(f"Cannot store {state['bit_generator']} RNG states")
+    words = []
+    for name in ("state", "inc"):
+        value = state["state"][name]
+        words += [value >> 64, value & _WORD]
+    words += [state["has_uint32"], state["uinteger"]]
+    return np.array(words, dtype=np.uint64)
+
+
+def decode_rng_state(words):
+    """``bit_generator.state`` dict of words from ``encode_rng_state``."""
+    state_hi, state_lo, inc_hi, inc_lo, has_uint32, uinteger = (
+        int(w) for w in words
+    )
+    return {
+        "bit_generator": "PCG64",
+        "state": {"state": state_hi << 64 | state_lo, "inc": inc_hi << 64 | inc_lo},
+        "has_uint32": has_uint32,
+        "uinteger": uinteger,
+    }
+
+
+def _pos(obj):
+    return None if obj.cur_pos is None else tuple(int(v) for v in obj.cur_pos)
+
+
+class StateMixin:
+    """
+    Adds ``get_state``/``set_state`` to MiniGrid environments.
+
+    Snapshots are cheap enough to branch tree search or counterfactual
+    rollouts from any state, instead of ``copy.deepcopy`` of the whole env
+    (window, camera, mission instructions and every ``WorldObj``).
+    Subclasses list extra per-episode attributes in ``STATE_ATTRS`` and the
+    attributes set when a level is generated in ``LEVEL_ATTRS``.
+    """
+
+    # Extra scalar attributes saved and restored with the state
+    STATE_ATTRS = ()
+    # Attributes replaced (not mutated) by each reset, saved by reference
+    LEVEL_ATTRS = ("mission", "max_steps")
+
+    def get_state(self):
+        """
+        Capture the current state of the episode.
+
+        Returns:
+            EnvState: Snapshot that can be passed to ``set_state``
+        """
+        grid = self.grid
+        cells = tuple(grid.grid)
+        # Objects that can be carried are the only ones that move
+        carrying = self.carrying
+        movables = () if carrying is None else ((carrying, _pos(carrying)),)
+        if hasattr(grid, "get_state"):
+            grid_state = grid.get_state()
+            doors = ()
+        else:
+            grid_state = None
+            doors = tuple(
+                (obj, obj.is_open, obj.is_locked)
+                for obj in cells
+                if isinstance(obj, Door)
+            )
+            movables += tuple(
+                (obj, _pos(obj))
+                for obj in cells
+                if obj is not None and obj.can_pickup()
+            )
+
+        # RoomGrid levels: doors, locks and objects of each room
+        rooms = ()
+        if getattr(self, "room_grid", None) is not None:
+            rooms = tuple(
+                (
+                    room,
+                    room.locked,
+                    tuple(room.objs),
+                    tuple(room.doors),
+                    tuple(room.door_pos),
+                )
+                for row in self.room_grid
+                for room in row
+            )
+
+        rng = self._np_random
+        return EnvState(
+            type(grid),
+            grid.width,
+            grid.height,
+            cells,
+            doors,
+            grid_state,
+            tuple(int(v) for v in self.agent_pos),
+            self.agent_dir,
+            self.carrying,
+            self.step_count,
+            None if rng is None else rng.bit_generator.state,
+            tuple(getattr(self, name) for name in self.STATE_ATTRS),
+            movables,
+            tuple(getattr(self, name, None) for name in self.LEVEL_ATTRS),
+            rooms,
+        )
+
+    def set_state(self, state):
+        """
+        Restore a snapshot taken with ``get_state``.
+
+        Args:
+            state: EnvState to restore
+        """
+        grid = self.grid
+        if type(grid) is not state.grid_type or (grid.width, grid.height) != (
+            state.width,
+            state.height,
+        ):
+            grid = self.grid = state.grid_type(state.width, state.height)
+        grid.grid[:] = state.cells
+
+        if state.grid_state is not None:
+            grid.set_state(state.grid_state)
+        for door, is_open, is_locked in state.doors:
+            door.is_open = is_open
+            door.is_locked = is_locked
+
+        self.agent_pos = state.agent_pos
+        self.agent_dir = state.agent_dir
+        self.carrying = state.carrying
+        self.step_count = state.step_count
+        if state.rng_state is not None:
+            self.np_random.bit_generator.state = state.rng_state
+        for name, value in zip(self.STATE_ATTRS, state.attrs):
+            setattr(self, name, value)
+
+        for obj, pos in state.movables:
+            obj.cur_pos = pos
+        for name, value in zip(self.LEVEL_ATTRS, state.level):
+            setattr(self, name, value)
+        for room, locked, objs, doors, door_pos in state.rooms:
+            room.locked = locked
+            room.objs = list(objs)
+            room.doors = list(doors)
+            room.door_pos = list(door_pos)
+
+
@@ -92,6 +92,15 @@ class InfoPanel:
             anchors={"top": "top", "top_target": self.steps_label},
         )
 
+        # Frame-time breakdown, only filled in when profiling
+        self.timing_label = UILabel(
+            relative_rect=pygame.Rect(PADDING_X, 20, content_width, 30),
+            text="",
+            manager=manager,
+            container=self.panel,
+            anchors={"top": "top", "top_target": self.inventory_label},
+        )
+
         # Status message (anchored to bottom)
         self.status_label = UILabel(
             relative_rect=pygame.Rect(PADDING_X, -50, content_width, 40),
@@ -161,3 +170,13 @@ class InfoPanel:
         self._update_victims_section(mission_status)
         self._update_time_and_inventory(env)
         self._update_status(mission_status)
+
+    def render_timings(self, profiler):
+        """Show median frame-time breakdown from a PhaseProfiler."""
+        stats = profiler.stats(["events", "frame", "ui"])
+        parts = [
+            f"{name} {stats[name]['p50'] * 1e3:.1f}"
+            for name in ("events", "frame", "ui")
+            if name in stats
+        ]
+        self.timing_label.set_text("ms: " + " / ".join(parts))
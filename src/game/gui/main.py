@@ -1,17 +1,32 @@
-import numpy as np
+from contextlib import nullcontext
+
 import pygame
 import pygame_gui
 
+from ..core.display import FrameBlitter
 from .chat import ChatPanel
 from .info import InfoPanel
 from .user import User
 
-pygame.init()
-
 
 class SAREnvGUI:
-    def __init__(self, env, fullscreen=False):
+    # Frames between refreshes of the frame-time breakdown
+    TIMING_REFRESH_FRAMES = 30
+    # Frame rate cap of the GUI loop
+    FPS = 60
+
+    def __init__(self, env, fullscreen=False, profiler=None):
+        # Initialise pygame here rather than at import time, so importing the
+        # GUI module (or the package) does not start SDL
+        pygame.init()
+
         self.user = User(env)
+
+        # Optional PhaseProfiler: times env phases and the GUI loop
+        self.profiler = profiler
+        self.frame_count = 0
+        if profiler is not None:
+            profiler.attach(env)
         self.env_size = self.user.env.screen_size
 
         self.panel_width = 375
@@ -30,6 +45,14 @@ class SAREnvGUI:
                 self.window = pygame.display.set_mode(self.window_size, display_flags)
                 self.screen_size = self.window_size
 
+        # Surfaces reused every frame: the game and panels are drawn into
+        # the combined surface, which is scaled into scaled_surface when the
+        # screen is not the window size
+        self.combined_surface = pygame.Surface(self.window_size, pygame.SRCALPHA)
+        self.game_blitter = FrameBlitter(
+            self.combined_surface, (self.env_size, self.env_size)
+        )
+
         # Calculate offsets to center the game content
         self._calculate_offsets()
 
@@ -77,6 +100,12 @@ class SAREnvGUI:
         self.offset_x = (self.screen_size[0] - self.scaled_width) // 2
         self.offset_y = (self.screen_size[1] - self.scaled_height) // 2
 
+        self.scaled_surface = None
+        if self.scale != 1.0:
+            self.scaled_surface = pygame.Surface(
+                (self.scaled_width, self.scaled_height), pygame.SRCALPHA
+            )
+
     def _init_window(self):
         """Initialize the Pygame window if it isn't already initialized."""
         if self.window is None:
@@ -89,32 +118,34 @@ class SAREnvGUI:
         # Fill the screen with black (for fullscreen centering)
         self.window.fill((0, 0, 0))
 
-        # Create a combined surface for game + UI
-        combined_surface = pygame.Surface(self.window_size, pygame.SRCALPHA)
-
-        # Get the environment frame and render it in Pygame
-        frame = np.transpose(frame, (1, 0, 2))  # (W, H, C)
-        game_surface = pygame.surfarray.make_surface(frame)
-        game_surface = pygame.transform.smoothscale(
-            game_surface, (self.user.env.screen_size, self.user.env.screen_size)
-        )
-
-        # Blit the game surface to the combined surface
-        combined_surface.blit(game_surface, (0, 0))
+        # Copy the environment frame into the game area of the combined
+        # surface (frames from get_frame(screen_size) need no scaling)
+        combined_surface = self.combined_surface
+        self.game_blitter.blit(frame)
+        # The panels are drawn afresh below
+        panel_rect = (self.env_size, 0, self.panel_width, self.env_size)
+        combined_surface.fill((0, 0, 0, 0), panel_rect)
 
         # Update panel data (pygame_gui handles drawing)
         self.info_panel.render(self.user.env)
+        if (
+            self.profiler is not None
+            and self.frame_count % self.TIMING_REFRESH_FRAMES == 0
+        ):
+            self.info_panel.render_timings(self.profiler)
         self.chat_panel.render()
 
         # Update and draw the UI manager on the combined surface
-        time_delta = self.clock.tick(30) / 1000.0
+        time_delta = self.clock.tick(self.FPS) / 1000.0
         self.manager.update(time_delta)
         self.manager.draw_ui(combined_surface)
 
         # Scale the combined surface and blit to window with offset
         if self.scale != 1.0:
             scaled_surface = pygame.transform.smoothscale(
-                combined_surface, (self.scaled_width, self.scaled_height)
+                combined_surface,
+                (self.scaled_width, self.scaled_height),
+                self.scaled_surface,
             )
             self.window.blit(scaled_surface, (self.offset_x, self.offset_y))
         else:
@@ -126,6 +157,11 @@ class SAREnvGUI:
     def reset(self):
         self.user.reset()
 
+    def _phase(self, name):
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.phase(name)
+
     def handle_gui_events(self, event):
         self.manager.process_events(event)
 
@@ -181,19 +217,23 @@ class SAREnvGUI:
         self.reset()
 
         while self.running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.close()
-                    break
+            with self._phase("events"):
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        self.close()
+                        break
 
-                # Handle gui and user input
-                self.handle_gui_events(event)
-                self.handle_user_input(event)
+                    # Handle gui and user input
+                    self.handle_gui_events(event)
+                    self.handle_user_input(event)
 
             # Only render if still running
             if self.running:
-                frame = self.user.get_frame()
-                self.render(frame)
+                with self._phase("frame"):
+                    frame = self.user.get_frame((self.env_size, self.env_size))
+                with self._phase("ui"):
+                    self.render(frame)
+                self.frame_count += 1
 
         # Clean up pygame after loop exits
         pygame.quit()
@@ -9,7 +9,13 @@ class User:
     def handle_key(self, event):
         self.controller.key_handler(event)
 
-    def get_frame(self):
+    def get_frame(self, screen_size=None):
+        """
+        The env's frame; with a (width, height) ``screen_size``, drawn at
+        the tile size that fits that screen when the env supports it.
+        """
+        if screen_size is not None and hasattr(self.env, "get_screen_frame"):
+            return self.env.get_screen_frame(screen_size)
         return self.env.render()
 
     def reset(self):
@@ -0,0 +1,178 @@
+import hashlib
+import importlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+
+import minigrid
+import numpy as np
+
+from .generation import encode_level
+from .pool import env_config
+
+# Modules whose code decides what level a seed generates
+GENERATOR_MODULES = (
+    "..core.level",
+    ".env",
+    ".grid",
+    ".instructions",
+    ".objects",
+    ".reachability",
+    ".utils",
+)
+
+
+@lru_cache(maxsize=None)
+def generator_fingerprint():
+    """
+    Hash of the level generator's source code and MiniGrid version.
+
+    Any edit to a generator module changes the fingerprint, and with it
+    every cache key, so cached layouts never outlive the code that made them.
+    """
+    digest = hashlib.sha256(minigrid.__version__.encode())
+    for name in GENERATOR_MODULES:
+        module = importlib.import_module(name, __package__)
+        digest.update(Path(module.__file__).read_bytes())
+    return digest.hexdigest()
+
+
+class LayoutCache:
+    """
+    Finished PickupVictimEnv layouts, keyed on the env's generation settings
+    and the reset seed.
+
+    Attach with ``PickupVictimEnv(layout_cache=cache)``: ``reset(seed=s)``
+    then restores the layout (grid, agent pose, locked rooms, the RNG state
+    generation left and, through the grid, the instruction victims) when
+    the cache has it and generates and stores it
+    otherwise. Resets without a seed are never cached.
+
+    The in-memory tier holds at most ``max_levels`` layouts and evicts the
+    least recently used. With ``path`` set, layouts are also written to disk
+    and read back on a memory miss, so they survive across processes.
+
+    Keys hash the settings (see ``env_config``, which covers the placers'
+    classes and parameters), the seed and ``generator_fingerprint``;
+    changing parameters, placers or generator code therefore misses instead
+    of returning a stale layout.
+    """
+
+    def __init__(self, max_levels=1024, path=None, fingerprint=None):
+        """
+        Create a cache.
+
+        Args:
+            max_levels: Layouts kept in memory
+            path: Optional directory for the on-disk tier
+            fingerprint: Generator version (default: ``generator_fingerprint``)
+        """
+        if max_levels < 1:
+            raise ValueError("max_levels must be at least 1")
+        self.max_levels = max_levels
+        self.fingerprint = fingerprint or generator_fingerprint()
+        self.path = None
+        if path is not None:
+            # One directory per generator version
+            self.path = Path(path) / self.fingerprint[:16]
+            self.path.mkdir(parents=True, exist_ok=True)
+        self._levels = OrderedDict()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, env, seed):
+        """Content address of the layout ``env`` generates for ``seed``."""
+        content = json.dumps(
+            [self.fingerprint, env_config(env), int(seed)], sort_keys=True
+        )
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def __len__(self):
+        return len(self._levels)
+
+    def get(self, env, seed):
+        """
+        Cached layout for a reset, counting the hit or miss.
+
+        Returns:
+            tuple or None: (grid, agent, rooms, rng) arrays, or None on a miss
+        """
+        key = self.key(env, seed)
+        level = self._levels.get(key)
+        if level is not None:
+            self._levels.move_to_end(key)
+            self.hits += 1
+            return level
+
+        level = self._read(key)
+        if level is None:
+            self.misses += 1
+            return None
+        self.disk_hits += 1
+        self._store(key, level)
+        return level
+
+    def put(self, env, seed):
+        """Store the layout ``env`` has just generated for ``seed``."""
+        key = self.key(env, seed)
+        level = encode_level(env)
+        self._store(key, level)
+        self._write(key, level)
+
+    def clear(self):
+        """Drop the in-memory tier; the disk tier is left alone."""
+        self._levels.clear()
+
+    def stats(self):
+        """
+        Cache size and hit/miss counts.
+
+        Returns:
+            dict: size, hits, disk_hits, misses, evictions and hit_rate
+        """
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "size": len(self),
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+        }
+
+    def _store(self, key, level):
+        self._levels[key] = level
+        self._levels.move_to_end(key)
+        while len(self._levels) > self.max_levels:
+            self._levels.popitem(last=False)
+            self.evictions += 1
+
+    def _read(self, key):
+        if self.path is None:
+            return None
+        try:
+            with np.load(self.path / f"{key}.npz") as data:
+                return data["grid"], data["agent"], data["rooms"], data["rng"]
+        except (FileNotFoundError, OSError, ValueError, KeyError):
+            # Missing, or a partial file from a crashed writer
+            return None
+
+    def _write(self, key, level):
+        if self.path is None:
+            return
+        grid, agent, rooms, rng = level
+        # Write then rename, so concurrent readers never see a partial file
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, grid=grid, agent=agent, rooms=rooms, rng=rng)
+            os.replace(tmp, self.path / f"{key}.npz")
+        except BaseException:
+            os.unlink(tmp)
+            raise
@@ -0,0 +1,273 @@
+from functools import lru_cache
+
+import numpy as np
+from minigrid.core.constants import DIR_TO_VEC, OBJECT_TO_IDX, STATE_TO_IDX
+from minigrid.core.world_object import Key
+
+# Object type indices used by the rules
+EMPTY = OBJECT_TO_IDX["empty"]
+WALL = OBJECT_TO_IDX["wall"]
+DOOR = OBJECT_TO_IDX["door"]
+GOAL = OBJECT_TO_IDX["goal"]
+LAVA = OBJECT_TO_IDX["lava"]
+OPEN = STATE_TO_IDX["open"]
+LOCKED = STATE_TO_IDX["locked"]
+
+REAL_VICTIM_TYPES = frozenset(
+    idx for name, idx in OBJECT_TO_IDX.items() if name.startswith("victim")
+)
+FAKE_VICTIM_TYPES = frozenset(
+    idx for name, idx in OBJECT_TO_IDX.items() if name.startswith("fake_victim")
+)
+PICKUP_TYPES = (
+    frozenset(OBJECT_TO_IDX[name] for name in ("key", "ball", "box"))
+    | REAL_VICTIM_TYPES
+    | FAKE_VICTIM_TYPES
+)
+OVERLAP_TYPES = frozenset(
+    OBJECT_TO_IDX[name] for name in ("empty", "floor", "goal", "lava")
+)
+
+DIR_VECS = [tuple(int(v) for v in vec) for vec in DIR_TO_VEC]
+
+# SEE_THROUGH[type, state]: whether a cell lets light through (walls and
+# closed doors do not), as in Grid.process_vis
+SEE_THROUGH = np.ones((256, 256), dtype=bool)
+SEE_THROUGH[WALL, :] = False
+SEE_THROUGH[DOOR, :] = False
+SEE_THROUGH[DOOR, OPEN] = True
+
+
+@lru_cache(maxsize=None)
+def _propagate_row(mask_bits, see_bits, width):
+    """
+    Visibility propagation for one row, as in ``Grid.process_vis``.
+
+    Bit i of ``mask_bits``/``see_bits`` holds cell i of the row. Returns the
+    final mask of the row and the bits it marks visible in the row above.
+    """
+    mask = [bool(mask_bits >> i & 1) for i in range(width)]
+    see = [bool(see_bits >> i & 1) for i in range(width)]
+    above = [False] * width
+
+    for i in range(width - 1):
+        if mask[i] and see[i]:
+            mask[i + 1] = above[i + 1] = above[i] = True
+    for i in reversed(range(1, width)):
+        if mask[i] and see[i]:
+            mask[i - 1] = above[i - 1] = above[i] = True
+
+    row = sum(1 << i for i in range(width) if mask[i])
+    up = sum(1 << i for i in range(width) if above[i])
+    return row, up
+
+
+class ArrayEngine:
+    """
+    Step PickupVictimEnv on the grid's numpy planes.
+
+    Applies the same rules as ``PickupVictimEnv.step`` (turning, moving,
+    lava, rescuing real and fake victims, key pickup/drop, doors and keys,
+    mission completion and max_steps truncation) without going through
+    ``MiniGridEnv.step``, ``WorldObj`` dispatch or MiniGrid's object-based
+    observation. Cells that change are written back with ``grid.set`` so the
+    object grid, bookkeeping and rendering stay in sync.
+    """
+
+    # Bounded cache of visibility masks keyed by occlusion pattern
+    VIS_CACHE_SIZE = 1 << 16
+
+    def __init__(self, env):
+        self.env = env
+        size = env.agent_view_size
+        self._bit_weights = 1 << np.arange(size)
+        self._bit_index = np.arange(size)
+        self._vis_cache = {}
+        self._flat_offsets = None
+        self._flat_stride = None
+
+        # View cell (vx, vy) looking in direction d sees world cell
+        # agent + f * (size - 1 - vy) + r * (vx - size // 2), with f the
+        # forward and r the right vector, as in MiniGridEnv.get_view_exts
+        vx, vy = np.meshgrid(np.arange(size), np.arange(size), indexing="ij")
+        self._view_offsets = []
+        for fx, fy in DIR_VECS:
+            rx, ry = -fy, fx
+            ox = fx * (size - 1 - vy) + rx * (vx - size // 2)
+            oy = fy * (size - 1 - vy) + ry * (vx - size // 2)
+            self._view_offsets.append((oy, ox))
+
+    def _offsets(self, stride):
+        """Per-direction view offsets into the flattened padded planes."""
+        if stride != self._flat_stride:
+            self._flat_offsets = [oy * stride + ox for oy, ox in self._view_offsets]
+            self._flat_stride = stride
+        return self._flat_offsets
+
+    # Observation -----------------------------------------------------------
+
+    def gen_obs(self):
+        """Array equivalent of ``MiniGridEnv.gen_obs``."""
+        env = self.env
+        env.materialize_view()
+        grid = env.grid
+        size = env.agent_view_size
+
+        # Gather the rotated view from the wall-padded planes in one go
+        padded = grid.padded
+        stride = padded.shape[1]
+        pad = grid.pad
+        x, y = env.agent_pos
+        origin = (int(y) + pad) * stride + int(x) + pad
+        offsets = self._offsets(stride)[env.agent_dir]
+        image = padded.reshape(-1, 3).take(offsets + origin, axis=0)
+
+        if not env.see_through_walls:
+            image *= self._process_vis(image, size)[..., None]
+
+        carrying = env.carrying
+        image[size // 2, size - 1] = carrying.encode() if carrying else (EMPTY, 0, 0)
+
+        return {"image": image, "direction": env.agent_dir, "mission": env.mission}
+
+    def _process_vis(self, image, size):
+        see = SEE_THROUGH[image[..., 0], image[..., 2]]
+        key = see.tobytes()
+        mask = self._vis_cache.get(key)
+        if mask is not None:
+            return mask
+
+        # Bit i of row j is cell (i, j)
+        see_rows = (see.T * self._bit_weights).sum(axis=1).tolist()
+        rows = [0] * size
+        rows[size - 1] = 1 << (size // 2)
+        for j in reversed(range(size)):
+            rows[j], up = _propagate_row(rows[j], see_rows[j], size)
+            if j > 0:
+                rows[j - 1] |= up
+
+        rows = np.array(rows)
+        mask = ((rows[None, :] >> self._bit_index[:, None]) & 1).astype(np.uint8)
+        if len(self._vis_cache) >= self.VIS_CACHE_SIZE:
+            self._vis_cache.clear()
+        self._vis_cache[key] = mask
+        return mask
+
+    # Dynamics --------------------------------------------------------------
+
+    def _mission_complete(self):
+        env = self.env
+        return env.grid.count("victim") == 0 and not env.pending_victims
+
+    def step(self, action):
+        """Array equivalent of ``PickupVictimEnv.step``."""
+        env = self.env
+        actions = env.actions
+        grid = env.grid
+
+        ax, ay = int(env.agent_pos[0]), int(env.agent_pos[1])
+        dx, dy = DIR_VECS[env.agent_dir]
+        fx, fy = ax + dx, ay + dy
+        fwd_type = int(grid.types[fy, fx])
+
+        if action == actions.pickup and (
+            fwd_type in REAL_VICTIM_TYPES or fwd_type in FAKE_VICTIM_TYPES
+        ):
+            # Rescue: no step is counted, as in RescueAction.execute
+            if fwd_type in REAL_VICTIM_TYPES:
+                env.saved_victims += 1
+                reward = 1.0
+            else:
+                reward = -0.5
+            grid.set(fx, fy, None)
+            obs = self.gen_obs()
+            terminated, truncated, info = False, False, {}
+        else:
+            obs, reward, terminated, truncated, info = self._base_step(
+                action, ax, ay, fx, fy, fwd_type
+            )
+            if action != actions.pickup:
+                return obs, reward, terminated, truncated, info
+
+        # Mission check after a pickup, as in PickupVictimEnv.step
+        if self._mission_complete():
+            terminated = True
+            reward += 1.0
+            info["mission_complete"] = True
+        return obs, reward, terminated, truncated, info
+
+    def _base_step(self, action, ax, ay, fx, fy, fwd_type):
+        """Array equivalent of ``RoomGridLevel.step``."""
+        env = self.env
+        actions = env.actions
+        grid = env.grid
+        env.step_count += 1
+
+        reward = 0
+        terminated = False
+        truncated = False
+
+        if action == actions.left:
+            env.agent_dir = (env.agent_dir - 1) % 4
+
+        elif action == actions.right:
+            env.agent_dir = (env.agent_dir + 1) % 4
+
+        elif action == actions.forward:
+            if fwd_type in OVERLAP_TYPES or (
+                fwd_type == DOOR and grid.states[fy, fx] == OPEN
+            ):
+                env.agent_pos = (fx, fy)
+            if fwd_type == GOAL:
+                terminated = True
+                reward = env._reward()
+            if fwd_type == LAVA:
+                terminated = True
+
+        elif action == actions.pickup:
+            if fwd_type in PICKUP_TYPES and env.carrying is None:
+                env.carrying = grid.get(fx, fy)
+                env.carrying.cur_pos = np.array([-1, -1])
+                grid.set(fx, fy, None)
+
+        elif action == actions.drop:
+            if fwd_type == EMPTY and env.carrying:
+                grid.set(fx, fy, env.carrying)
+                env.carrying.cur_pos = (fx, fy)
+                env.carrying = None
+
+        elif action == actions.toggle:
+            if fwd_type == DOOR:
+                door = grid.get(fx, fy)
+                if grid.states[fy, fx] == LOCKED:
+                    carrying = env.carrying
+                    if isinstance(carrying, Key) and carrying.color == door.color:
+                        door.is_locked = False
+                        door.is_open = True
+                else:
+                    door.is_open = not door.is_open
+                grid.refresh(fx, fy)
+            elif fwd_type != EMPTY:
+                grid.get(fx, fy).toggle(env, (fx, fy))
+                grid.refresh(fx, fy)
+
+        elif action == actions.done:
+            pass
+
+        else:
+            raise ValueError(f"Unknown action: {action}")
+
+        if env.step_count >= env.max_steps:
+            truncated = True
+
+        if env.render_mode == "human":
+            env.render()
+
+        obs = self.gen_obs()
+
+        # Instruction check, as in RoomGridLevel.step
+        if self._mission_complete():
+            terminated = True
+            reward = env._reward()
+
+        return obs, reward, terminated, truncated, {}
@@ -1,15 +1,40 @@
-import random
+from functools import partial
 
+import numpy as np
+from minigrid.core.constants import COLOR_NAMES
+from minigrid.core.roomgrid import Room
 from minigrid.core.world_object import Door
+from minigrid.envs.babyai.core.roomgrid_level import RejectSampling
 
 from ..core.level import SARLevelGen
+from ..core.state import decode_rng_state
 from .actions import RescueAction
+from .engine import ArrayEngine
+from .grid import SARGrid
 from .instructions import PickupAllVictimsInstr, calculate_max_steps
-from .objects import REAL_VICTIMS
-from .utils import LavaPlacer
+from .mutation import LevelMutator
+from .objects import FAKE_VICTIMS, REAL_VICTIMS
+from .reachability import NEIGHBORS, Reachability, can_block
+from .telemetry import GenerationStats
+from .utils import LavaPlacer, VictimPlacer
 
 
 class PickupVictimEnv(SARLevelGen):
+    # Per-episode counters captured by get_state/set_state
+    STATE_ATTRS = ("saved_victims", "_materialized_rooms")
+    # Set by each level generated or loaded
+    LEVEL_ATTRS = (
+        "mission",
+        "surface",
+        "instrs",
+        "max_steps",
+        "fixed_max_steps",
+        "room_grid",
+        "_room_seed",
+    )
+    # Fills of a lazy room tried before giving up on its lava
+    ROOM_ATTEMPTS = 4
+
     def __init__(
         self,
         room_size=8,
@@ -22,6 +47,11 @@ class PickupVictimEnv(SARLevelGen):
         lava_probability=0.5,
         locked_room_prob=0.5,
         victim_placer=None,
+        grid_arrays=False,
+        backend="object",
+        level_pool=None,
+        layout_cache=None,
+        lazy_rooms=False,
         **kwargs,
     ):
         # We add many distractors to increase the probability
@@ -36,8 +66,24 @@ class PickupVictimEnv(SARLevelGen):
             implicit_unlock=False,
             **kwargs,
         )
-        self.victim_placer = victim_placer
+        self.victim_placer = victim_placer or VictimPlacer()
+        self._agent_placed = False
+        # Mirror the grid into numpy type/color/state planes
+        self.grid_arrays = grid_arrays
+
+        # Simulation backend: MiniGrid objects, or numpy planes (ArrayEngine)
+        if backend not in ("object", "array"):
+            raise ValueError(f"Unknown backend: {backend!r}")
+        self.backend = backend
+        self.engine = None
+        if backend == "array":
+            self.grid_arrays = True
+            self.engine = ArrayEngine(self)
         self.locked_room_prob = locked_room_prob
+        self.num_locked_rooms = max(1, int(num_cols * num_rows * locked_room_prob))
+        # Keys share unlocked rooms with the agent, victims and lava
+        self.max_keys_per_room = max(1, (room_size - 2) ** 2 // 4)
+        self._check_locked_rooms(self.num_locked_rooms)
 
         # Lava configuration
         self.add_lava = add_lava
@@ -48,55 +94,189 @@ class PickupVictimEnv(SARLevelGen):
 
         # Custom actions
         self.resuce_action = RescueAction(self)
+        # In-place edits of the current level (see LevelMutator)
+        self.mutator = LevelMutator(self)
         self.saved_victims = 0
 
+        # Pre-generated levels to reset from (see LevelPool)
+        self.level_pool = level_pool
+        self._reset_seed = None
+        if level_pool is not None:
+            level_pool.check(self)
+        # Layouts of recently used seeds to restore from (see LayoutCache)
+        self.layout_cache = layout_cache
+        # Retries, rejections and timings of level generation
+        self.generation_stats = GenerationStats()
+
+        # Fill rooms with lava and victims only once they are first seen
+        if lazy_rooms and (level_pool is not None or layout_cache is not None):
+            raise ValueError(
+                "lazy_rooms cannot be combined with a level pool or layout cache"
+            )
+        self.lazy_rooms = lazy_rooms
+        self._room_seed = 0
+        self._materialized_rooms = frozenset()
+
+    def _check_locked_rooms(self, n_locked):
+        num_rooms = self.num_cols * self.num_rows
+        key_capacity = (num_rooms - n_locked) * self.max_keys_per_room
+        if n_locked > num_rooms - 1 or n_locked > key_capacity:
+            raise ValueError(
+                f"Cannot lock {n_locked} of {num_rooms} rooms: the keys need "
+                f"unlocked rooms with space for them (at most "
+                f"{self.max_keys_per_room} per room), and the agent needs "
+                "an unlocked room to start in"
+            )
+
+    def _rooms(self):
+        """All rooms as (i, j, room), row by row."""
+        return [
+            (i, j, self.room_grid[j][i])
+            for j in range(self.num_rows)
+            for i in range(self.num_cols)
+        ]
+
     def add_locked_rooms(self, n_locked):
-        added = 0
+        """
+        Lock rooms behind locked doors and place their keys in unlocked rooms.
 
-        while added < n_locked:
-            # Pick a random room
-            i, j = self._rand_int(0, self.num_cols), self._rand_int(0, self.num_rows)
-            locked_room = self.get_room(i, j)
+        The rooms that stay unlocked are grown as one connected region from a
+        random room, so ``connect_all`` can always join them. Every locked
+        room then gets a single locked door towards a neighbour one step
+        closer to that region, so it is reachable once the keys on the way
+        are collected. Keys are placed once all locks are in, in rooms that
+        stayed unlocked, at most ``max_keys_per_room`` per room. Each step
+        is linear in the number of rooms and never rejects a draw.
 
-            # Skip if room is already locked
-            if locked_room.locked:
-                continue
+        Args:
+            n_locked: Number of rooms to lock
 
-            # Find all door indices that are still empty
-            empty_doors = [idx for idx, d in enumerate(locked_room.doors) if d is None]
-            if not empty_doors:
-                continue  # no free door, pick another room
+        Raises:
+            ValueError: If the unlocked rooms left over cannot hold the keys
+                and the agent
+        """
+        rooms = self._rooms()
+        self._check_locked_rooms(n_locked)
+        index = {id(room): k for k, (_, _, room) in enumerate(rooms)}
+
+        def neighbors(k):
+            room = rooms[k][2]
+            return [
+                (door_idx, index[id(neighbor)])
+                for door_idx, neighbor in enumerate(room.neighbors)
+                if neighbor is not None
+            ]
+
+        # Grow the unlocked region from a random room, one random frontier
+        # room at a time (swap-with-last removal keeps each draw O(1))
+        start = self._rand_int(0, len(rooms))
+        unlocked = {start}
+        frontier = [k for _, k in neighbors(start)]
+        seen = {start, *frontier}
+        while len(unlocked) < len(rooms) - n_locked:
+            f = self._rand_int(0, len(frontier))
+            frontier[f], frontier[-1] = frontier[-1], frontier[f]
+            k = frontier.pop()
+            unlocked.add(k)
+            for _, n in neighbors(k):
+                if n not in seen:
+                    seen.add(n)
+                    frontier.append(n)
+
+        # Breadth-first from the region: each locked room opens towards a
+        # random neighbour one step closer to it
+        distance = dict.fromkeys(unlocked, 0)
+        queue = list(unlocked)
+        locked_doors = []
+        for k in queue:
+            for _, n in neighbors(k):
+                if n not in distance:
+                    distance[n] = distance[k] + 1
+                    queue.append(n)
+        for k in queue[len(unlocked):]:
+            towards = [
+                door_idx
+                for door_idx, n in neighbors(k)
+                if distance[n] == distance[k] - 1
+            ]
+            i, j, _ = rooms[k]
+            door, _ = self.add_door(i, j, self._rand_elem(towards), locked=True)
+            locked_doors.append(door)
+
+        # Each unlocked room appears once per key it can still take
+        key_slots = [rooms[k][:2] for k in sorted(unlocked)] * self.max_keys_per_room
+        for door in locked_doors:
+            k = self._rand_int(0, len(key_slots))
+            key_slots[k], key_slots[-1] = key_slots[-1], key_slots[k]
+            ki, kj = key_slots.pop()
+            self.add_object(ki, kj, "key", door.color)
+
+    def connect_all(self, door_colors=COLOR_NAMES, max_itrs=5000):
+        """
+        Add unlocked doors until all unlocked rooms are connected.
 
-            # Pick a random empty door
-            door_idx = random.choice(empty_doors)
+        Replaces ``RoomGrid.connect_all``, which draws random walls and
+        floods the whole room graph after each new door, so it needs time
+        quadratic in the number of rooms and times out on large grids. Here
+        the walls between unlocked rooms are shuffled once and a union-find
+        keeps a door wherever it joins two separate regions, so the unlocked
+        rooms end up spanned by a random tree of doors. Locked rooms are
+        reached through their locked doors (see ``add_locked_rooms``).
 
-            # Skip if door leads outside
-            if locked_room.neighbors[door_idx] is None:
-                continue
+        Args:
+            door_colors: Colors to draw new doors from
+            max_itrs: Unused; kept for signature compatibility
 
-            # Add locked door
-            door, _ = self.add_door(i, j, door_idx, locked=True)
-            locked_room.locked = True
-
-            # Place key in a different room
-            while True:
-                ki, kj = (
-                    self._rand_int(0, self.num_cols),
-                    self._rand_int(0, self.num_rows),
-                )
-                key_room = self.get_room(ki, kj)
-                if key_room is locked_room:
+        Returns:
+            list: Doors added
+        """
+        rooms = [entry for entry in self._rooms() if not entry[2].locked]
+        parent = {id(room): id(room) for _, _, room in rooms}
+
+        def find(node):
+            while parent[node] != node:
+                parent[node] = parent[parent[node]]
+                node = parent[node]
+            return node
+
+        # Walls to the right (0) and below (1) of each unlocked room
+        walls = []
+        regions = len(rooms)
+        for i, j, room in rooms:
+            for door_idx in (0, 1):
+                neighbor = room.neighbors[door_idx]
+                if neighbor is None or id(neighbor) not in parent:
                     continue
-                if getattr(key_room, "locked", False):
-                    continue  # avoid placing key in another locked room
-                self.add_object(ki, kj, "key", door.color)
+                if room.doors[door_idx] is not None:
+                    a, b = find(id(room)), find(id(neighbor))
+                    if a != b:
+                        parent[a] = b
+                        regions -= 1
+                else:
+                    walls.append((i, j, door_idx))
+
+        added_doors = []
+        for w in self.np_random.permutation(len(walls)):
+            if regions == 1:
                 break
+            i, j, door_idx = walls[w]
+            room = self.room_grid[j][i]
+            a, b = find(id(room)), find(id(room.neighbors[door_idx]))
+            if a == b:
+                continue
+            parent[a] = b
+            regions -= 1
+            color = self._rand_elem(door_colors)
+            door, _ = self.add_door(i, j, door_idx, color, False)
+            added_doors.append(door)
 
-            added += 1
+        return added_doors
 
     def _count_objects_by_type(self, obj_types):
         """
         Utility method to count objects of specific types on the grid.
+        Victims, fake victims, keys and doors are answered from the grid's
+        live bookkeeping; other types fall back to a full scan.
 
         Args:
             obj_types: Tuple of object types to count
@@ -104,6 +284,10 @@ class PickupVictimEnv(SARLevelGen):
         Returns:
             int: Number of objects matching the types
         """
+        category = SARGrid.category_of(obj_types)
+        if category is not None and isinstance(self.grid, SARGrid):
+            return self.grid.count(category)
+
         count = 0
         for x in range(self.width):
             for y in range(self.height):
@@ -115,6 +299,7 @@ class PickupVictimEnv(SARLevelGen):
     def _find_objects_by_type(self, obj_types):
         """
         Utility method to find all objects of specific types on the grid.
+        Tracked types are looked up from the grid's position sets.
 
         Args:
             obj_types: Tuple of object types to find
@@ -122,6 +307,10 @@ class PickupVictimEnv(SARLevelGen):
         Returns:
             list: List of objects matching the types
         """
+        category = SARGrid.category_of(obj_types)
+        if category is not None and isinstance(self.grid, SARGrid):
+            return self.grid.find(category)
+
         objects = []
         for x in range(self.width):
             for y in range(self.height):
@@ -152,8 +341,10 @@ class PickupVictimEnv(SARLevelGen):
         else:
             status = "incomplete"
 
-        # Count remaining victims on the grid
-        remaining_victims = len(self.get_all_victims())
+        # Count remaining victims on the grid and in rooms not yet filled
+        remaining_victims = (
+            self._count_objects_by_type(REAL_VICTIMS) + self.pending_victims
+        )
 
         return {
             "status": status,
@@ -195,6 +386,10 @@ class PickupVictimEnv(SARLevelGen):
     def reset(self, **kwargs):
         """Reset the environment and all stats."""
         self.saved_victims = 0
+        self._reset_seed = kwargs.get("seed")
+        obs = super().reset(**kwargs)
+
+        # Time limit from the doors of the new level, counted by the grid
         self.fixed_max_steps = calculate_max_steps(
             room_size=self.room_size,
             num_cols=self.num_cols,
@@ -203,44 +398,511 @@ class PickupVictimEnv(SARLevelGen):
             num_doors=self._count_objects_by_type(Door),
         )
         self.max_steps = self.fixed_max_steps
-        return super().reset(**kwargs)
+        return obs
+
+    def _gen_grid(self, width, height):
+        """
+        Generate a level, or load it from the level pool or layout cache if
+        either has it.
+        """
+        seed = self._reset_seed
+        pool, cache = self.level_pool, self.layout_cache
+        level = None if pool is None else pool.get(seed, self.np_random)
+        if level is None and cache is not None and seed is not None:
+            level = cache.get(self, seed)
+        if level is None:
+            with self.generation_stats.level():
+                super()._gen_grid(width, height)
+            if pool is not None:
+                pool.record(seed, self)
+            if cache is not None and seed is not None:
+                cache.put(self, seed)
+            return
+
+        self.generation_stats.loaded += 1
+        self.load_level(*level)
+        self.surface = self.instrs.surface(self)
+        self.mission = self.surface
+
+    def load_level(self, grid, agent, rooms, rng):
+        """
+        Load a stored level instead of generating one.
+
+        On a seeded reset the RNG is also set to the state generation left
+        it in, so the episode draws the same numbers as after generating the
+        level. Resets without a seed keep their own RNG stream; restoring a
+        stored state there would make every later unseeded reset pick the
+        same levels in the same order.
+
+        Args:
+            grid: Encoded grid, as ``Grid.encode``
+            agent: Agent start as (x, y, direction)
+            rooms: (num_rows, num_cols) locked flags of the rooms
+            rng: RNG state after generation, as ``encode_rng_state``
+        """
+        pad = self.agent_view_size if self.engine is not None else 0
+        self.grid = SARGrid.decode(np.asarray(grid), arrays=self.grid_arrays, pad=pad)
+        self._build_rooms(np.asarray(rooms))
+        x, y, direction = (int(v) for v in agent)
+        self.agent_pos = (x, y)
+        self.agent_dir = direction
+        # As after gen_mission, so that mutations check placements
+        self.grid.reachability = Reachability(
+            self.grid, unblocking=self.unblocking, window=self.room_size - 1
+        )
+        self._agent_placed = True
+        self.instrs = PickupAllVictimsInstr(self.get_all_victims())
+        if self._reset_seed is not None:
+            self.np_random.bit_generator.state = decode_rng_state(rng)
+
+    def _build_rooms(self, locked):
+        """
+        Rebuild ``room_grid`` for a loaded level as ``RoomGrid._gen_grid``
+        does, taking the doors from the grid instead of drawing them.
+
+        Args:
+            locked: (num_rows, num_cols) locked flags of the rooms; doors
+                alone cannot tell which side of a locked door is the
+                locked room
+        """
+        step = self.room_size - 1
+        size = (self.room_size, self.room_size)
+        self.room_grid = [
+            [Room((i * step, j * step), size) for i in range(self.num_cols)]
+            for j in range(self.num_rows)
+        ]
+        for j, row in enumerate(self.room_grid):
+            for i, room in enumerate(row):
+                if i < self.num_cols - 1:
+                    room.neighbors[0] = row[i + 1]
+                    row[i + 1].neighbors[2] = room
+                if j < self.num_rows - 1:
+                    room.neighbors[1] = self.room_grid[j + 1][i]
+                    self.room_grid[j + 1][i].neighbors[3] = room
+
+        # Door order is right, down, left, up, as in RoomGrid
+        for x, y in self.grid.positions["door"]:
+            if x % step == 0:
+                room, k = self.room_grid[y // step][x // step - 1], 0
+            else:
+                room, k = self.room_grid[y // step - 1][x // step], 1
+            door = self.grid.get(x, y)
+            neighbor = room.neighbors[k]
+            room.doors[k] = neighbor.doors[k + 2] = door
+            room.door_pos[k] = neighbor.door_pos[k + 2] = (x, y)
+
+        for row, flags in zip(self.room_grid, locked.tolist()):
+            for room, flag in zip(row, flags):
+                room.locked = flag
 
     def gen_mission(self):
         """Generate the mission layout and instructions."""
 
+        # Track victims, keys and doors as they are placed
+        # The array engine slices agent views out of a wall-padded buffer
+        pad = self.agent_view_size if self.engine is not None else 0
+        self.grid = SARGrid.from_grid(self.grid, arrays=self.grid_arrays, pad=pad)
+        # Passability and components, updated as objects are placed
+        self.grid.reachability = Reachability(
+            self.grid, unblocking=self.unblocking, window=self.room_size - 1
+        )
+        # Until the agent is placed, objects cannot be checked against it
+        self._agent_placed = False
+
+        stats = self.generation_stats
+        stats.attempts += 1
+
+        # Seed of the per-room RNGs that fill rooms in lazy mode
+        self._room_seed = self._rand_int(0, 2**31 - 1)
+        self._materialized_rooms = frozenset()
+
         # Add locked rooms (20% of rooms - balanced between challenge and generation speed)
-        n_locked = max(1, int(self.num_cols * self.num_rows * self.locked_room_prob))
-        self.add_locked_rooms(n_locked)
+        with stats.phase("add_locked_rooms"):
+            self.add_locked_rooms(self.num_locked_rooms)
 
-        self.connect_all()
+        with stats.phase("connect_all"):
+            self.connect_all()
 
         # Add lava obstacles (before victims to avoid blocking them)
-        if self.add_lava:
-            self.lava_placer.place_all(self, self.num_rows, self.num_cols)
-
-        # Place agent outside locked room
-        while True:
-            self.place_agent()
-            start_room = self.room_from_pos(*self.agent_pos)
-            if not start_room.locked:
-                break
+        if self.add_lava and not self.lazy_rooms:
+            with stats.phase("lava"):
+                self.lava_placer.place_all(self, self.num_rows, self.num_cols)
+
+        # Place agent in a random unlocked room
+        with stats.phase("place_agent"):
+            start = self._rand_elem(
+                [(i, j) for i, j, room in self._rooms() if not room.locked]
+            )
+            self.place_agent(*start)
+        self._agent_placed = True
 
         # Check that all objects (including victims) are reachable from agent start position
         if not self.unblocking:
-            self.check_objs_reachable()
+            with stats.phase("check_objs_reachable"):
+                self.check_objs_reachable()
+
+        # Lazy rooms get their lava and victims in materialize_room
+        if self.lazy_rooms:
+            self.instrs = PickupAllVictimsInstr([], num_victims=self.pending_victims)
+            # Fill the rooms in view now, so that a fill cutting something
+            # off rejects the level rather than the first observation
+            with stats.phase("victims"):
+                self.materialize_view()
+            if not self.unblocking:
+                with stats.phase("check_objs_reachable"):
+                    self.check_objs_reachable()
+            return
+
+        # Add victims after checking reachability; place_in_room keeps them
+        # reachable, clearing lava if it has to
+        with stats.phase("victims"):
+            self.victim_placer.place_all(self, self.num_rows, self.num_cols)
 
-        # Add victims after checking reachability
-        self.victim_placer.place_all(self, self.num_rows, self.num_cols)
+        # Catch a victim squeezed into a full room after all
+        if not self.unblocking:
+            with stats.phase("check_objs_reachable"):
+                self.check_objs_reachable()
 
         victims = self.get_all_victims()
 
         # Create instruction to pick up all victims
         self.instrs = PickupAllVictimsInstr(victims)
 
+    @property
+    def pending_victims(self):
+        """Real victims of the rooms lazy mode has not filled yet."""
+        if not self.lazy_rooms:
+            return 0
+        unfilled = self.num_rows * self.num_cols - len(self._materialized_rooms)
+        return unfilled * self.victim_placer.num_real_victims
+
+    def materialize_room(self, i, j):
+        """
+        Fill room (i, j) with lava and victims, if lazy mode has not yet.
+
+        The room draws from its own RNG, seeded from the level's room seed
+        and (i, j), and searches only its own cells when checking placements,
+        so it gets the same contents whenever and in whatever order rooms are
+        filled. The episode's RNG is left untouched.
+
+        Unless ``unblocking`` is set, every object of the filled room must be
+        reachable from the agent, as ``check_objs_reachable`` requires of
+        whole levels. A fill that fails is undone and redrawn from the next
+        seed, up to ``ROOM_ATTEMPTS`` times. The last attempt adds no lava
+        and places the room's keys again first: keys placed with the level
+        can leave no cell that cuts nothing off, and the agent has not seen
+        the room yet.
+
+        Returns:
+            bool: True if the room was filled by this call
+        """
+        if not self.lazy_rooms or (i, j) in self._materialized_rooms:
+            return False
+        self._materialized_rooms = self._materialized_rooms | {(i, j)}
+
+        room = self.get_room(i, j)
+        # Only keys are placed in a room before it is filled
+        keys = list(room.objs)
+        episode_rng = self._np_random
+        try:
+            for attempt in range(self.ROOM_ATTEMPTS):
+                last = attempt == self.ROOM_ATTEMPTS - 1
+                seed = (self._room_seed, i, j) + ((attempt,) if attempt else ())
+                self._np_random = np.random.default_rng(seed)
+                try:
+                    if last:
+                        for key in keys:
+                            self.place_in_room(i, j, key)
+                    elif self.add_lava:
+                        self.lava_placer.place_room(self, i, j)
+                    self.victim_placer.place_room(self, i, j)
+                except RejectSampling:
+                    if last:
+                        raise
+                else:
+                    if last or self._room_reachable(room):
+                        break
+                # Undo the fill, and lift the keys before the last attempt
+                # (victims are shared between rooms, so go by cell, not cur_pos)
+                kept = 0 if attempt == self.ROOM_ATTEMPTS - 2 else len(keys)
+                placed = {id(obj) for obj in room.objs[kept:]}
+                (top_x, top_y), (size_x, size_y) = room.top, room.size
+                for y in range(top_y, top_y + size_y):
+                    for x in range(top_x, top_x + size_x):
+                        if id(self.grid.get(x, y)) in placed:
+                            self.grid.set(x, y, None)
+                del room.objs[kept:]
+                self.generation_stats.retry("check_objs_reachable")
+        finally:
+            self._np_random = episode_rng
+        return True
+
+    def _room_reachable(self, room):
+        """Whether every object in ``room``, doors included, can be reached."""
+        reachability = getattr(self.grid, "reachability", None)
+        if self.unblocking or reachability is None:
+            return True
+        (top_x, top_y), (size_x, size_y) = room.top, room.size
+        start = tuple(self.agent_pos)
+        return all(
+            reachability.is_reachable((x, y), start)
+            for y in range(top_y, top_y + size_y)
+            for x in range(top_x, top_x + size_x)
+            if (x, y) in reachability.objects and (x, y) != start
+        )
+
+    def materialize_all(self):
+        """Fill every room lazy mode has not filled yet."""
+        for i, j, _ in self._rooms():
+            self.materialize_room(i, j)
+
+    def materialize_view(self):
+        """Fill the rooms that overlap the agent's view square."""
+        num_rooms = self.num_rows * self.num_cols
+        if not self.lazy_rooms or len(self._materialized_rooms) == num_rooms:
+            return
+        # Rooms share their walls: room i spans x in [i * step, (i + 1) * step]
+        step = self.room_size - 1
+        top_x, top_y, bot_x, bot_y = self.get_view_exts()
+        cols = range(
+            max((top_x - 1) // step, 0), min((bot_x - 1) // step + 1, self.num_cols)
+        )
+        rows = range(
+            max((top_y - 1) // step, 0), min((bot_y - 1) // step + 1, self.num_rows)
+        )
+        for i in cols:
+            for j in rows:
+                self.materialize_room(i, j)
+
+    def place_in_room(self, i, j, obj, strict=False):
+        """
+        Add an object to room (i, j), avoiding cells that cut anything off.
+
+        Like ``RoomGrid.place_in_room``, but prefers free interior cells that
+        are not just inside a door position (even one ``connect_all`` has not
+        filled yet) and that ``can_block`` accepts, then cells that the exact
+        check in ``_place_fallback`` accepts, so keys and victims rarely make
+        the level fail ``check_objs_reachable``. Once the agent is placed, a
+        cell next to another object must pass the exact check too. Cells
+        next to the agent are never used. A fake victim that fits nowhere
+        safe is left out, with None as its position, and so is any object
+        when ``strict`` is set.
+
+        Raises:
+            RejectSampling: If the room has no free cell left
+        """
+        room = self.get_room(i, j)
+        grid = self.grid
+        (top_x, top_y), (size_x, size_y) = room.top, room.size
+        reachability = getattr(grid, "reachability", None)
+        if reachability is not None:
+            # Search only the room, so its contents do not depend on others
+            box = (top_x, top_y, top_x + size_x, top_y + size_y)
+            blockable = partial(reachability.can_block, box=box)
+        else:
+            blockable = partial(can_block, grid)
+
+        entrances = set()
+        for door_pos in room.door_pos:
+            if door_pos is not None:
+                x, y = door_pos
+                dx = int(x == top_x) - int(x == top_x + size_x - 1)
+                dy = int(y == top_y) - int(y == top_y + size_y - 1)
+                entrances.add((x + dx, y + dy))
+
+        ax, ay = self.agent_pos if self.agent_pos is not None else (-1, -1)
+        candidates = [
+            (x, y)
+            for y in range(top_y + 1, top_y + size_y - 1)
+            for x in range(top_x + 1, top_x + size_x - 1)
+            if grid.get(x, y) is None
+            and abs(x - ax) + abs(y - ay) >= 2
+        ]
+
+        def crowded(x, y):
+            for dx, dy in NEIGHBORS:
+                cell = grid.get(x + dx, y + dy)
+                if cell is not None and cell.type not in ("wall", "door"):
+                    return True
+            return False
+
+        # Prefer safe cells with no object next to them, so objects do not
+        # cluster into blocks that later placements cannot get around
+        pos = None
+        safe = []
+        rejected = []
+        while candidates:
+            k = self._rand_int(0, len(candidates))
+            candidates[k], candidates[-1] = candidates[-1], candidates[k]
+            cell = candidates.pop()
+            if cell in entrances or not blockable(*cell):
+                rejected.append(cell)
+            elif crowded(*cell):
+                safe.append(cell)
+            else:
+                pos = cell
+                break
+        if pos is None and safe:
+            # A cell next to an object may be that object's only way in
+            if reachability is None or not self._agent_placed:
+                pos = safe[0]
+            else:
+                for cell in safe:
+                    if reachability.can_block_in(*cell, box, self.agent_pos):
+                        pos = cell
+                        break
+                    rejected.append(cell)
+
+        if pos is not None:
+            grid.set(*pos, obj)
+        else:
+            pos = self._place_fallback(room, obj, rejected, strict)
+            if pos is None:
+                return obj, None
+
+        obj.init_pos = obj.cur_pos = pos
+        room.objs.append(obj)
+        return obj, pos
+
+    def _place_fallback(self, room, obj, cells, strict=False):
+        """
+        Put ``obj`` in one of ``cells`` of ``room``, which the local test
+        rejected (possibly none).
+
+        Once the agent is placed, each cell is tried in turn and kept if no
+        object becomes unreachable from the agent, searching only the room
+        (see ``Reachability.can_block_in``). A fake victim is only a
+        distractor, so if that fails it is left out (None is returned), as
+        is anything placed with ``strict``. For anything else the room's
+        lava is cleared one random tile at a time, trying again after each,
+        since a victim or key matters more than an obstacle.
+        Failing that, it may go where at least no path through the room is
+        cut, which is also all that is checked before the agent is placed,
+        then where no object in the whole grid is cut off, and failing that
+        in the first cell, as ``RoomGrid.place_in_room`` would;
+        ``check_objs_reachable`` then rejects the level.
+
+        Raises:
+            RejectSampling: If no cell is left for an object that must be
+                placed
+        """
+        grid = self.grid
+        reachability = getattr(grid, "reachability", None)
+        if reachability is not None and not reachability.unblocking:
+            (top_x, top_y), (size_x, size_y) = room.top, room.size
+            box = (top_x, top_y, top_x + size_x, top_y + size_y)
+            start = self.agent_pos if self._agent_placed else None
+            optional = strict or isinstance(obj, FAKE_VICTIMS)
+            if start is None:
+                cell = self._place_blocking(obj, box, cells, None, strict=False)
+            else:
+                cell = self._place_blocking(obj, box, cells, start, strict=True)
+                while cell is None and not optional:
+                    freed = self._clear_lava(room)
+                    if freed is None:
+                        break
+                    self.generation_stats.retry("victims")
+                    if abs(freed[0] - start[0]) + abs(freed[1] - start[1]) >= 2:
+                        cells = [*cells, freed]
+                    cell = self._place_blocking(obj, box, cells, start, strict=True)
+            if cell is not None:
+                return cell
+            if optional:
+                return None
+            if start is not None:
+                cell = self._place_blocking(obj, box, cells, start, strict=False)
+                if cell is not None:
+                    return cell
+                # Paths through a crowded room may go round it; check the
+                # whole grid, which costs a rebuild per cell
+                for cell in cells:
+                    grid.set(*cell, obj)
+                    if not reachability.unreachable_objects(start):
+                        return cell
+                    grid.set(*cell, None)
+
+        if not cells:
+            raise RejectSampling(f"no free cell left in room at {room.top}")
+        grid.set(*cells[0], obj)
+        return cells[0]
+
+    def _place_blocking(self, obj, box, cells, start, strict):
+        """
+        Put ``obj`` in the first of ``cells`` that ``can_block_in`` accepts,
+        repairing the components of ``box``.
+
+        Returns:
+            tuple or None: The cell, or None if none was accepted
+        """
+        grid = self.grid
+        reachability = grid.reachability
+        for cell in cells:
+            if reachability.can_block_in(*cell, box, start, strict=strict):
+                stale = reachability.stale
+                grid.set(*cell, obj)
+                # The block may have cut off part of the room
+                if not stale:
+                    reachability.repair_box(box)
+                return cell
+        return None
+
+    def _clear_lava(self, room):
+        """Remove a random lava tile of ``room``, returning its cell or None."""
+        lava = [obj for obj in room.objs if obj.type == "lava"]
+        if not lava:
+            return None
+        tile = lava[self._rand_int(0, len(lava))]
+        room.objs.remove(tile)
+        cell = tuple(int(v) for v in tile.cur_pos)
+        self.grid.set(*cell, None)
+        return cell
+
+    def mutate(self, num_mutations=1):
+        """
+        Apply random in-place edits to the current level, for curriculum
+        replay; see ``LevelMutator``.
+
+        Returns:
+            list: (op, target, result) for each edit made
+        """
+        return self.mutator.mutate(num_mutations)
+
+    def check_objs_reachable(self, raise_exc=True):
+        """
+        Check that all objects are reachable from the agent's start.
+
+        Uses the grid's incrementally maintained components when available
+        instead of a BFS over the whole level.
+        """
+        reachability = getattr(self.grid, "reachability", None)
+        if reachability is None or reachability.unblocking:
+            return super().check_objs_reachable(raise_exc)
+        if not raise_exc:
+            return not reachability.unreachable_objects(self.agent_pos)
+        return reachability.check(self.agent_pos)
+
+    def is_reachable(self, pos):
+        """Whether ``pos`` can be reached from the agent's current position."""
+        reachability = self.grid.reachability
+        if reachability is None:
+            self.grid.reachability = reachability = Reachability(
+                self.grid, unblocking=self.unblocking
+            )
+        return reachability.is_reachable(pos, self.agent_pos)
+
+    def gen_obs(self):
+        if self.engine is not None:
+            return self.engine.gen_obs()
+        self.materialize_view()
+        return super().gen_obs()
+
     def _step(self, action):
         return super().step(action)
 
     def step(self, action):
+        if self.engine is not None:
+            return self.engine.step(action)
+
         if action == self.actions.pickup:
             obs, reward, terminated, truncated, info = self.resuce_action.execute(
                 action
@@ -255,5 +917,11 @@ class PickupVictimEnv(SARLevelGen):
                     info["mission_complete"] = True
 
             return obs, reward, terminated, truncated, info
+        elif action == self.actions.toggle:
+            # Toggling mutates the object in place, so re-sync its cell
+            fwd_pos = self.front_pos
+            result = self._step(action)
+            self.grid.refresh(*fwd_pos)
+            return result
         else:
             return self._step(action)
@@ -0,0 +1,101 @@
+import multiprocessing as mp
+from functools import partial
+
+import numpy as np
+
+from ..core.state import encode_rng_state
+from .env import PickupVictimEnv
+
+# Environment of the current worker process, created by _init_worker
+_worker_env = None
+
+
+def encode_level(env):
+    """
+    Encode the level an env has just generated.
+
+    Returns:
+        tuple: (grid, agent, rooms, rng) with the grid as ``Grid.encode``,
+        the agent start as (x, y, direction), the rooms' locked flags as a
+        (num_rows, num_cols) bool array and the env's RNG state after
+        generation (see ``encode_rng_state``)
+    """
+    x, y = env.agent_pos
+    agent = np.array((x, y, env.agent_dir), dtype=np.int16)
+    rooms = np.array(
+        [[room.locked for room in row] for row in env.room_grid], dtype=bool
+    )
+    return env.grid.encode(), agent, rooms, encode_rng_state(env.np_random)
+
+
+def generate_level(env, seed):
+    """
+    Generate the level for one seed.
+
+    The level depends only on the seed: every draw goes through the env's
+    ``np_random``, which ``reset`` reseeds.
+
+    Returns:
+        tuple: (seed, grid, agent, rooms, rng), as ``encode_level``
+    """
+    env.reset(seed=seed)
+    return (seed, *encode_level(env))
+
+
+def _init_worker(env_fn):
+    global _worker_env
+    _worker_env = env_fn()
+
+
+def _generate_in_worker(seed):
+    return generate_level(_worker_env, seed)
+
+
+def generate_levels(
+    seeds,
+    num_workers=None,
+    env_fn=None,
+    ordered=False,
+    chunksize=1,
+    context=None,
+    **env_kwargs,
+):
+    """
+    Generate levels for many seeds over a pool of worker processes.
+
+    Each worker builds one environment and generates the seeds it is handed,
+    so the level for a seed is the same whatever the number of workers or
+    the order the seeds are processed in.
+
+    Args:
+        seeds: Iterable of seeds, one level each
+        num_workers: Number of worker processes (default: CPU count); 1
+            generates in this process
+        env_fn: Optional picklable callable returning a new environment;
+            when not given, PickupVictimEnv(**env_kwargs) is used
+        ordered: Yield levels in seed order instead of as they complete
+        chunksize: Seeds handed to a worker at a time
+        context: Multiprocessing start method ("fork", "spawn", ...)
+        **env_kwargs: Keyword arguments for PickupVictimEnv
+
+    Yields:
+        tuple: (seed, grid, agent, rooms, rng), as ``generate_level``
+    """
+    if env_fn is None:
+        env_fn = partial(PickupVictimEnv, **env_kwargs)
+    if num_workers is None:
+        num_workers = mp.cpu_count()
+
+    if num_workers <= 1:
+        env = env_fn()
+        try:
+            for seed in seeds:
+                yield generate_level(env, seed)
+        finally:
+            env.close()
+        return
+
+    ctx = mp.get_context(context)
+    with ctx.Pool(num_workers, initializer=_init_worker, initargs=(env_fn,)) as pool:
+        imap = pool.imap if ordered else pool.imap_unordered
+        yield from imap(_generate_in_worker, seeds, chunksize)
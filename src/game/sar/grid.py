@@ -0,0 +1,241 @@
+import numpy as np
+from minigrid.core.constants import OBJECT_TO_IDX
+from minigrid.core.grid import Grid
+from minigrid.core.world_object import Door, Key, Lava, Wall
+
+from .objects import FAKE_VICTIMS, REAL_VICTIMS, decode
+
+
+class SARGrid(Grid):
+    """
+    Grid that keeps live bookkeeping of the objects the SAR mission cares about.
+
+    Every ``set`` updates per-category counters and position sets, so that
+    counting or locating victims, fake victims, keys, doors and lava does not
+    require scanning the whole grid.
+
+    With ``arrays=True`` the grid also mirrors its cells into ``uint8`` planes
+    of shape (height, width) holding the type, color and state of each cell,
+    using the same values as ``WorldObj.encode``. ``planes`` stacks them as
+    (height, width, 3); ``pad`` surrounds it with that many rows/columns of
+    wall cells in ``padded``, so views near the border can be sliced without
+    clipping.
+    """
+
+    # Tracked categories and the object types they contain
+    CATEGORIES = {
+        "victim": REAL_VICTIMS,
+        "fake_victim": FAKE_VICTIMS,
+        "key": (Key,),
+        "door": (Door,),
+        "lava": (Lava,),
+    }
+
+    EMPTY = (OBJECT_TO_IDX["empty"], 0, 0)
+    WALL = Wall().encode()
+
+    def __init__(self, width, height, arrays=False, pad=0):
+        super().__init__(width, height)
+        self.positions = {category: set() for category in self.CATEGORIES}
+
+        # Optional Reachability kept up to date by set()
+        self.reachability = None
+        # Cells changed since a TileFramebuffer last drew this grid, or None
+        # while no framebuffer tracks it
+        self.dirty = None
+
+        self.arrays = arrays
+        self.pad = pad
+        if arrays:
+            shape = (height + 2 * pad, width + 2 * pad, 3)
+            padded = np.empty(shape, dtype=np.uint8)
+            padded[...] = self.WALL
+            padded[pad : pad + height, pad : pad + width] = self.EMPTY
+            self._attach_planes(padded)
+
+    def _attach_planes(self, padded):
+        pad = self.pad
+        self.padded = padded
+        self.planes = padded[pad : pad + self.height, pad : pad + self.width]
+        self.types = self.planes[..., 0]
+        self.colors = self.planes[..., 1]
+        self.states = self.planes[..., 2]
+
+    @classmethod
+    def from_grid(cls, grid, arrays=False, pad=0):
+        """
+        Build a tracked grid holding the same objects as an existing grid.
+
+        Args:
+            grid: Grid to copy the cells from
+            arrays: Whether to keep type/color/state planes in sync
+            pad: Wall border around the planes (see class docstring)
+
+        Returns:
+            SARGrid: New grid with bookkeeping initialised from the cells
+        """
+        tracked = cls(grid.width, grid.height, arrays=arrays, pad=pad)
+        for j in range(grid.height):
+            for i in range(grid.width):
+                obj = grid.grid[j * grid.width + i]
+                if obj is not None:
+                    tracked.set(i, j, obj)
+        return tracked
+
+    @classmethod
+    def decode(cls, array, arrays=False, pad=0):
+        """
+        Build a tracked grid from a (width, height, 3) array made by ``encode``.
+
+        Unlike ``Grid.decode`` this knows the victim types, and it fills the
+        walls without going through ``set``.
+
+        Args:
+            array: Encoded grid
+            arrays: Whether to keep type/color/state planes in sync
+            pad: Wall border around the planes (see class docstring)
+
+        Returns:
+            SARGrid: New grid with fresh objects for every cell
+        """
+        width, height, _ = array.shape
+        tracked = cls(width, height, arrays=arrays, pad=pad)
+        types = array[..., 0]
+        cells = tracked.grid
+
+        wall_type = int(cls.WALL[0])
+        for i, j in np.argwhere(types == wall_type).tolist():
+            cells[j * width + i] = decode(*array[i, j].tolist())
+
+        empty = (types == OBJECT_TO_IDX["empty"]) | (types == OBJECT_TO_IDX["unseen"])
+        for i, j in np.argwhere(~empty & (types != wall_type)).tolist():
+            tracked.set(i, j, decode(*array[i, j].tolist()))
+
+        if arrays:
+            tracked.planes[...] = array.transpose(1, 0, 2)
+            tracked.planes[empty.T] = cls.EMPTY
+        return tracked
+
+    @classmethod
+    def category_of(cls, obj_types):
+        """
+        Return the tracked category matching a tuple of object types, if any.
+
+        Args:
+            obj_types: Object type or tuple of object types
+
+        Returns:
+            str or None: Category name, or None if the types are not tracked
+        """
+        if not isinstance(obj_types, tuple):
+            obj_types = (obj_types,)
+        for category, types in cls.CATEGORIES.items():
+            if types == obj_types:
+                return category
+        return None
+
+    def _classify(self, obj):
+        for category, types in self.CATEGORIES.items():
+            if isinstance(obj, types):
+                return category
+        return None
+
+    def set(self, i, j, v):
+        old = self.get(i, j)
+        super().set(i, j, v)
+
+        if old is not None:
+            category = self._classify(old)
+            if category is not None:
+                self.positions[category].discard((i, j))
+        if v is not None:
+            category = self._classify(v)
+            if category is not None:
+                self.positions[category].add((i, j))
+
+        if self.arrays:
+            self.refresh(i, j)
+        elif self.dirty is not None:
+            self.dirty.add((i, j))
+        if self.reachability is not None:
+            self.reachability.update(i, j, v)
+
+    def refresh(self, i, j):
+        """
+        Re-encode cell (i, j) into the array planes.
+
+        Call this after mutating an object in place (e.g. toggling a door),
+        since that does not go through ``set``.
+        """
+        if self.dirty is not None:
+            self.dirty.add((i, j))
+        if not self.arrays:
+            return
+        v = self.grid[j * self.width + i]
+        self.planes[j, i] = self.EMPTY if v is None else v.encode()
+
+    def encode(self, vis_mask=None):
+        """Encode the grid like ``Grid.encode``, reading from the planes."""
+        if not self.arrays:
+            return super().encode(vis_mask)
+
+        array = self.planes.transpose(1, 0, 2).copy()
+        if vis_mask is not None:
+            array[~vis_mask] = 0
+        return array
+
+    def get_state(self):
+        """
+        Snapshot the bookkeeping, door flags, key positions and planes (see
+        ``EnvState``).
+
+        The cells themselves are captured by the caller.
+        """
+        doors = tuple(
+            (door, door.is_open, door.is_locked)
+            for door in (
+                self.grid[j * self.width + i] for i, j in self.positions["door"]
+            )
+        )
+        # Keys are the only tracked objects that can be carried and dropped
+        keys = tuple(
+            (self.grid[j * self.width + i], (i, j)) for i, j in self.positions["key"]
+        )
+        positions = tuple(frozenset(cells) for cells in self.positions.values())
+        padded = None
+        if self.arrays:
+            padded = self.padded.copy()
+            padded.flags.writeable = False
+        return doors, keys, positions, self.pad, padded
+
+    def set_state(self, state):
+        """Restore a snapshot from ``get_state`` after the cells were restored."""
+        doors, keys, positions, pad, padded = state
+        for door, is_open, is_locked in doors:
+            door.is_open = is_open
+            door.is_locked = is_locked
+        for key, pos in keys:
+            key.cur_pos = pos
+        for category, cells in zip(self.positions, positions):
+            self.positions[category] = set(cells)
+        if self.reachability is not None:
+            self.reachability.stale = True
+        # Every cell may have changed
+        self.dirty = None
+
+        if padded is None:
+            self.arrays = False
+        elif self.arrays and self.pad == pad and self.padded.shape == padded.shape:
+            np.copyto(self.padded, padded)
+        else:
+            self.arrays = True
+            self.pad = pad
+            self._attach_planes(padded.copy())
+
+    def count(self, category):
+        """Number of objects of a tracked category currently on the grid."""
+        return len(self.positions[category])
+
+    def find(self, category):
+        """Objects of a tracked category, ordered by position."""
+        return [self.get(i, j) for i, j in sorted(self.positions[category])]
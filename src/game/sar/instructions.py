@@ -72,16 +72,18 @@ class PickupAllVictimsInstr(Instr):
     This instruction verifies that all victims have been picked up (removed from grid).
     """
 
-    def __init__(self, victims):
+    def __init__(self, victims, num_victims=None):
         """
         Initialize instruction with list of victim objects to pick up.
 
         Args:
             victims: List of victim objects that need to be picked up
+            num_victims: Total number of victims, if more than ``victims``
+                (rooms a lazy env has not filled yet)
         """
         self.victims = victims
         self.victim_types = [type(v) for v in victims]
-        self.num_victims = len(victims)
+        self.num_victims = len(victims) if num_victims is None else num_victims
 
     def verify(self, action):
         """
@@ -93,8 +95,10 @@ class PickupAllVictimsInstr(Instr):
         Returns:
             str: 'success' if all victims picked up, 'continue' otherwise
         """
-        # Use utility method to count remaining victims
+        # Use utility method to count remaining victims, including those of
+        # rooms not filled yet
         remaining_victims = self.env._count_objects_by_type(REAL_VICTIMS)
+        remaining_victims += getattr(self.env, "pending_victims", 0)
 
         # All victims have been picked up
         if remaining_victims == 0:
@@ -0,0 +1,356 @@
+from minigrid.core.world_object import Door, Key
+from minigrid.envs.babyai.core.roomgrid_level import RejectSampling
+
+from .instructions import PickupAllVictimsInstr
+from .objects import FAKE_VICTIMS, REAL_VICTIMS
+from .utils import LavaPlacer
+
+
+class LevelMutator:
+    """
+    Small in-place edits of a generated PickupVictimEnv level.
+
+    Curriculum methods such as prioritized level replay need many close
+    variants of a level; regenerating one through ``gen_mission`` costs a
+    full reset. Each edit here touches one or two rooms instead:
+
+    - ``add(kind)``, ``remove(pos)``, ``move(pos)`` for victims, fake
+      victims and lava
+    - ``toggle_lock(door_pos)`` locks an unlocked door and puts a key for it
+      in a room the agent can reach, or unlocks a locked door and removes
+      its key
+
+    New objects go through ``place_in_room`` (with ``strict``) and
+    ``LavaPlacer.place_in_room``, so they only go where the room-local
+    reachability checks of generation accept them, never in a forced cell;
+    an edit with nowhere safe to go is not made. Removing an object only
+    ever joins components. Every locked door
+    keeps a key the agent can get to without going through it.
+
+    Edit a freshly reset level, before the agent acts; the instruction is
+    rebuilt after each edit that changes the victims. Store a variant with
+    ``encode_level`` (e.g. into a LevelPool) to replay it.
+    """
+
+    KINDS = ("victim", "fake_victim", "lava")
+    OPS = ("add", "remove", "move", "toggle_lock")
+
+    def __init__(self, env):
+        self.env = env
+
+    # Edits -----------------------------------------------------------------
+
+    def add(self, kind, room=None):
+        """
+        Add a victim, fake victim or lava tile.
+
+        Args:
+            kind: "victim", "fake_victim" or "lava"
+            room: Room (i, j) to add it to (default: a random room)
+
+        Returns:
+            tuple or None: Position of the new object, or None if the room
+            had no cell it could go in
+        """
+        env = self.env
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown kind: {kind!r}")
+        i, j = room if room is not None else self._random_room()
+        # Fill a lazy room first, so its contents are not drawn on top later
+        env.materialize_room(i, j)
+
+        if kind == "lava":
+            placer = env.lava_placer if env.add_lava else LavaPlacer()
+            if not placer.place_in_room(env, i, j, 1):
+                return None
+            return tuple(env.get_room(i, j).objs[-1].cur_pos)
+
+        placer = env.victim_placer
+        if kind == "victim":
+            obj = placer.victim_for(env, env.get_room(i, j))
+        else:
+            obj = placer.make_fake_victim(env)
+        try:
+            _, pos = env.place_in_room(i, j, obj, strict=True)
+        except RejectSampling:
+            return None
+        if pos is None:
+            return None
+        if kind == "victim":
+            self._refresh_instrs()
+        return tuple(pos)
+
+    def remove(self, pos):
+        """
+        Remove the victim, fake victim or lava tile at ``pos``.
+
+        Returns:
+            WorldObj: The removed object
+        """
+        env = self.env
+        obj = env.grid.get(*pos)
+        if obj is None or self._kind(obj) is None:
+            raise ValueError(f"No victim, fake victim or lava at {tuple(pos)}")
+        env.grid.set(*pos, None)
+        objs = env.room_from_pos(*pos).objs
+        if obj in objs:
+            objs.remove(obj)
+        if self._kind(obj) == "victim":
+            self._refresh_instrs()
+        return obj
+
+    def move(self, pos, room=None):
+        """
+        Move the object at ``pos`` to another cell.
+
+        Args:
+            pos: Position of a victim, fake victim or lava tile
+            room: Room (i, j) to move it to (default: a random room)
+
+        Returns:
+            tuple or None: New position, or None if no cell was found (the
+            object is then put back)
+        """
+        env = self.env
+        obj = env.grid.get(*pos)
+        kind = None if obj is None else self._kind(obj)
+        if kind is None:
+            raise ValueError(f"No victim, fake victim or lava at {tuple(pos)}")
+        i, j = room if room is not None else self._random_room()
+        env.materialize_room(i, j)
+
+        self.remove(pos)
+        if kind == "lava":
+            new_pos = self.add("lava", (i, j))
+            if new_pos is None:
+                self._put_back(pos, obj)
+            return new_pos
+
+        try:
+            _, new_pos = env.place_in_room(i, j, obj, strict=True)
+        except RejectSampling:
+            new_pos = None
+        if new_pos is None:
+            self._put_back(pos, obj)
+        if kind == "victim":
+            self._refresh_instrs()
+        return None if new_pos is None else tuple(new_pos)
+
+    def toggle_lock(self, door_pos):
+        """
+        Lock an unlocked door or unlock a locked one.
+
+        Locking places a key of the door's colour in a room the agent can
+        reach through unlocked doors; unlocking removes a key of that colour
+        the level stays ``solvable`` without. Every room the agent can no
+        longer reach through unlocked doors (``reachable_rooms``) is then
+        marked locked, and every other room unlocked.
+
+        Returns:
+            tuple or None: Position of the new key when locking, or of the
+            removed key when unlocking (None if no key could go)
+        """
+        env = self.env
+        door = env.grid.get(*door_pos)
+        if not isinstance(door, Door):
+            raise ValueError(f"No door at {tuple(door_pos)}")
+        if tuple(door_pos) == tuple(env.agent_pos):
+            raise ValueError("Cannot lock the door the agent stands in")
+
+        if door.is_locked:
+            door.is_locked = False
+            env.grid.refresh(*door_pos)
+            key_pos = self._take_key(door.color)
+        else:
+            door.is_locked = True
+            door.is_open = False
+            env.grid.refresh(*door_pos)
+            key_pos = self._give_key(door.color)
+            if key_pos is None:
+                door.is_locked = False
+                env.grid.refresh(*door_pos)
+                raise RejectSampling("no free cell for the key in reach")
+        self._update_locked_rooms()
+        return key_pos
+
+    def mutate(self, num_mutations=1):
+        """
+        Apply random edits, drawn with the env's RNG.
+
+        Operations that cannot apply (nothing to remove, no door to toggle,
+        no free cell) are skipped.
+
+        Returns:
+            list: (op, target, result) for each edit made
+        """
+        env = self.env
+        applied = []
+        for _ in range(num_mutations):
+            op = env._rand_elem(self.OPS)
+            if op == "toggle_lock":
+                doors = [
+                    pos for pos in env.grid.positions["door"]
+                    if pos != tuple(env.agent_pos)
+                ]
+                if not doors:
+                    continue
+                target = env._rand_elem(sorted(doors))
+                try:
+                    result = self.toggle_lock(target)
+                except RejectSampling:
+                    continue
+            elif op == "add":
+                target = env._rand_elem(self.KINDS)
+                result = self.add(target)
+                if result is None:
+                    continue
+            else:
+                positions = self.positions(env._rand_elem(self.KINDS))
+                if not positions:
+                    continue
+                target = env._rand_elem(positions)
+                if op == "remove":
+                    result = self.remove(target)
+                else:
+                    result = self.move(target)
+                    if result is None:
+                        continue
+            applied.append((op, target, result))
+        return applied
+
+    # Queries ---------------------------------------------------------------
+
+    def positions(self, kind):
+        """Sorted positions of every object of ``kind`` on the grid."""
+        return sorted(self.env.grid.positions[kind])
+
+    def reachable_rooms(self):
+        """Rooms the agent can reach through unlocked doors, as (i, j)."""
+        env = self.env
+        start = env.room_from_pos(*env.agent_pos)
+        index = {id(room): (i, j) for i, j, room in env._rooms()}
+        seen = {id(start)}
+        queue = [start]
+        for room in queue:
+            for door, neighbor in zip(room.doors, room.neighbors):
+                if door is None or door.is_locked or id(neighbor) in seen:
+                    continue
+                seen.add(id(neighbor))
+                queue.append(neighbor)
+        return [index[id(room)] for room in queue]
+
+    def solvable(self):
+        """
+        Whether the agent can get into every room, opening locked doors with
+        the keys found in the rooms reached on the way (or carried).
+        """
+        env = self.env
+        colors = {}
+        for pos in env.grid.positions["key"]:
+            room = env.room_from_pos(*pos)
+            colors.setdefault(id(room), set()).add(env.grid.get(*pos).color)
+        held = set()
+        if env.carrying is not None and env.carrying.type == "key":
+            held.add(env.carrying.color)
+
+        start = env.room_from_pos(*env.agent_pos)
+        held |= colors.get(id(start), set())
+        seen = {id(start)}
+        queue = [start]
+        waiting = []
+        while queue:
+            room = queue.pop()
+            for door, neighbor in zip(room.doors, room.neighbors):
+                if door is None or id(neighbor) in seen:
+                    continue
+                if door.is_locked and door.color not in held:
+                    waiting.append((door, neighbor))
+                    continue
+                seen.add(id(neighbor))
+                queue.append(neighbor)
+                held |= colors.get(id(neighbor), set())
+            if not queue:
+                # Doors whose key turned up since they were first met
+                queue = [
+                    neighbor for door, neighbor in waiting
+                    if door.color in held and id(neighbor) not in seen
+                ]
+                seen.update(id(neighbor) for neighbor in queue)
+                for neighbor in queue:
+                    held |= colors.get(id(neighbor), set())
+                waiting = [item for item in waiting if item[0].color not in held]
+        return len(seen) == env.num_rows * env.num_cols
+
+    # Helpers ---------------------------------------------------------------
+
+    def _kind(self, obj):
+        if isinstance(obj, REAL_VICTIMS):
+            return "victim"
+        if isinstance(obj, FAKE_VICTIMS):
+            return "fake_victim"
+        if obj.type == "lava":
+            return "lava"
+        return None
+
+    def _random_room(self):
+        env = self.env
+        return env._rand_int(0, env.num_cols), env._rand_int(0, env.num_rows)
+
+    def _put_back(self, pos, obj):
+        env = self.env
+        env.grid.set(*pos, obj)
+        obj.init_pos = obj.cur_pos = tuple(pos)
+        env.room_from_pos(*pos).objs.append(obj)
+
+    def _give_key(self, color):
+        env = self.env
+        rooms = self.reachable_rooms()
+        order = env.np_random.permutation(len(rooms))
+        for k in order:
+            i, j = rooms[k]
+            try:
+                _, pos = env.place_in_room(i, j, Key(color), strict=True)
+            except RejectSampling:
+                continue
+            if pos is not None:
+                return tuple(pos)
+        return None
+
+    def _take_key(self, color):
+        env = self.env
+        keys = sorted(
+            pos for pos in env.grid.positions["key"]
+            if env.grid.get(*pos).color == color
+        )
+        if not keys:
+            return None
+        # Another locked door of the colour may still need a given key
+        for k in env.np_random.permutation(len(keys)):
+            pos = keys[k]
+            key = env.grid.get(*pos)
+            env.grid.set(*pos, None)
+            if self.solvable():
+                objs = env.room_from_pos(*pos).objs
+                if key in objs:
+                    objs.remove(key)
+                return pos
+            env.grid.set(*pos, key)
+        return None
+
+    def _update_locked_rooms(self):
+        # Locked rooms are those the agent cannot get into without a key;
+        # in a chain, unlocking the inner door leaves both rooms locked
+        env = self.env
+        reachable = set(self.reachable_rooms())
+        for i, j, room in env._rooms():
+            room.locked = (i, j) not in reachable
+
+    def _refresh_instrs(self):
+        env = self.env
+        victims = env.get_all_victims()
+        env.instrs = PickupAllVictimsInstr(
+            victims, num_victims=len(victims) + env.pending_victims
+        )
+        env.instrs.reset_verifier(env)
+        env.surface = env.instrs.surface(env)
+        env.mission = env.surface
@@ -1,6 +1,7 @@
-from minigrid.core.constants import COLORS, IDX_TO_OBJECT, OBJECT_TO_IDX
+from minigrid.core.constants import COLORS, IDX_TO_COLOR, IDX_TO_OBJECT, OBJECT_TO_IDX
 from minigrid.core.world_object import WorldObj
-from minigrid.utils.rendering import fill_coords, point_in_rect
+
+from ..core.atlas import TILE_ATLAS, rects_mask
 
 # Register new objects
 new_objects = [
@@ -35,9 +36,13 @@ class VictimBase(WorldObj):
         return True
 
     def render(self, img):
-        """Render the victim using defined coordinates."""
-        for coords in self._get_render_coords():
-            fill_coords(img, point_in_rect(*coords), COLORS[self.color])
+        """
+        Render the victim using defined coordinates.
+
+        The rectangles' pixels are computed once per image size (see
+        ``rects_mask``), not with a per-pixel predicate on every call.
+        """
+        img[rects_mask(self._get_render_coords(), *img.shape[:2])] = COLORS[self.color]
         return img
 
     def _get_render_coords(self):
@@ -189,3 +194,18 @@ FakeVictimRightRight = FakeVictims.RIGHT_RIGHT
 REAL_VICTIMS = (Victim,)
 FAKE_VICTIMS = (FakeVictim,)
 ALL_VICTIMS = REAL_VICTIMS + FAKE_VICTIMS
+
+
+def decode(type_idx, color_idx, state):
+    """``WorldObj.decode`` that also knows the victim types registered above."""
+    name = IDX_TO_OBJECT[type_idx]
+    if name.startswith("victim_"):
+        return Victim(name[len("victim_") :], IDX_TO_COLOR[color_idx])
+    if name.startswith("fake_victim_"):
+        shift, direction = name[len("fake_victim_") :].split("_")
+        return FakeVictim(shift, direction, IDX_TO_COLOR[color_idx])
+    return WorldObj.decode(type_idx, color_idx, state)
+
+
+# Let the shared tile atlas rebuild victims from their codes
+TILE_ATLAS.decode = decode
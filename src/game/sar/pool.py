@@ -0,0 +1,424 @@
+import json
+import multiprocessing as mp
+import queue
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+
+from .env import PickupVictimEnv
+from .generation import encode_level, generate_level, generate_levels
+from .utils import LavaPlacer, VictimPlacer
+
+
+def env_config(env):
+    """
+    Generation settings of a PickupVictimEnv, as stored with a level pool.
+
+    Levels from a pool are only valid for envs with the same settings. The
+    placers are recorded by class as well as by their parameters, since a
+    subclass may place objects differently with the same ones.
+    """
+    placer = env.victim_placer
+    config = {
+        "room_size": env.room_size,
+        "num_rows": env.num_rows,
+        "num_cols": env.num_cols,
+        "unblocking": env.unblocking,
+        "locked_room_prob": env.locked_room_prob,
+        "victim_placer": _class_name(placer),
+        "num_real_victims": placer.num_real_victims,
+        "num_fake_victims": placer.num_fake_victims,
+        "important_victim": placer.important_victim,
+        "add_lava": env.add_lava,
+    }
+    if env.add_lava:
+        config["lava_placer"] = _class_name(env.lava_placer)
+        config["lava_per_room"] = env.lava_placer.lava_per_room
+        config["lava_probability"] = env.lava_placer.lava_probability
+    return config
+
+
+def _class_name(obj):
+    cls = obj if isinstance(obj, type) else type(obj)
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _env_kwargs(config):
+    """
+    PickupVictimEnv keyword arguments reproducing the settings ``config``
+    records (see ``env_config``).
+
+    Raises:
+        ValueError: If the config names placer classes other than the
+            defaults, which cannot be rebuilt from their parameters
+    """
+    placers = [("victim_placer", VictimPlacer)]
+    if config["add_lava"]:
+        placers.append(("lava_placer", LavaPlacer))
+    for key, cls in placers:
+        if config[key] != _class_name(cls):
+            raise ValueError(
+                f"Level pool uses {config[key]}; pass env_fn to refill it"
+            )
+
+    kwargs = {
+        key: config[key]
+        for key in (
+            "room_size", "num_rows", "num_cols", "unblocking", "locked_room_prob"
+        )
+    }
+    kwargs["victim_placer"] = VictimPlacer(
+        num_fake_victims=config["num_fake_victims"],
+        num_real_victims=config["num_real_victims"],
+        important_victim=config["important_victim"],
+    )
+    kwargs["add_lava"] = config["add_lava"]
+    if config["add_lava"]:
+        kwargs["lava_per_room"] = config["lava_per_room"]
+        kwargs["lava_probability"] = config["lava_probability"]
+    kwargs["render_mode"] = None
+    return kwargs
+
+
+def _refill_worker(env_fn, seeds, levels, stop):
+    env = env_fn()
+    for seed in seeds:
+        if stop.is_set():
+            break
+        levels.put(generate_level(env, seed))
+    levels.put(None)
+    env.close()
+
+
+class LevelPool:
+    """
+    Pre-generated PickupVictimEnv levels, keyed by the seed each one was
+    generated with.
+
+    A level is its encoded grid (as ``Grid.encode``), the agent's start, the
+    rooms' locked flags and the env's RNG state after generating it (see
+    ``encode_level``), a few hundred bytes. ``save`` writes a pool as a
+    directory of ``.npy`` files and ``load`` memory-maps them, so a pool can
+    be larger than memory and shared by every env on a host.
+
+    Attach a pool with ``PickupVictimEnv(level_pool=pool)``. ``reset(seed=s)``
+    then loads level s if the pool has it (a hit), and otherwise generates it
+    as usual and adds it to the pool (a miss); ``reset()`` without a seed
+    samples a stored level with the env's RNG. Either way a hit skips level
+    generation and its rejection sampling entirely.
+    """
+
+    FORMAT_VERSION = 2
+
+    def __init__(self, width, height, config=None):
+        """
+        Create an empty pool.
+
+        Args:
+            width, height: Grid size of the levels
+            config: Generation settings (see ``env_config``), or None to
+                accept any env with the right grid size
+        """
+        self.width = width
+        self.height = height
+        self.config = config
+        self._grids = np.empty((0, width, height, 3), dtype=np.uint8)
+        self._agents = np.empty((0, 3), dtype=np.int16)
+        self._rooms = np.empty((0, 0, 0), dtype=bool)
+        self._rngs = np.empty((0, 6), dtype=np.uint64)
+        self._seeds = np.empty(0, dtype=np.int64)
+        # Levels added since construction or load, after the stored ones
+        self._extra = []
+        self._index = {}
+
+        self.hits = 0
+        self.misses = 0
+
+        self._refill = None
+
+    @classmethod
+    def for_env(cls, env):
+        """Empty pool matching an env's grid size and settings."""
+        return cls(env.width, env.height, env_config(env))
+
+    @classmethod
+    def generate(cls, num_levels, seed=0, num_workers=1, env_fn=None, **env_kwargs):
+        """
+        Generate levels for seeds ``seed`` .. ``seed + num_levels - 1``.
+
+        Args:
+            num_levels: Number of levels
+            seed: First seed
+            num_workers: Worker processes to generate with (see
+                ``generate_levels``); the pool is the same for any number
+            env_fn: Optional picklable callable returning a new environment;
+                when not given, PickupVictimEnv(**env_kwargs) is used
+            **env_kwargs: Keyword arguments for PickupVictimEnv
+
+        Returns:
+            LevelPool: Pool holding the new levels
+        """
+        if env_fn is None:
+            env_fn = partial(PickupVictimEnv, **env_kwargs)
+        probe = env_fn()
+        pool = cls.for_env(probe)
+        probe.close()
+
+        seeds = range(seed, seed + num_levels)
+        for level in generate_levels(
+            seeds, num_workers=num_workers, env_fn=env_fn, ordered=True
+        ):
+            pool.add(*level)
+        return pool
+
+    # Storage ---------------------------------------------------------------
+
+    def __len__(self):
+        return len(self._seeds) + len(self._extra)
+
+    def __contains__(self, seed):
+        return seed in self._index
+
+    def add(self, seed, grid, agent, rooms, rng):
+        """Add the level generated with ``seed``; known seeds are ignored."""
+        if seed in self._index:
+            return
+        if grid.shape != (self.width, self.height, 3):
+            raise ValueError(
+                f"Level of shape {grid.shape} does not fit a "
+                f"{self.width}x{self.height} pool"
+            )
+        self._index[seed] = len(self)
+        self._extra.append((seed, grid, agent, rooms, rng))
+
+    def level(self, row):
+        """(grid, agent, rooms, rng) arrays of the level stored at ``row``."""
+        stored = len(self._seeds)
+        if row < stored:
+            return (
+                self._grids[row],
+                self._agents[row],
+                self._rooms[row],
+                self._rngs[row],
+            )
+        return self._extra[row - stored][1:]
+
+    def save(self, path):
+        """
+        Write the pool to a directory, creating it if needed.
+
+        Args:
+            path: Directory to write grids.npy, agents.npy, rooms.npy,
+                rngs.npy, seeds.npy and meta.json into
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        seeds, grids, agents = self._seeds, self._grids, self._agents
+        rooms, rngs = self._rooms, self._rngs
+        if self._extra:
+            extra = list(zip(*self._extra))
+            seeds = np.concatenate([seeds, np.array(extra[0], dtype=np.int64)])
+            grids = np.concatenate([grids, np.stack(extra[1])])
+            agents = np.concatenate([agents, np.stack(extra[2])])
+            # The room grid's shape is only known once a level is added
+            extra_rooms = np.stack(extra[3])
+            rooms = np.concatenate([rooms, extra_rooms]) if len(rooms) else extra_rooms
+            rngs = np.concatenate([rngs, np.stack(extra[4])])
+
+        np.save(path / "grids.npy", grids.astype(np.uint8, copy=False))
+        np.save(path / "agents.npy", agents.astype(np.int16, copy=False))
+        np.save(path / "rooms.npy", rooms.astype(bool, copy=False))
+        np.save(path / "rngs.npy", rngs.astype(np.uint64, copy=False))
+        np.save(path / "seeds.npy", seeds.astype(np.int64, copy=False))
+        meta = {
+            "version": self.FORMAT_VERSION,
+            "width": self.width,
+            "height": self.height,
+            "config": self.config,
+        }
+        (path / "meta.json").write_text(json.dumps(meta, indent=2) + "\n")
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        Load a pool written by ``save``.
+
+        Args:
+            path: Pool directory
+            mmap: Memory-map the level arrays instead of reading them
+
+        Returns:
+            LevelPool: The loaded pool
+        """
+        path = Path(path)
+        meta = json.loads((path / "meta.json").read_text())
+        if meta.get("version") != cls.FORMAT_VERSION:
+            raise ValueError(f"Unsupported level pool version: {meta.get('version')}")
+
+        pool = cls(meta["width"], meta["height"], meta["config"])
+        mode = "r" if mmap else None
+        pool._grids = np.load(path / "grids.npy", mmap_mode=mode)
+        pool._agents = np.load(path / "agents.npy", mmap_mode=mode)
+        pool._rooms = np.load(path / "rooms.npy", mmap_mode=mode)
+        pool._rngs = np.load(path / "rngs.npy", mmap_mode=mode)
+        pool._seeds = np.load(path / "seeds.npy")
+        pool._index = {seed: row for row, seed in enumerate(pool._seeds.tolist())}
+        return pool
+
+    # Lookup ----------------------------------------------------------------
+
+    def check(self, env):
+        """
+        Raise ValueError if the pool's levels do not fit an env.
+
+        Args:
+            env: PickupVictimEnv the pool is attached to
+        """
+        if (env.width, env.height) != (self.width, self.height):
+            raise ValueError(
+                f"Level pool holds {self.width}x{self.height} levels, "
+                f"env is {env.width}x{env.height}"
+            )
+        if self.config is not None and env_config(env) != self.config:
+            raise ValueError(
+                f"Level pool was generated with {self.config}, "
+                f"env uses {env_config(env)}"
+            )
+
+    def get(self, seed, rng):
+        """
+        Level for a reset, counting the hit or miss.
+
+        Args:
+            seed: Reset seed, or None to sample any stored level
+            rng: numpy Generator used for sampling
+
+        Returns:
+            tuple or None: (grid, agent, rooms, rng) arrays, or None on a miss
+        """
+        self.poll()
+        if seed is None:
+            row = int(rng.integers(len(self))) if len(self) else None
+        else:
+            row = self._index.get(seed)
+
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self.level(row)
+
+    def record(self, seed, env):
+        """Add the level ``env`` just generated for a missed seed."""
+        if seed is not None:
+            self.add(seed, *encode_level(env))
+
+    def stats(self):
+        """
+        Pool size and hit/miss counts.
+
+        Returns:
+            dict: size, hits, misses, hit_rate and whether a refill is running
+        """
+        self.poll()
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "refilling": self.refilling,
+        }
+
+    # Background refill -----------------------------------------------------
+
+    def start_refill(
+        self, num_levels, seed=None, env_fn=None, context=None, **env_kwargs
+    ):
+        """
+        Generate more levels in a background process.
+
+        New levels are added as they arrive, on the next ``get``, ``stats``
+        or ``poll`` call.
+
+        Args:
+            num_levels: Number of levels to generate
+            seed: First seed (default: one past the largest stored seed)
+            env_fn: Optional picklable callable returning a new environment;
+                when not given, PickupVictimEnv(**env_kwargs) is used, or
+                an env with the pool's own settings if there are no
+                ``env_kwargs``
+            context: Multiprocessing start method ("fork", "spawn", ...)
+            **env_kwargs: Keyword arguments for PickupVictimEnv
+
+        Raises:
+            ValueError: If the refill env does not fit the pool (see
+                ``check``), or the pool's settings cannot be rebuilt
+        """
+        if self.refilling:
+            raise RuntimeError("A refill is already running")
+        if env_fn is None:
+            if not env_kwargs and self.config is not None:
+                env_kwargs = _env_kwargs(self.config)
+            env_fn = partial(PickupVictimEnv, **env_kwargs)
+        # Fail here rather than in a later reset's poll
+        probe = env_fn()
+        try:
+            self.check(probe)
+        finally:
+            probe.close()
+        if seed is None:
+            seed = max(self._index, default=-1) + 1
+        seeds = [s for s in range(seed, seed + num_levels) if s not in self._index]
+
+        ctx = mp.get_context(context)
+        levels = ctx.Queue()
+        stop = ctx.Event()
+        process = ctx.Process(
+            target=_refill_worker, args=(env_fn, seeds, levels, stop), daemon=True
+        )
+        process.start()
+        self._refill = (process, levels, stop)
+
+    @property
+    def refilling(self):
+        return self._refill is not None
+
+    def poll(self, timeout=None):
+        """
+        Add the levels the refill process has produced so far.
+
+        Args:
+            timeout: Seconds to wait for each further level until the
+                refill finishes, or None to only take what is ready
+
+        Returns:
+            int: Number of levels added
+        """
+        if self._refill is None:
+            return 0
+        process, levels, _ = self._refill
+        added = 0
+        while True:
+            try:
+                item = levels.get(timeout=timeout) if timeout else levels.get_nowait()
+            except queue.Empty:
+                if not process.is_alive():
+                    # Exited without finishing (killed or crashed)
+                    self._refill = None
+                return added
+            if item is None:
+                process.join()
+                self._refill = None
+                return added
+            self.add(*item)
+            added += 1
+
+    def stop_refill(self):
+        """Stop the refill process, keeping the levels it already produced."""
+        if self._refill is None:
+            return
+        self._refill[2].set()
+        while self._refill is not None:
+            self.poll(timeout=1)
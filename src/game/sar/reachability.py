@@ -0,0 +1,460 @@
+"""
+Reachability helpers for level generation.
+
+A cell is passable when it is empty or holds a door, as in
+``RoomGridLevel.check_objs_reachable``: every other object blocks movement,
+but is itself reachable when one of its 4-neighbours is. With
+``unblocking=True`` objects the agent can pick up (keys, victims, ...) are
+passable too, since it can move them out of the way.
+"""
+
+import numpy as np
+
+from minigrid.envs.babyai.core.roomgrid_level import RejectSampling
+
+# The 8 cells around a cell, in clockwise order starting top-left. The
+# 4-neighbours sit at the odd indices, each corner between two of them.
+RING = ((-1, -1), (0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0))
+NEIGHBORS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+def _ring_groups(ring):
+    """Groups of passable 4-neighbours joined through passable corners."""
+    sides = ring[1] + ring[3] + ring[5] + ring[7]
+    joins = (
+        (ring[1] and ring[2] and ring[3])
+        + (ring[3] and ring[4] and ring[5])
+        + (ring[5] and ring[6] and ring[7])
+        + (ring[7] and ring[0] and ring[1])
+    )
+    return 1 if sides == 4 and joins == 4 else sides - joins
+
+
+def is_passable(grid, x, y):
+    """Whether the agent can walk through cell (x, y)."""
+    if x < 0 or y < 0 or x >= grid.width or y >= grid.height:
+        return False
+    cell = grid.grid[y * grid.width + x]
+    return cell is None or cell.type == "door"
+
+
+def can_block(grid, x, y):
+    """
+    Whether a blocking object (e.g. lava) can go in passable cell (x, y)
+    without cutting anything off.
+
+    The test is local and conservative: the cell's passable 4-neighbours must
+    stay connected to each other through the 8 cells around it, so any path
+    through (x, y) can go around it instead, and every object next to it must
+    keep another passable neighbour. If all objects were reachable from the
+    agent's start before, they still are afterwards, wherever the agent is
+    placed among the passable cells.
+
+    Args:
+        grid: Grid to test
+        x, y: Cell to block
+
+    Returns:
+        bool: True if blocking the cell keeps every cell reachable
+    """
+    ring = [is_passable(grid, x + dx, y + dy) for dx, dy in RING]
+    if _ring_groups(ring) != 1:
+        return False
+
+    # Objects next to the cell must keep another way in
+    for dx, dy in NEIGHBORS:
+        nx, ny = x + dx, y + dy
+        if is_passable(grid, nx, ny):
+            continue
+        cell = grid.get(nx, ny)
+        if cell is None or cell.type == "wall":
+            continue
+        if not any(
+            is_passable(grid, nx + ex, ny + ey)
+            for ex, ey in NEIGHBORS
+            if (nx + ex, ny + ey) != (x, y)
+        ):
+            return False
+
+    return True
+
+
+def reachable_cells(grid, start):
+    """
+    Cells reachable from ``start``, as in ``check_objs_reachable``.
+
+    Blocking objects are included (they can be reached) but not expanded.
+
+    Returns:
+        set: (x, y) positions
+    """
+    reachable = set()
+    stack = [tuple(start)]
+    while stack:
+        x, y = stack.pop()
+        if (x, y) in reachable or not (0 <= x < grid.width and 0 <= y < grid.height):
+            continue
+        reachable.add((x, y))
+        if not is_passable(grid, x, y) and (x, y) != tuple(start):
+            continue
+        stack.extend((x + dx, y + dy) for dx, dy in NEIGHBORS)
+    return reachable
+
+
+class Reachability:
+    """
+    Passability bitmap and connected components of a grid, kept up to date
+    as cells change.
+
+    Components are a union-find over passable cells. Opening a cell (adding
+    a door, removing an object) merges components exactly. Blocking a cell
+    whose passable neighbours stay joined around it (the ``can_block`` test)
+    cannot split a component, so it needs no work either. With ``window``
+    set, a block failing that test is also safe if its neighbours stay
+    joined by a path within ``window`` cells of it. Any other block marks
+    the structure stale, and it is rebuilt on the next query. The placers
+    only make safe blocks, so during generation queries cost O(1) amortized
+    and never grow with the size of the grid.
+
+    Attach it to a ``SARGrid`` by setting ``grid.reachability``; every
+    ``grid.set`` then calls ``update``. Code that writes cells without
+    ``set`` should set ``stale`` so everything is recomputed.
+    """
+
+    def __init__(self, grid, unblocking=False, window=0):
+        """
+        Args:
+            grid: Grid to track
+            unblocking: Treat objects the agent can pick up as passable
+            window: Radius of the search joining the neighbours of a cell
+                when the 8 cells around it do not (0: ring test only). A
+                room's size covers the whole room around any of its cells.
+        """
+        self.grid = grid
+        self.window = window
+        self.unblocking = unblocking
+        self.width = grid.width
+        self.height = grid.height
+        self.rebuild()
+
+    def _passable_obj(self, obj):
+        if obj is None or obj.type == "door":
+            return True
+        return self.unblocking and obj.can_pickup()
+
+    def rebuild(self):
+        """Recompute the bitmap, the object set and the components."""
+        width = self.width
+        cells = self.grid.grid
+        passable = bytearray(self._passable_obj(obj) for obj in cells)
+        self.passable = passable
+        # Cell -> union-find node; a reopened cell gets a fresh node, since
+        # its old one may still link other cells together
+        self.node = list(range(len(cells)))
+        self.parent = list(range(len(cells)))
+        self.objects = {
+            (k % width, k // width)
+            for k, obj in enumerate(cells)
+            if obj is not None and obj.type != "wall"
+        }
+
+        for k in range(len(cells)):
+            if not passable[k]:
+                continue
+            if k % width + 1 < width and passable[k + 1]:
+                self._union(k, k + 1)
+            if k + width < len(cells) and passable[k + width]:
+                self._union(k, k + width)
+        self.stale = False
+
+    @property
+    def bitmap(self):
+        """Passability as a (height, width) boolean array (read-only view)."""
+        array = np.frombuffer(bytes(self.passable), dtype=bool)
+        return array.reshape(self.height, self.width)
+
+    # Union-find ------------------------------------------------------------
+
+    def _find(self, k):
+        parent = self.parent
+        while parent[k] != k:
+            parent[k] = parent[parent[k]]
+            k = parent[k]
+        return k
+
+    def _union(self, a, b):
+        """Join the components of cells a and b."""
+        ra, rb = self._find(self.node[a]), self._find(self.node[b])
+        if ra != rb:
+            self.parent[rb] = ra
+
+    # Updates ---------------------------------------------------------------
+
+    def is_passable(self, x, y):
+        if x < 0 or y < 0 or x >= self.width or y >= self.height:
+            return False
+        return bool(self.passable[y * self.width + x])
+
+    def update(self, x, y, obj):
+        """Record that cell (x, y) now holds ``obj``."""
+        k = y * self.width + x
+        if obj is None or obj.type == "wall":
+            self.objects.discard((x, y))
+        else:
+            self.objects.add((x, y))
+
+        now = self._passable_obj(obj)
+        if now == bool(self.passable[k]):
+            return
+
+        self.passable[k] = now
+        if self.stale:
+            return
+        if now:
+            self.node[k] = len(self.parent)
+            self.parent.append(self.node[k])
+            for dx, dy in NEIGHBORS:
+                if self.is_passable(x + dx, y + dy):
+                    self._union(k, (y + dy) * self.width + x + dx)
+        else:
+            ring = [self.is_passable(x + dx, y + dy) for dx, dy in RING]
+            if _ring_groups(ring) > 1 and not self._joined_within(x, y):
+                self.stale = True
+
+    def _joined_within(self, x, y, box=None):
+        """
+        Whether the passable 4-neighbours of (x, y) are joined by a path
+        that avoids (x, y) and stays within ``window`` cells of it, and
+        within ``box`` (x0, y0, x1, y1), end exclusive, if given.
+        """
+        if not self.window:
+            return False
+        sides = [
+            (x + dx, y + dy) for dx, dy in NEIGHBORS
+            if self.is_passable(x + dx, y + dy)
+        ]
+        x0, y0 = max(x - self.window, 0), max(y - self.window, 0)
+        x1 = min(x + self.window, self.width - 1)
+        y1 = min(y + self.window, self.height - 1)
+        if box is not None:
+            x0, y0 = max(x0, box[0]), max(y0, box[1])
+            x1, y1 = min(x1, box[2] - 1), min(y1, box[3] - 1)
+        width, passable = self.width, self.passable
+        targets = set(sides[1:])
+        seen = {(x, y), sides[0]}
+        stack = [sides[0]]
+        while stack and targets:
+            cx, cy = stack.pop()
+            for dx, dy in NEIGHBORS:
+                nx, ny = cx + dx, cy + dy
+                if (
+                    x0 <= nx <= x1
+                    and y0 <= ny <= y1
+                    and (nx, ny) not in seen
+                    and passable[ny * width + nx]
+                ):
+                    seen.add((nx, ny))
+                    targets.discard((nx, ny))
+                    stack.append((nx, ny))
+        return not targets
+
+    # Queries ---------------------------------------------------------------
+
+    def component(self, x, y):
+        """Component id of passable cell (x, y)."""
+        if self.stale:
+            self.rebuild()
+        return self._find(self.node[y * self.width + x])
+
+    def is_reachable(self, pos, start):
+        """
+        Whether ``pos`` can be reached from ``start``.
+
+        A passable cell is reachable if it is in the start's component; a
+        blocked one if any of its 4-neighbours is.
+        """
+        x, y = pos
+        root = self.component(*start)
+        if self.is_passable(x, y):
+            return self.component(x, y) == root
+        return any(
+            self.is_passable(x + dx, y + dy)
+            and self.component(x + dx, y + dy) == root
+            for dx, dy in NEIGHBORS
+        )
+
+    def unreachable_objects(self, start):
+        """Positions of non-wall objects that cannot be reached from start."""
+        if self.stale:
+            self.rebuild()
+        return sorted(
+            pos for pos in self.objects if pos != tuple(start)
+            and not self.is_reachable(pos, start)
+        )
+
+    def check(self, start):
+        """
+        Array equivalent of ``RoomGridLevel.check_objs_reachable``.
+
+        Raises:
+            RejectSampling: If some object cannot be reached from ``start``
+        """
+        unreachable = self.unreachable_objects(start)
+        if unreachable:
+            raise RejectSampling("unreachable object at " + str(unreachable[0]))
+        return True
+
+    def _label_box(self, box, skip=None):
+        """Components of the passable cells inside ``box``, avoiding ``skip``."""
+        x0, y0, x1, y1 = box
+        label = {}
+        for y in range(y0, y1):
+            for x in range(x0, x1):
+                if (x, y) in label or (x, y) == skip or not self.is_passable(x, y):
+                    continue
+                label[x, y] = (x, y)
+                stack = [(x, y)]
+                while stack:
+                    cx, cy = stack.pop()
+                    for dx, dy in NEIGHBORS:
+                        cell = (cx + dx, cy + dy)
+                        if (
+                            cell not in label
+                            and cell != skip
+                            and x0 <= cell[0] < x1
+                            and y0 <= cell[1] < y1
+                            and self.is_passable(*cell)
+                        ):
+                            label[cell] = (x, y)
+                            stack.append(cell)
+        return label
+
+    def can_block_in(self, x, y, box, start, strict=True):
+        """
+        Whether a blocking object can go in passable cell (x, y) without
+        making any object unreachable from ``start``, searching only ``box``.
+
+        ``box`` is (x0, y0, x1, y1), end-exclusive, e.g. a room with its
+        walls. Blocking is accepted if every object in the box that was
+        reachable stays reachable, the new object is reachable, and any two
+        entries (passable border cells such as doors, and ``start`` if it is
+        inside) joined inside the box before still are, so paths through
+        the box to the rest of the grid survive. With ``strict=False`` only
+        the last condition is checked: objects in the box may be cut off,
+        but the rest of the grid is not, and ``repair_box`` still applies.
+        ``start`` may only be None if ``strict`` is False.
+        The cost is the box's area rather than the grid's: while the
+        structure is stale, entries are assumed reachable rather than
+        rebuilding it.
+        """
+        x0, y0, x1, y1 = box
+        sx, sy = start if start is not None else (-1, -1)
+        entries = [
+            (cx, cy)
+            for cy in range(y0, y1)
+            for cx in range(x0, x1)
+            if (cx in (x0, x1 - 1) or cy in (y0, y1 - 1) or (cx, cy) == (sx, sy))
+            and self.is_passable(cx, cy)
+        ]
+        before = self._label_box(box)
+        after = self._label_box(box, skip=(x, y))
+
+        # Entries joined before must stay joined
+        joined = {}
+        for entry in entries:
+            if entry == (x, y):
+                return False
+            group = joined.setdefault(before[entry], after[entry])
+            if group != after[entry]:
+                return False
+        if not strict:
+            return True
+
+        # Components reached from start, through an entry. A stale structure
+        # is not rebuilt for this; every entry then counts as reached
+        def reached(label):
+            return {
+                label[entry]
+                for entry in entries
+                if self.stale
+                or entry == (sx, sy)
+                or self.is_reachable(entry, start)
+            }
+
+        def touches(label, comps, cx, cy):
+            return any(
+                label.get((cx + dx, cy + dy)) in comps for dx, dy in NEIGHBORS
+            )
+
+        reached_before, reached_after = reached(before), reached(after)
+        if not touches(after, reached_after, x, y):
+            return False
+        for cy in range(y0, y1):
+            for cx in range(x0, x1):
+                if (cx, cy) not in self.objects or self.is_passable(cx, cy):
+                    continue
+                if touches(before, reached_before, cx, cy) and not touches(
+                    after, reached_after, cx, cy
+                ):
+                    return False
+        return True
+
+    def repair_box(self, box):
+        """
+        Recompute the components inside ``box`` after a block there that
+        ``can_block_in`` accepted, instead of rebuilding the whole grid.
+
+        The cells of the box get fresh nodes, joined as the box's passable
+        cells now connect. Links the old nodes made between cells outside
+        the box stay valid, since ``can_block_in`` keeps the entries that
+        were joined through the box joined. Only call this if the structure
+        was up to date before the block.
+        """
+        x0, y0, x1, y1 = box
+        width = self.width
+        cells = [
+            (x, y)
+            for y in range(y0, y1)
+            for x in range(x0, x1)
+            if self.is_passable(x, y)
+        ]
+        for x, y in cells:
+            k = y * width + x
+            self.node[k] = len(self.parent)
+            self.parent.append(self.node[k])
+        for x, y in cells:
+            for dx, dy in NEIGHBORS:
+                if self.is_passable(x + dx, y + dy):
+                    self._union(y * width + x, (y + dy) * width + x + dx)
+        self.stale = False
+
+    def can_block(self, x, y, box=None):
+        """
+        ``can_block`` on the bitmap (see the module-level function), also
+        accepting cells whose neighbours are joined within ``window``, and
+        within ``box`` if given. Only the bitmap is used, so a stale
+        structure is not rebuilt.
+        """
+        ring = [self.is_passable(x + dx, y + dy) for dx, dy in RING]
+        groups = _ring_groups(ring)
+        if groups == 0:
+            return False
+        if groups > 1:
+            # Search as if the cell were already blocked
+            k = y * self.width + x
+            self.passable[k] = False
+            joined = self._joined_within(x, y, box)
+            self.passable[k] = True
+            if not joined:
+                return False
+        for dx, dy in NEIGHBORS:
+            nx, ny = x + dx, y + dy
+            if (nx, ny) not in self.objects or self.is_passable(nx, ny):
+                continue
+            if not any(
+                self.is_passable(nx + ex, ny + ey)
+                for ex, ey in NEIGHBORS
+                if (nx + ex, ny + ey) != (x, y)
+            ):
+                return False
+        return True
@@ -0,0 +1,187 @@
+import sys
+from contextlib import contextmanager
+
+from minigrid.envs.babyai.core.roomgrid_level import RejectSampling
+
+from ..core.profiling import PhaseProfiler
+
+
+class GenerationStats:
+    """
+    Counters and timings of level generation, per rejection source.
+
+    ``RoomGridLevel._gen_grid`` restarts ``gen_mission`` from scratch when a
+    step raises RejectSampling (or RecursionError, when ``place_obj`` gives
+    up). Each step of ``PickupVictimEnv.gen_mission`` runs in
+    ``phase(source)``, which times it and, if it raises, charges the restart
+    to that source. Steps that retry internally instead report those
+    retries with ``retry(source)``:
+
+    - ``add_locked_rooms``: rejections when a room has no free cell for a key
+    - ``connect_all``: none, the union-find version never gives up
+    - ``lava``: retries for candidate cells that would cut something off
+    - ``place_agent``: rejections when ``place_obj`` finds no start cell in
+      the chosen room
+    - ``check_objs_reachable``: rejections for unreachable objects, and
+      retries for lazy rooms filled with some
+    - ``victims``: rejections when a room has no free cell, and retries
+      for lava cleared to keep a victim or key reachable
+
+    Timings are kept by a PhaseProfiler (``timings``), one phase per source
+    plus ``level`` for whole resets, so they also have percentiles.
+
+    Every PickupVictimEnv keeps one as ``env.generation_stats``; the vector
+    envs sum theirs with ``generation_stats()``.
+    """
+
+    SOURCES = (
+        "add_locked_rooms",
+        "connect_all",
+        "lava",
+        "place_agent",
+        "check_objs_reachable",
+        "victims",
+    )
+
+    # Recent timing samples kept per phase, for percentiles
+    MAX_SAMPLES = 1000
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Zero all counters."""
+        # Resets that generated a level, and gen_mission calls they took
+        self.levels = 0
+        self.attempts = 0
+        # Resets served from a level pool or layout cache
+        self.loaded = 0
+        self.rejections = dict.fromkeys(self.SOURCES, 0)
+        self.retries = dict.fromkeys(self.SOURCES, 0)
+        self.timings = PhaseProfiler(max_samples=self.MAX_SAMPLES)
+
+    @property
+    def calls(self):
+        """Source -> number of times its step ran."""
+        return {source: self.timings.counts.get(source, 0) for source in self.SOURCES}
+
+    @property
+    def seconds(self):
+        """Source -> seconds spent in its step."""
+        return {
+            source: self.timings.totals.get(source, 0.0) for source in self.SOURCES
+        }
+
+    @property
+    def generate_seconds(self):
+        """Seconds spent generating levels, across all their attempts."""
+        return self.timings.totals.get("level", 0.0)
+
+    # Recording -------------------------------------------------------------
+
+    @contextmanager
+    def phase(self, source):
+        """Time a generation step, charging a rejection it raises to it."""
+        try:
+            with self.timings.phase(source):
+                yield
+        except (RejectSampling, RecursionError):
+            self.rejections[source] += 1
+            raise
+
+    def retry(self, source, count=1):
+        """Count retries a step made without restarting generation."""
+        self.retries[source] += count
+
+    @contextmanager
+    def level(self):
+        """Time the generation of one level, across all its attempts."""
+        try:
+            with self.timings.phase("level"):
+                yield
+        finally:
+            self.levels += 1
+
+    # Aggregation -----------------------------------------------------------
+
+    def merge(self, other):
+        """Add another GenerationStats' counters to this one."""
+        self.levels += other.levels
+        self.attempts += other.attempts
+        self.loaded += other.loaded
+        for source in self.SOURCES:
+            self.rejections[source] += other.rejections[source]
+            self.retries[source] += other.retries[source]
+        self.timings.merge(other.timings)
+        return self
+
+    @classmethod
+    def total(cls, stats):
+        """Sum of an iterable of GenerationStats."""
+        result = cls()
+        for item in stats:
+            result.merge(item)
+        return result
+
+    # Reporting -------------------------------------------------------------
+
+    def summary(self):
+        """
+        Per-level averages.
+
+        Returns:
+            dict: levels, loaded, restarts_per_level, retries_per_level,
+            ms_per_level and the sources with the most restarts and the most
+            time
+        """
+        levels = max(self.levels, 1)
+        return {
+            "levels": self.levels,
+            "loaded": self.loaded,
+            "restarts_per_level": sum(self.rejections.values()) / levels,
+            "retries_per_level": sum(self.retries.values()) / levels,
+            "ms_per_level": 1e3 * self.generate_seconds / levels,
+            "top_rejection": max(self.SOURCES, key=self.rejections.get),
+            "top_time": max(self.SOURCES, key=self.seconds.get),
+        }
+
+    def as_dict(self):
+        """All counters, with per-source entries keyed by source."""
+        calls, seconds = self.calls, self.seconds
+        return {
+            "levels": self.levels,
+            "attempts": self.attempts,
+            "generate_seconds": self.generate_seconds,
+            "loaded": self.loaded,
+            "sources": {
+                source: {
+                    "calls": calls[source],
+                    "seconds": seconds[source],
+                    "rejections": self.rejections[source],
+                    "retries": self.retries[source],
+                }
+                for source in self.SOURCES
+            },
+        }
+
+    def report(self, stream=None):
+        """Write a per-source table to a stream (default: stderr)."""
+        stream = stream or sys.stderr
+        levels = max(self.levels, 1)
+        seconds = self.seconds
+        print(
+            f"{self.levels} levels generated in {self.attempts} attempts, "
+            f"{1e3 * self.generate_seconds / levels:.2f} ms each; "
+            f"{self.loaded} loaded",
+            file=stream,
+        )
+        print(
+            f"{'source':<22} {'ms/level':>9} {'restarts':>9} {'retries':>9}",
+            file=stream,
+        )
+        for source in self.SOURCES:
+            print(
+                f"{source:<22} {1e3 * seconds[source] / levels:>9.3f} "
+                f"{self.rejections[source]:>9} {self.retries[source]:>9}",
+                file=stream,
+            )
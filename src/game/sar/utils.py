@@ -1,8 +1,9 @@
-import random
+from functools import partial
 
 from minigrid.core.world_object import Lava
 
 from .objects import FakeVictim, Victim
+from .reachability import can_block
 
 
 class VictimPlacer:
@@ -28,36 +29,44 @@ class VictimPlacer:
         }
         self.important_victim = important_victim
 
+    def make_fake_victim(self, level_gen):
+        """Create a fake victim with a random shift and direction."""
+        shift = level_gen._rand_elem(self.SHIFTS)
+        direction = level_gen._rand_elem(self.DIRECTIONS)
+        return FakeVictim(shift, direction, color="red")
+
     def place_fake_victims(self, level_gen, i, j):
         """Place fake victims in a room using factory pattern."""
         for _ in range(self.num_fake_victims):
-            shift = random.choice(self.SHIFTS)
-            direction = random.choice(self.DIRECTIONS)
-            obj = FakeVictim(shift, direction, color="red")
-            level_gen.place_in_room(i, j, obj)
+            level_gen.place_in_room(i, j, self.make_fake_victim(level_gen))
+
+    def victim_for(self, level_gen, room):
+        """The real victim to place in a room."""
+        if room.locked:
+            # Always use important victim in locked rooms
+            return self.victims[self.important_victim]
+        # Randomly select from non-important victims in unlocked rooms
+        non_important_victims = [
+            v for k, v in self.victims.items() if k != self.important_victim
+        ]
+        return level_gen._rand_elem(non_important_victims)
+
+    def place_room(self, level_gen, i, j):
+        """Place victims and fake victims in room (i, j)."""
+        room = level_gen.get_room(i, j)
+
+        # Place real victims (num_real_victims per room)
+        for _ in range(self.num_real_victims):
+            level_gen.place_in_room(i, j, self.victim_for(level_gen, room))
+
+        # Always place fake victims
+        self.place_fake_victims(level_gen, i, j)
 
     def place_all(self, level_gen, num_rows, num_cols):
         """Place victims and fake victims in all rooms."""
-        for i in range(num_rows):
-            for j in range(num_cols):
-                room = level_gen.get_room(i, j)
-
-                # Place real victims (num_real_victims per room)
-                for _ in range(self.num_real_victims):
-                    if room.locked:
-                        # Always use important victim in locked rooms
-                        victim_to_place = self.victims[self.important_victim]
-                    else:
-                        # Randomly select from non-important victims in unlocked rooms
-                        non_important_victims = [
-                            v for k, v in self.victims.items() if k != self.important_victim
-                        ]
-                        victim_to_place = random.choice(non_important_victims)
-
-                    level_gen.place_in_room(i, j, victim_to_place)
-
-                # Always place fake victims
-                self.place_fake_victims(level_gen, i, j)
+        for i in range(num_cols):
+            for j in range(num_rows):
+                self.place_room(level_gen, i, j)
 
 
 class LavaPlacer:
@@ -78,28 +87,93 @@ class LavaPlacer:
         """
         Place lava tiles in a specific room.
 
+        Only cells that can be blocked without cutting off any door or other
+        cell (see ``reachability.can_block``) are used, so lava never makes
+        the level fail ``check_objs_reachable``. Once the agent is placed
+        (lazy rooms, mutations), objects already in the room must also stay
+        reachable from it (``Reachability.can_block_in``). Fewer tiles are
+        placed if the room runs out of such cells.
+
         Args:
             level_gen: The level generator instance
-            i: Room row index
-            j: Room column index
+            i: Room column index
+            j: Room row index
             num_lava: Number of lava tiles to place (None = use lava_per_room)
+
+        Returns:
+            int: Number of lava tiles placed
         """
         if num_lava is None:
             num_lava = self.lava_per_room
 
+        room = level_gen.get_room(i, j)
+        grid = level_gen.grid
+        (top_x, top_y), (size_x, size_y) = room.top, room.size
+        reachability = getattr(grid, "reachability", None)
+        if reachability is not None:
+            # Search only the room, so its lava does not depend on the others
+            box = (top_x, top_y, top_x + size_x, top_y + size_y)
+            blockable = partial(reachability.can_block, box=box)
+        else:
+            blockable = partial(can_block, grid)
+        # Lava placed after the agent (lazy rooms) must not land on it
+        agent = level_gen.agent_pos
+        agent = tuple(agent) if agent is not None else None
+        if reachability is not None and getattr(level_gen, "_agent_placed", False):
+            blockable = partial(reachability.can_block_in, box=box, start=agent)
+        candidates = [
+            (x, y)
+            for y in range(top_y + 1, top_y + size_y - 1)
+            for x in range(top_x + 1, top_x + size_x - 1)
+            if grid.get(x, y) is None and (x, y) != agent
+        ]
+
+        stats = getattr(level_gen, "generation_stats", None)
+
+        # Blocking cells only ever makes other cells harder to block, so a
+        # candidate that fails the test once can be dropped for good
         placed = 0
-        max_attempts = 50  # Prevent infinite loops
+        while placed < num_lava and candidates:
+            k = level_gen._rand_int(0, len(candidates))
+            candidates[k], candidates[-1] = candidates[-1], candidates[k]
+            x, y = candidates.pop()
+            if not blockable(x, y):
+                if stats is not None:
+                    stats.retry("lava")
+                continue
 
-        for _ in range(max_attempts):
-            if placed >= num_lava:
-                break
+            lava = Lava()
+            grid.set(x, y, lava)
+            lava.init_pos = lava.cur_pos = (x, y)
+            room.objs.append(lava)
+            placed += 1
 
-            try:
-                level_gen.place_in_room(i, j, Lava())
-                placed += 1
-            except Exception:
-                # Room might be full or placement failed
-                continue
+        return placed
+
+    def place_room(self, level_gen, i, j, skip_locked_rooms=False):
+        """
+        Place lava in room (i, j) based on configuration.
+
+        Args:
+            level_gen: The level generator instance
+            i: Room column index
+            j: Room row index
+            skip_locked_rooms: If True, don't place lava in locked rooms
+        """
+        room = level_gen.get_room(i, j)
+
+        # Skip locked rooms if requested
+        if skip_locked_rooms and getattr(room, "locked", False):
+            return
+
+        # Decide whether to place lava in this room
+        if self.lava_per_room > 0:
+            # Fixed number per room
+            self.place_in_room(level_gen, i, j, self.lava_per_room)
+        elif level_gen._rand_float(0, 1) < self.lava_probability:
+            # Random placement based on probability
+            num_lava = level_gen._rand_int(1, 4)  # 1-3 lava tiles
+            self.place_in_room(level_gen, i, j, num_lava)
 
     def place_all(self, level_gen, num_rows, num_cols, skip_locked_rooms=False):
         """
@@ -111,19 +185,6 @@ class LavaPlacer:
             num_cols: Number of room columns
             skip_locked_rooms: If True, don't place lava in locked rooms
         """
-        for i in range(num_rows):
-            for j in range(num_cols):
-                room = level_gen.get_room(i, j)
-
-                # Skip locked rooms if requested
-                if skip_locked_rooms and getattr(room, "locked", False):
-                    continue
-
-                # Decide whether to place lava in this room
-                if self.lava_per_room > 0:
-                    # Fixed number per room
-                    self.place_in_room(level_gen, i, j, self.lava_per_room)
-                elif random.random() < self.lava_probability:
-                    # Random placement based on probability
-                    num_lava = random.randint(1, 3)  # 1-3 lava tiles
-                    self.place_in_room(level_gen, i, j, num_lava)
+        for i in range(num_cols):
+            for j in range(num_rows):
+                self.place_room(level_gen, i, j, skip_locked_rooms)
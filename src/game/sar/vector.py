@@ -0,0 +1,481 @@
+import multiprocessing as mp
+import numbers
+import traceback
+import weakref
+from functools import partial
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from ..core.gather import GatherRenderer, window_codes
+from .env import PickupVictimEnv
+from .telemetry import GenerationStats
+
+
+def _env_seeds(seed, num_envs):
+    """Per-env reset seeds as Python ints (gymnasium rejects NumPy ones)."""
+    if seed is None:
+        return [None] * num_envs
+    if isinstance(seed, numbers.Integral):
+        return [int(seed) + i for i in range(num_envs)]
+    return [None if s is None else int(s) for s in seed]
+
+
+class PickupVictimVecEnv:
+    """
+    Batch of PickupVictimEnv copies behind a single ``step`` call.
+
+    The envs are still stepped one after another in Python; what the batch
+    saves is building the per-step outputs. Observations, rewards,
+    terminations, truncations and infos are written into arrays allocated
+    once at construction. The arrays returned by ``reset`` and ``step`` are
+    reused on the next call, so copy them if they need to outlive it. For
+    stepping envs in parallel, see SharedMemoryVecEnv.
+
+    Finished episodes are reset automatically within the same ``step`` call,
+    so the returned observation for such an env is the first observation of
+    its next episode. The last observation of the finished episode is kept
+    in ``infos["final_observation"]``, where ``infos["_final_observation"]``
+    marks the envs that were reset.
+    """
+
+    def __init__(self, num_envs, env_fn=None, **env_kwargs):
+        """
+        Create the batch of environments.
+
+        Args:
+            num_envs: Number of environment copies
+            env_fn: Optional callable returning a new environment; when not
+                given, PickupVictimEnv(**env_kwargs) is used
+            **env_kwargs: Keyword arguments for PickupVictimEnv
+        """
+        if env_fn is None:
+
+            def env_fn():
+                return PickupVictimEnv(**env_kwargs)
+
+        self.num_envs = num_envs
+        self.envs = [env_fn() for _ in range(num_envs)]
+
+        self.single_observation_space = self.envs[0].observation_space
+        self.single_action_space = self.envs[0].action_space
+
+        view = self.envs[0].agent_view_size
+        self.observations = {
+            "image": np.zeros((num_envs, view, view, 3), dtype=np.uint8),
+            "direction": np.zeros(num_envs, dtype=np.int64),
+        }
+        self.rewards = np.zeros(num_envs, dtype=np.float32)
+        self.terminations = np.zeros(num_envs, dtype=bool)
+        self.truncations = np.zeros(num_envs, dtype=bool)
+        self.infos = {
+            "mission_complete": np.zeros(num_envs, dtype=bool),
+            "saved_victims": np.zeros(num_envs, dtype=np.int64),
+            "final_observation": {
+                "image": np.zeros((num_envs, view, view, 3), dtype=np.uint8),
+                "direction": np.zeros(num_envs, dtype=np.int64),
+            },
+            "_final_observation": np.zeros(num_envs, dtype=bool),
+        }
+        # Batched camera frames (see render)
+        self.renderer = GatherRenderer()
+        self.frames = None
+
+    @staticmethod
+    def _write_obs(observations, i, obs):
+        observations["image"][i] = obs["image"]
+        observations["direction"][i] = obs["direction"]
+
+    def reset(self, seed=None):
+        """
+        Reset every environment.
+
+        Args:
+            seed: None, an integer (env i is seeded with seed + i) or a
+                sequence of per-env seeds; NumPy integers are accepted
+
+        Returns:
+            tuple: (observations, infos)
+        """
+        seeds = _env_seeds(seed, self.num_envs)
+
+        for i, env in enumerate(self.envs):
+            obs, _ = env.reset(seed=seeds[i])
+            self._write_obs(self.observations, i, obs)
+
+        self.infos["mission_complete"][:] = False
+        self.infos["saved_victims"][:] = 0
+        self.infos["_final_observation"][:] = False
+        return self.observations, self.infos
+
+    def step(self, actions):
+        """
+        Step every environment with its action.
+
+        Args:
+            actions: Array-like of shape (num_envs,) with one action per env
+
+        Returns:
+            tuple: (observations, rewards, terminations, truncations, infos)
+        """
+        for i, env in enumerate(self.envs):
+            obs, reward, terminated, truncated, info = env.step(int(actions[i]))
+
+            self.rewards[i] = reward
+            self.terminations[i] = terminated
+            self.truncations[i] = truncated
+            self.infos["mission_complete"][i] = info.get("mission_complete", False)
+            self.infos["saved_victims"][i] = env.saved_victims
+
+            done = terminated or truncated
+            self.infos["_final_observation"][i] = done
+            if done:
+                self._write_obs(self.infos["final_observation"], i, obs)
+                obs, _ = env.reset()
+            self._write_obs(self.observations, i, obs)
+
+        return (
+            self.observations,
+            self.rewards,
+            self.terminations,
+            self.truncations,
+            self.infos,
+        )
+
+    def render(self):
+        """
+        Camera views of every env as one (num_envs, H, W, 3) uint8 array.
+
+        Each camera is moved as ``env.render()`` would move it, the encoded
+        cells in view are stacked, and all frames are drawn by a single
+        gather (see GatherRenderer). Views smaller than the largest one
+        (grids narrower than the camera) are padded with black. The array is
+        reused by the next call.
+
+        Returns:
+            np.ndarray: Frames, pixel-identical to each env's view
+        """
+        tile_sizes = {env.camera.tile_size for env in self.envs}
+        if len(tile_sizes) != 1:
+            raise ValueError(f"Cameras draw different tile sizes: {tile_sizes}")
+        tile_size = tile_sizes.pop()
+
+        views = []
+        agent_pos = np.zeros((self.num_envs, 2), dtype=np.intp)
+        agent_dir = np.zeros(self.num_envs, dtype=np.intp)
+        for i, env in enumerate(self.envs):
+            top_x, top_y, w, h = env.get_camera_window()
+            views.append(window_codes(env.grid, top_x, top_y, w, h))
+            agent_pos[i] = (
+                env.agent_pos[0] - max(top_x, 0),
+                env.agent_pos[1] - max(top_y, 0),
+            )
+            agent_dir[i] = env.agent_dir
+
+        width = max(cells.shape[0] for cells in views)
+        height = max(cells.shape[1] for cells in views)
+        codes = np.zeros((self.num_envs, width, height, 3), dtype=np.uint8)
+        valid = np.zeros((self.num_envs, width, height), dtype=bool)
+        for i, cells in enumerate(views):
+            codes[i, : cells.shape[0], : cells.shape[1]] = cells
+            valid[i, : cells.shape[0], : cells.shape[1]] = True
+
+        shape = (self.num_envs, height * tile_size, width * tile_size, 3)
+        if self.frames is None or self.frames.shape != shape:
+            self.frames = np.empty(shape, dtype=np.uint8)
+        return self.renderer.render_batch(
+            codes, tile_size, agent_pos, agent_dir, valid=valid, out=self.frames
+        )
+
+    def generation_stats(self):
+        """Level generation counters summed over all envs."""
+        return GenerationStats.total(env.generation_stats for env in self.envs)
+
+    def close(self):
+        for env in self.envs:
+            env.close()
+
+
+def _attach_buffers(specs):
+    """Attach to shared memory blocks and wrap them as numpy arrays."""
+    blocks, arrays = [], {}
+    for key, (name, shape, dtype) in specs.items():
+        block = shared_memory.SharedMemory(name=name)
+        blocks.append(block)
+        arrays[key] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+    return blocks, arrays
+
+
+def _release_blocks(blocks):
+    """Close and unlink the shared memory blocks of a SharedMemoryVecEnv."""
+    for block in blocks:
+        try:
+            block.close()
+        except BufferError:
+            # Arrays handed out still map it; it is freed once they go
+            pass
+        block.unlink()
+
+
+def _shared_memory_worker(remote, parent_remote, env_fn, lo, hi, specs):
+    """
+    Worker loop stepping envs [lo, hi) of a SharedMemoryVecEnv.
+
+    Actions are read from and results written to the shared buffers; the
+    pipe only carries short command tuples. Each command is answered with
+    ("ok", result), or ("error", traceback) if it raised, which the parent
+    raises in turn.
+    """
+    parent_remote.close()
+    blocks, buffers = _attach_buffers(specs)
+
+    vec = error = None
+    try:
+        vec = PickupVictimVecEnv(hi - lo, env_fn=env_fn)
+    except Exception:
+        # Reported in answer to the first command
+        error = traceback.format_exc()
+    else:
+        # Write results straight into this worker's slice of the shared buffers
+        vec.observations = {
+            "image": buffers["image"][lo:hi],
+            "direction": buffers["direction"][lo:hi],
+        }
+        vec.rewards = buffers["rewards"][lo:hi]
+        vec.terminations = buffers["terminations"][lo:hi]
+        vec.truncations = buffers["truncations"][lo:hi]
+        vec.infos = {
+            "mission_complete": buffers["mission_complete"][lo:hi],
+            "saved_victims": buffers["saved_victims"][lo:hi],
+            "final_observation": {
+                "image": buffers["final_image"][lo:hi],
+                "direction": buffers["final_direction"][lo:hi],
+            },
+            "_final_observation": buffers["final_mask"][lo:hi],
+        }
+    actions = buffers["actions"][lo:hi]
+
+    try:
+        while True:
+            command, data = remote.recv()
+            if command == "close":
+                break
+            if error is not None:
+                remote.send(("error", error))
+                continue
+            try:
+                result = None
+                if command == "step":
+                    vec.step(actions)
+                elif command == "reset":
+                    vec.reset(seed=data)
+                elif command == "generation_stats":
+                    result = vec.generation_stats()
+            except Exception:
+                remote.send(("error", traceback.format_exc()))
+            else:
+                remote.send(("ok", result))
+    except (KeyboardInterrupt, EOFError):
+        pass
+    finally:
+        if vec is not None:
+            vec.close()
+        # Drop the numpy views before releasing the mapped memory
+        del vec, buffers, actions
+        for block in blocks:
+            block.close()
+        remote.close()
+
+
+class SharedMemoryVecEnv:
+    """
+    Process-pool vector env for PickupVictimEnv.
+
+    The envs are split into contiguous slices, one per worker process. Each
+    worker steps its slice with a PickupVictimVecEnv whose output arrays are
+    views into ``multiprocessing.shared_memory`` blocks, and reads its actions
+    from a shared action buffer. The pipes only carry short commands, so no
+    numpy arrays are pickled per step. Returned arrays are reused on the next
+    call, and final observations of reset envs are returned in the infos, as
+    with PickupVictimVecEnv. An exception in a worker is raised in the
+    parent as a RuntimeError carrying the worker's traceback. The shared
+    blocks are unlinked by ``close``, or when the env is garbage collected.
+    """
+
+    def __init__(
+        self, num_envs, num_workers=None, env_fn=None, context=None, **env_kwargs
+    ):
+        """
+        Start the worker processes.
+
+        Args:
+            num_envs: Total number of environment copies
+            num_workers: Number of worker processes (default: CPU count,
+                capped at num_envs)
+            env_fn: Optional picklable callable returning a new environment;
+                when not given, PickupVictimEnv(**env_kwargs) is used
+            context: Multiprocessing start method ("fork", "spawn", ...)
+            **env_kwargs: Keyword arguments for PickupVictimEnv
+        """
+        if env_fn is None:
+            env_fn = partial(PickupVictimEnv, **env_kwargs)
+        if num_workers is None:
+            num_workers = mp.cpu_count()
+        num_workers = max(1, min(num_workers, num_envs))
+
+        self.num_envs = num_envs
+        self.num_workers = num_workers
+
+        probe = env_fn()
+        self.single_observation_space = probe.observation_space
+        self.single_action_space = probe.action_space
+        view = probe.agent_view_size
+        probe.close()
+
+        layout = {
+            "image": ((num_envs, view, view, 3), np.uint8),
+            "direction": ((num_envs,), np.int64),
+            "rewards": ((num_envs,), np.float32),
+            "terminations": ((num_envs,), bool),
+            "truncations": ((num_envs,), bool),
+            "mission_complete": ((num_envs,), bool),
+            "saved_victims": ((num_envs,), np.int64),
+            "final_image": ((num_envs, view, view, 3), np.uint8),
+            "final_direction": ((num_envs,), np.int64),
+            "final_mask": ((num_envs,), bool),
+            "actions": ((num_envs,), np.int64),
+        }
+        self._blocks = []
+        self._buffers = {}
+        specs = {}
+        for key, (shape, dtype) in layout.items():
+            dtype = np.dtype(dtype)
+            nbytes = max(1, int(np.prod(shape)) * dtype.itemsize)
+            block = shared_memory.SharedMemory(create=True, size=nbytes)
+            self._blocks.append(block)
+            self._buffers[key] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+            self._buffers[key].fill(0)
+            specs[key] = (block.name, shape, dtype.str)
+
+        self.observations = {
+            "image": self._buffers["image"],
+            "direction": self._buffers["direction"],
+        }
+        self.infos = {
+            "mission_complete": self._buffers["mission_complete"],
+            "saved_victims": self._buffers["saved_victims"],
+            "final_observation": {
+                "image": self._buffers["final_image"],
+                "direction": self._buffers["final_direction"],
+            },
+            "_final_observation": self._buffers["final_mask"],
+        }
+
+        ctx = mp.get_context(context)
+        bounds = np.linspace(0, num_envs, num_workers + 1).astype(int)
+        self.slices = list(zip(bounds[:-1], bounds[1:]))
+        self.remotes, self.processes = [], []
+        for lo, hi in self.slices:
+            remote, worker_remote = ctx.Pipe()
+            process = ctx.Process(
+                target=_shared_memory_worker,
+                args=(worker_remote, remote, env_fn, int(lo), int(hi), specs),
+                daemon=True,
+            )
+            process.start()
+            worker_remote.close()
+            self.remotes.append(remote)
+            self.processes.append(process)
+
+        # Unlink the blocks even if close is never called
+        self._finalizer = weakref.finalize(self, _release_blocks, self._blocks)
+        self.closed = False
+
+    def _broadcast(self, command, data=None):
+        return self._exchange([(command, data)] * len(self.remotes))
+
+    def _exchange(self, messages):
+        """
+        Send one command tuple to each worker and gather their answers.
+
+        Raises:
+            RuntimeError: If a worker raised, with its traceback, or died
+        """
+        for remote, message in zip(self.remotes, messages):
+            try:
+                remote.send(message)
+            except OSError:
+                # A dead worker is reported when its answer is read
+                pass
+        results, errors = [], []
+        for remote in self.remotes:
+            try:
+                status, result = remote.recv()
+            except EOFError:
+                status, result = "error", "Worker exited unexpectedly"
+            if status == "error":
+                errors.append(result)
+            results.append(result)
+        if errors:
+            raise RuntimeError(f"SharedMemoryVecEnv worker failed:\n{errors[0]}")
+        return results
+
+    def reset(self, seed=None):
+        """
+        Reset every environment.
+
+        Args:
+            seed: None, an integer (env i is seeded with seed + i) or a
+                sequence of per-env seeds; NumPy integers are accepted
+
+        Returns:
+            tuple: (observations, infos)
+        """
+        seeds = _env_seeds(seed, self.num_envs)
+
+        self._exchange([("reset", seeds[lo:hi]) for lo, hi in self.slices])
+
+        return self.observations, self.infos
+
+    def step(self, actions):
+        """
+        Step every environment with its action.
+
+        Args:
+            actions: Array-like of shape (num_envs,) with one action per env
+
+        Returns:
+            tuple: (observations, rewards, terminations, truncations, infos)
+        """
+        self._buffers["actions"][:] = actions
+        self._broadcast("step")
+        return (
+            self.observations,
+            self._buffers["rewards"],
+            self._buffers["terminations"],
+            self._buffers["truncations"],
+            self.infos,
+        )
+
+    def generation_stats(self):
+        """Level generation counters summed over all workers' envs."""
+        return GenerationStats.total(self._broadcast("generation_stats"))
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            for remote in self.remotes:
+                try:
+                    remote.send(("close", None))
+                except OSError:
+                    # The worker already exited
+                    pass
+            for process in self.processes:
+                process.join()
+        finally:
+            for remote in self.remotes:
+                remote.close()
+            self.observations = self.infos = self._buffers = None
+            self._finalizer()
@@ -4,15 +4,14 @@ These environments are used for testing specific features and scenarios.
 """
 
 import math
-import random
 
-import pygame
 from minigrid.core.constants import COLOR_NAMES
 from minigrid.core.grid import Grid
 from minigrid.core.world_object import Door, Goal, Key, Lava, Wall
 
 from .core.env import SAREnv
-from .sar.objects import FakeVictimLeft, VictimUp
+from .sar.actions import RescueAction
+from .sar.objects import FakeVictimLeftLeft, VictimUp
 
 
 class TestEnv(SAREnv):
@@ -50,7 +49,9 @@ class TestEnv(SAREnv):
 class MultiRoomDifficultyEnv(SAREnv):
     """Multi-room environment with configurable difficulty settings."""
 
-    def __init__(self, config, render_mode="human", **kwargs):
+    STATE_ATTRS = ("saved_victims",)
+
+    def __init__(self, config, render_mode="human", fullscreen=True, **kwargs):
         self.room_size = 5
         self.step_count = 0
 
@@ -69,19 +70,18 @@ class MultiRoomDifficultyEnv(SAREnv):
 
         grid_size = max(grid_width, grid_height)
 
-        # TODO: Add a condition to run in windowed mode
-        self.window = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-        print(self.window)
-
+        # The (fullscreen) display is only opened on the first human render
         super().__init__(
             grid_size=grid_size,
             max_steps=self.max_steps,
             see_through_walls=False,
             agent_view_size=7,
             render_mode=render_mode,
-            window=self.window,
+            fullscreen=fullscreen,
             **kwargs,
         )
+        self.saved_victims = 0
+        self.resuce_action = RescueAction(self)
 
     def _randomly_remove_walls(self, removal_prob=0.1):
         """
@@ -94,13 +94,16 @@ class MultiRoomDifficultyEnv(SAREnv):
 
                 # Remove only plain walls (not doors, lava, keys, etc.)
                 if isinstance(obj, Door):
-                    if random.random() < removal_prob:
+                    if self._rand_float(0, 1) < removal_prob:
                         self.grid.set(x, y, None)
                         self.grid.set(x, y + 1, None)
                         self.grid.set(x, y - 1, None)
                         self.grid.set(x - 1, y, None)
                         self.grid.set(x + 1, y, None)
 
+    def _step(self, action):
+        return super().step(action)
+
     def step(self, action):
         if action == self.actions.pickup:
             return self.resuce_action.execute(action)
@@ -138,7 +141,7 @@ class MultiRoomDifficultyEnv(SAREnv):
                         key_x = (
                             xL
                             - (self.room_size - 1)
-                            + random.randint(1, self.room_size - 2)
+                            + self._rand_int(1, self.room_size - 1)
                         )
                         key_y = door_y
                         self.grid.set(key_x, key_y, Key("yellow"))
@@ -153,15 +156,15 @@ class MultiRoomDifficultyEnv(SAREnv):
 
                 # Add lava
                 if self.add_lava and room_idx % 2 == 0:
-                    lava_x = xL + random.randint(1, self.room_size - 2)
-                    lava_y = yT + random.randint(1, self.room_size - 2)
+                    lava_x = xL + self._rand_int(1, self.room_size - 1)
+                    lava_y = yT + self._rand_int(1, self.room_size - 1)
                     self.grid.set(lava_x, lava_y, Lava())
 
                 # Add victim in the last room
                 if room_idx == self.room_count - 1:
                     victim_x = xL + self.room_size // 2
                     victim_y = yT + self.room_size // 2
-                    self.grid.set(victim_x, victim_y, FakeVictimLeft(color="red"))
+                    self.grid.set(victim_x, victim_y, FakeVictimLeftLeft(color="red"))
 
                 room_idx += 1
 
@@ -3,6 +3,7 @@ Simple Game Recorder - saves grid as numeric array + action sequence.
 """
 
 import pickle
+from functools import lru_cache
 import numpy as np
 from pathlib import Path
 from datetime import datetime
@@ -23,6 +24,28 @@ OBJ_TO_ID = {
 ID_TO_OBJ = {v: k for k, v in OBJ_TO_ID.items()}
 
 
+@lru_cache(maxsize=None)
+def _type_idx_to_id():
+    """
+    Lookup table from MiniGrid type indices to recording object IDs.
+
+    Built once, on the first call: by then any SARGrid has imported the
+    victim types it registers.
+    """
+    from minigrid.core.constants import OBJECT_TO_IDX
+
+    lut = np.zeros(256, dtype=np.int8)
+    for name, idx in OBJECT_TO_IDX.items():
+        if name.startswith("fake_victim"):
+            lut[idx] = OBJ_TO_ID["FakeVictim"]
+        elif name.startswith("victim"):
+            lut[idx] = OBJ_TO_ID["Victim"]
+        else:
+            lut[idx] = OBJ_TO_ID.get(name.capitalize(), 0)
+    lut.flags.writeable = False
+    return lut
+
+
 @dataclass
 class GameRecording:
     """Minimal game recording."""
@@ -58,6 +81,9 @@ class GameRecorder:
 
     def _grid_to_array(self):
         """Convert grid to numeric numpy array."""
+        if getattr(self.env.grid, "arrays", False):
+            return _type_idx_to_id()[self.env.grid.types]
+
         arr = np.zeros((self.env.height, self.env.width), dtype=np.int8)
         for y in range(self.env.height):
             for x in range(self.env.width):
@@ -1,4 +1,3 @@
-import pygame
 import yaml
 
 from game.gui.main import SAREnvGUI
@@ -13,8 +12,6 @@ with open(config_path, "r") as file:
 
 
 with skip_run("run", "sar_gui_advanced") as check, check():
-    # Access the width and height of the current display
-    screen_height = pygame.display.Info().current_h
     victim_placer = VictimPlacer(
         num_fake_victims=5, num_real_victims=3, important_victim="down"
     )
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test that the cameras render only their view yet match a crop of the full
+grid render pixel for pixel.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game.core.camera import (
+    AgentCenteredCamera,
+    CameraConfig,
+    EdgeFollowCamera,
+    render_window,
+)
+from src.game.sar.env import PickupVictimEnv
+
+
+def full_crop(env, tile_size, top_x, top_y, width, height):
+    """The crop the cameras used to take from a full render."""
+    img = env.grid.render(tile_size, env.agent_pos, env.agent_dir, highlight_mask=None)
+    return img[
+        top_y * tile_size : (top_y + height) * tile_size,
+        top_x * tile_size : (top_x + width) * tile_size,
+    ]
+
+
+def walk(env, steps, seed=0):
+    rng = np.random.default_rng(seed)
+    for _ in range(steps):
+        env.step(int(rng.choice([0, 1, 2, 2, 2])))
+        yield
+
+
+def test_render_window_matches_full_render():
+    env = PickupVictimEnv(room_size=6, num_rows=2, num_cols=2, render_mode=None)
+    env.reset(seed=0)
+    for top_x, top_y, width, height in [(0, 0, 4, 4), (3, 5, 12, 12), (8, 2, 5, 9)]:
+        assert np.array_equal(
+            render_window(
+                env.grid, 16, env.agent_pos, env.agent_dir, top_x, top_y, width, height
+            ),
+            full_crop(env, 16, top_x, top_y, width, height),
+        )
+
+
+def test_edge_follow_camera_is_pixel_identical():
+    # A grid shorter than the view, then one larger than it
+    for num_rows, num_cols in ((1, 2), (3, 3)):
+        env = PickupVictimEnv(
+            room_size=8,
+            num_rows=num_rows,
+            num_cols=num_cols,
+            render_mode="rgb_array",
+            camera_strategy=EdgeFollowCamera(CameraConfig(tile_size=16)),
+        )
+        env.reset(seed=1)
+        camera = env.camera
+        view_w, view_h = camera.config.view_tiles
+        for _ in walk(env, 40):
+            img = env.render()
+            expected = full_crop(env, 16, camera.top_x, camera.top_y, view_w, view_h)
+            assert np.array_equal(img, expected)
+
+
+def test_agent_centered_camera_is_pixel_identical():
+    env = PickupVictimEnv(
+        room_size=8,
+        num_rows=3,
+        num_cols=3,
+        render_mode="rgb_array",
+        camera_strategy=AgentCenteredCamera(tile_size=16),
+    )
+    env.reset(seed=2)
+    for _ in walk(env, 40, seed=1):
+        img = env.render()
+        room = env.room_from_pos(*env.agent_pos)
+        width = room.size[0] + env.camera.extra_tiles[0]
+        height = room.size[1] + env.camera.extra_tiles[1]
+        top_x = max(0, min(env.agent_pos[0] - width // 2, env.width - width))
+        top_y = max(0, min(env.agent_pos[1] - height // 2, env.height - height))
+        assert np.array_equal(img, full_crop(env, 16, top_x, top_y, width, height))
+
+
+if __name__ == "__main__":
+    test_render_window_matches_full_render()
+    test_edge_follow_camera_is_pixel_identical()
+    test_agent_centered_camera_is_pixel_identical()
+    print("✅ Cameras render only their view, pixel-identical to full crops")
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Test showing frames on screen: views are drawn at the tile size that fits
+the screen and copied into persistent surfaces without rescaling.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pygame
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game.core.camera import AgentCenteredCamera, fit_tile_size
+from src.game.core.display import FrameBlitter
+from src.game.sar.env import PickupVictimEnv
+from src.game import test_environments
+
+# Draw into an offscreen display
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+
+def pixels(surface):
+    """(height, width, 3) copy of a surface's pixels."""
+    return pygame.surfarray.array3d(surface).swapaxes(0, 1)
+
+
+def test_fit_tile_size():
+    assert fit_tile_size((12, 12), (800, 800)) == 66
+    assert fit_tile_size((12, 6), (1920, 1080)) == 160
+    assert fit_tile_size((100, 100), (50, 50)) == 1
+
+
+def test_blitter_centres_frames_and_scales_oversized_ones():
+    pygame.init()
+    surface = pygame.Surface((120, 100))
+    blitter = FrameBlitter(surface, (80, 60), offset=(20, 10))
+    rng = np.random.default_rng(0)
+
+    frame = rng.integers(0, 256, (50, 70, 3), dtype=np.uint8)
+    blitter.blit(frame)
+    img = pixels(surface)
+    assert np.array_equal(img[15:65, 25:95], frame)
+    assert not img[:15].any() and not img[:, :25].any()
+
+    # A larger frame is scaled down to the whole area
+    blitter.blit(rng.integers(0, 256, (90, 90, 3), dtype=np.uint8))
+    assert pixels(surface)[10:70, 20:100].any()
+    pygame.quit()
+
+
+def test_screen_frames_fill_the_screen():
+    env = PickupVictimEnv(
+        room_size=8,
+        num_rows=3,
+        num_cols=3,
+        render_mode="rgb_array",
+        camera_strategy=AgentCenteredCamera(tile_size=16),
+    )
+    env.reset(seed=0)
+    # A 12x12 tile view at 50 px instead of the camera's 16 px
+    assert env.get_screen_frame((600, 600)).shape == (600, 600, 3)
+
+    env = test_environments.TestEnv(render_mode="rgb_array")
+    env.reset(seed=0)
+    tile_size = fit_tile_size((env.width, env.height), (400, 300))
+    frame = env.get_screen_frame((400, 300))
+    assert frame.shape == (env.height * tile_size, env.width * tile_size, 3)
+
+
+def test_human_render_draws_into_window():
+    env = PickupVictimEnv(
+        room_size=6, num_rows=2, num_cols=2, render_mode="human", screen_size=300
+    )
+    env.reset(seed=1)
+    for action in (2, 2, 1, 2):
+        env.step(action)
+        env.render()
+        frame = env.get_screen_frame((300, 300))
+        height, width = frame.shape[:2]
+        top, left = (300 - height) // 2, (300 - width) // 2
+        img = pixels(env.window)
+        assert np.array_equal(img[top : top + height, left : left + width], frame)
+    env.close()
+
+
+if __name__ == "__main__":
+    test_fit_tile_size()
+    test_blitter_centres_frames_and_scales_oversized_ones()
+    test_screen_frames_fill_the_screen()
+    test_human_render_draws_into_window()
+    print("✅ Frames are drawn to fit the screen and blitted without rescaling")
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Test get_state/set_state snapshots of PickupVictimEnv and SAREnv test envs.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game.sar.env import PickupVictimEnv
+from src.game.sar.utils import VictimPlacer
+from src.game.test_environments import TestEnv
+
+
+def make_env(backend="object"):
+    return PickupVictimEnv(
+        room_size=5,
+        num_rows=2,
+        num_cols=2,
+        victim_placer=VictimPlacer(num_fake_victims=2, num_real_victims=2),
+        render_mode=None,
+        backend=backend,
+    )
+
+
+def rollout(env, actions):
+    trajectory = []
+    for action in actions:
+        obs, reward, terminated, truncated, _ = env.step(int(action))
+        trajectory.append(
+            (
+                obs["image"].tobytes(),
+                reward,
+                terminated,
+                truncated,
+                env.grid.encode().tobytes(),
+                int(env.np_random.integers(1 << 30)),
+            )
+        )
+        if terminated or truncated:
+            break
+    return trajectory
+
+
+def check_branching(env, seed):
+    """Rolling out again from a restored snapshot repeats the trajectory."""
+    rng = np.random.default_rng(seed)
+    env.reset(seed=seed)
+    rollout(env, rng.integers(0, 6, size=20))
+
+    state = env.get_state()
+    actions = rng.integers(0, 6, size=200)
+    first = rollout(env, actions)
+    saved = getattr(env, "saved_victims", None)
+
+    # Diverge, then come back
+    rollout(env, rng.integers(0, 6, size=50))
+    env.set_state(state)
+    assert env.get_state().cells == state.cells
+    assert rollout(env, actions) == first
+    assert getattr(env, "saved_victims", None) == saved
+
+
+def test_pickup_victim_env_state():
+    for backend in ("object", "array"):
+        env = make_env(backend)
+        for seed in range(3):
+            check_branching(env, seed)
+
+
+def test_sar_env_state():
+    check_branching(TestEnv(render_mode=None), 0)
+
+
+def test_restore_after_reset():
+    """A snapshot restores the level into an env that has since been reset."""
+    for backend in ("object", "array"):
+        env = make_env(backend)
+        env.reset(seed=0)
+        actions = np.random.default_rng(0).integers(0, 6, size=200)
+        rollout(env, actions[:20])
+        state = env.get_state()
+        obs = env.gen_obs()["image"]
+        locked = [room.locked for row in env.room_grid for room in row]
+        level = (env.mission, env.max_steps, env.instrs, env.room_grid)
+        first = rollout(env, actions[20:])
+
+        env.reset(seed=1)
+        env.set_state(state)
+        assert (env.gen_obs()["image"] == obs).all()
+        assert env.grid.count("victim") == len(state.grid_state[2][0])
+        assert (env.mission, env.max_steps, env.instrs, env.room_grid) == level
+        assert [room.locked for row in env.room_grid for room in row] == locked
+        assert rollout(env, actions[20:]) == first
+
+
+def test_state_is_immutable():
+    env = make_env("array")
+    env.reset(seed=0)
+    state = env.get_state()
+    try:
+        state.grid_state[4][0, 0, 0] = 0
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("snapshot planes should be read-only")
+
+
+def test_snapshot_speed():
+    env = make_env("array")
+    env.reset(seed=0)
+    n = 2000
+    start = time.perf_counter()
+    for _ in range(n):
+        env.set_state(env.get_state())
+    per_call_us = (time.perf_counter() - start) / n * 1e6
+    print(f"  get_state + set_state: {per_call_us:.1f} us")
+
+
+if __name__ == "__main__":
+    test_pickup_victim_env_state()
+    test_sar_env_state()
+    test_restore_after_reset()
+    test_state_is_immutable()
+    test_snapshot_speed()
+    print("✅ Environment snapshots restore identical rollouts")
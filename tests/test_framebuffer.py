@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Test the dirty-tile framebuffer: frames match a full render after every
+step, snapshot restore and reset, while only changed tiles are redrawn.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+from minigrid.minigrid_env import MiniGridEnv
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game.core.camera import FullviewCamera
+from src.game.core.framebuffer import TileFramebuffer
+from src.game.sar.env import PickupVictimEnv
+from src.game import test_environments
+
+
+def full_render(env, tile_size):
+    return env.grid.render(tile_size, env.agent_pos, env.agent_dir, highlight_mask=None)
+
+
+def walk(env, steps, seed=0):
+    """Random steps, mostly forward, with pickups and toggles."""
+    rng = np.random.default_rng(seed)
+    for _ in range(steps):
+        _, _, terminated, truncated, _ = env.step(
+            int(rng.choice([0, 1, 2, 2, 2, 3, 5]))
+        )
+        if terminated or truncated:
+            env.reset()
+        yield
+
+
+def test_frames_match_full_render():
+    for backend in ("object", "array"):
+        env = PickupVictimEnv(
+            room_size=6,
+            num_rows=3,
+            num_cols=3,
+            backend=backend,
+            render_mode="rgb_array",
+            camera_strategy=FullviewCamera(tile_size=8),
+            framebuffer=True,
+        )
+        env.reset(seed=0)
+        redrawn = []
+        for _ in walk(env, 150):
+            assert np.array_equal(env.render(), full_render(env, 8))
+            redrawn.append(env.framebuffer.redrawn)
+        # A step changes a handful of tiles, not the whole 16x16 map
+        assert np.median(redrawn) <= 3
+
+
+def test_camera_crop_is_view_into_buffer():
+    env = PickupVictimEnv(
+        room_size=8, num_rows=3, num_cols=3, render_mode="rgb_array", framebuffer=True
+    )
+    env.reset(seed=1)
+    camera = env.camera
+    view_w, view_h = camera.config.view_tiles
+    tile_size = camera.config.tile_size
+    for _ in walk(env, 30, seed=1):
+        img = env.render()
+        assert np.shares_memory(img, env.framebuffer.img)
+        full = full_render(env, tile_size)
+        expected = full[
+            camera.top_y * tile_size : (camera.top_y + view_h) * tile_size,
+            camera.top_x * tile_size : (camera.top_x + view_w) * tile_size,
+        ]
+        assert np.array_equal(img, expected)
+
+
+def test_restore_and_reset_redraw():
+    env = PickupVictimEnv(
+        room_size=6,
+        num_rows=2,
+        num_cols=2,
+        render_mode="rgb_array",
+        camera_strategy=FullviewCamera(tile_size=8),
+        framebuffer=True,
+    )
+    env.reset(seed=2)
+    state = env.get_state()
+    env.render()
+    for _ in walk(env, 40, seed=2):
+        pass
+    env.render()
+
+    env.set_state(state)
+    assert np.array_equal(env.render(), full_render(env, 8))
+    env.reset(seed=3)
+    assert np.array_equal(env.render(), full_render(env, 8))
+
+
+def test_highlighted_frames_of_plain_grids():
+    env = test_environments.TestEnv(render_mode="rgb_array", framebuffer=True)
+    env.reset(seed=0)
+    rng = np.random.default_rng(0)
+    for _ in range(60):
+        env.step(int(rng.choice([0, 1, 2, 2, 3, 5])))
+        frame = env.get_frame(highlight=True, tile_size=8)
+        assert np.array_equal(frame, MiniGridEnv.get_full_render(env, True, 8))
+
+
+def test_untracked_changes_are_found():
+    env = test_environments.TestEnv(render_mode="rgb_array")
+    env.reset(seed=0)
+    framebuffer = TileFramebuffer()
+    framebuffer.render(env.grid, 8, env.agent_pos, env.agent_dir)
+    # Open the door in place, without telling the grid
+    door = env.grid.get(5, 6)
+    door.is_locked, door.is_open = False, True
+    img = framebuffer.render(env.grid, 8, env.agent_pos, env.agent_dir)
+    assert framebuffer.redrawn == 1
+    assert np.array_equal(img, full_render(env, 8))
+
+
+if __name__ == "__main__":
+    test_frames_match_full_render()
+    test_camera_crop_is_view_into_buffer()
+    test_restore_and_reset_redraw()
+    test_highlighted_frames_of_plain_grids()
+    test_untracked_changes_are_found()
+    print("✅ Framebuffer redraws only changed tiles and matches full renders")
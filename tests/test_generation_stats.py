@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Test that generation telemetry accounts for every attempt and sums across
+vector envs.
+"""
+
+import io
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game.sar.cache import LayoutCache
+from src.game.sar.env import PickupVictimEnv
+from src.game.sar.telemetry import GenerationStats
+from src.game.sar.vector import PickupVictimVecEnv, SharedMemoryVecEnv
+
+ENV_KWARGS = dict(
+    room_size=6, num_rows=3, num_cols=3, lava_probability=1.0, render_mode=None
+)
+
+
+def test_attempts_add_up():
+    env = PickupVictimEnv(**ENV_KWARGS)
+    for seed in range(10):
+        env.reset(seed=seed)
+
+    stats = env.generation_stats
+    assert stats.levels == 10
+    # Every attempt but the last of each level was rejected by one source
+    assert stats.attempts == stats.levels + sum(stats.rejections.values())
+    assert stats.calls["add_locked_rooms"] == stats.attempts
+    assert stats.retries["lava"] > 0
+    assert stats.generate_seconds >= sum(stats.seconds.values()) > 0
+    # Timings come from a PhaseProfiler, with percentiles per source
+    assert stats.timings.stats(["level"])["level"]["count"] == 10
+
+    summary = stats.summary()
+    assert summary["levels"] == 10 and summary["ms_per_level"] > 0
+    out = io.StringIO()
+    stats.report(out)
+    assert "check_objs_reachable" in out.getvalue()
+
+
+def test_loaded_levels_counted():
+    env = PickupVictimEnv(layout_cache=LayoutCache(), **ENV_KWARGS)
+    for seed in (0, 1, 0, 1):
+        env.reset(seed=seed)
+    assert (env.generation_stats.levels, env.generation_stats.loaded) == (2, 2)
+
+
+def test_vector_envs_sum_stats():
+    vec = PickupVictimVecEnv(3, **ENV_KWARGS)
+    vec.reset(seed=0)
+    total = vec.generation_stats()
+    expected = GenerationStats.total(env.generation_stats for env in vec.envs)
+    assert total.as_dict() == expected.as_dict()
+    assert total.levels == 3
+    vec.close()
+
+    shared = SharedMemoryVecEnv(3, num_workers=2, **ENV_KWARGS)
+    try:
+        shared.reset(seed=0)
+        stats = shared.generation_stats()
+        assert stats.levels == 3
+        assert stats.attempts == total.attempts
+    finally:
+        shared.close()
+
+
+if __name__ == "__main__":
+    test_attempts_add_up()
+    test_loaded_levels_counted()
+    test_vector_envs_sum_stats()
+    print("✅ Generation telemetry accounts for every attempt")
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Test that the numpy type/color/state planes stay in sync with the object grid.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from minigrid.core.grid import Grid
+
+from src.game.sar.env import PickupVictimEnv
+from src.game.sar.utils import VictimPlacer
+from src.game_recorder import GameRecorder
+
+
+def make_env():
+    return PickupVictimEnv(
+        room_size=6,
+        num_rows=2,
+        num_cols=2,
+        victim_placer=VictimPlacer(num_fake_victims=2, num_real_victims=2),
+        grid_arrays=True,
+        render_mode=None,
+    )
+
+
+def test_planes_match_encode():
+    """Vectorized encoding equals MiniGrid's per-object encoding."""
+    env = make_env()
+    rng = random.Random(0)
+    env.reset(seed=0)
+
+    for _ in range(1000):
+        _, _, terminated, truncated, _ = env.step(rng.randint(0, 5))
+        assert (env.grid.encode() == Grid.encode(env.grid)).all()
+        if terminated or truncated:
+            env.reset()
+
+
+def test_recorder_uses_planes():
+    """Recorder produces the same array from the planes as from a scan."""
+    env = make_env()
+    env.reset(seed=1)
+    recorder = GameRecorder(env)
+
+    from_planes = recorder._grid_to_array()
+    env.grid.arrays = False
+    from_scan = recorder._grid_to_array()
+
+    assert (from_planes == from_scan).all()
+
+
+if __name__ == "__main__":
+    test_planes_match_encode()
+    test_recorder_uses_planes()
+    print("✅ Grid planes match the object grid")
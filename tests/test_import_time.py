@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Import-time regression check for the simulation core.
+
+Runs ``python -X importtime`` in a fresh interpreter and checks that importing
+the core does not pull in the GUI stack and stays within a fixed time budget.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Total budget for importing the core, including MiniGrid/gymnasium/numpy
+CORE_IMPORT_BUDGET_MS = 2000
+# Budget for the self time of this project's own modules
+OWN_MODULES_BUDGET_MS = 50
+
+CORE_MODULE = "src.game.sar.env"
+FORBIDDEN_MODULES = ("pygame_gui", "src.game.gui")
+
+
+def import_times(module):
+    """Return {module: (self_us, cumulative_us)} from ``-X importtime``."""
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def test_core_import_budget():
+    times = import_times(CORE_MODULE)
+
+    for forbidden in FORBIDDEN_MODULES:
+        loaded = [
+            name
+            for name in times
+            if name == forbidden or name.startswith(forbidden + ".")
+        ]
+        assert not loaded, f"core import pulled in {loaded}"
+
+    total_ms = times[CORE_MODULE][1] / 1000
+    own_ms = sum(s for name, (s, _) in times.items() if name.startswith("src.")) / 1000
+    print(f"  {CORE_MODULE}: {total_ms:.1f} ms total, {own_ms:.1f} ms in src.*")
+
+    assert total_ms < CORE_IMPORT_BUDGET_MS
+    assert own_ms < OWN_MODULES_BUDGET_MS
+
+
+def test_package_import_is_lazy():
+    times = import_times("src.game")
+    assert "src.game.sar.env" not in times
+    assert "minigrid" not in times
+
+
+if __name__ == "__main__":
+    test_core_import_budget()
+    test_package_import_is_lazy()
+    print("✅ Core import within budget")
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Test generation on large room grids: every room connected, no restarts, and
+reset time roughly linear in the number of rooms.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game.sar.env import PickupVictimEnv
+from src.game.sar.reachability import reachable_cells
+
+
+def make_env(size, **kwargs):
+    return PickupVictimEnv(
+        room_size=6, num_rows=size, num_cols=size, render_mode=None, **kwargs
+    )
+
+
+def unreachable_objects(env):
+    reachable = reachable_cells(env.grid, env.agent_pos)
+    return [
+        pos
+        for category in ("key", "victim", "fake_victim")
+        for pos in env.grid.positions[category]
+        if pos not in reachable
+    ]
+
+
+def test_rooms_connected_without_restarts():
+    env = make_env(20)
+    for seed in range(2):
+        env.reset(seed=seed)
+        rooms = [room for row in env.room_grid for room in row]
+        unlocked = [room for room in rooms if not room.locked]
+        doors = env.grid.find("door")
+        locked = [door for door in doors if door.is_locked]
+
+        # A locked door per locked room, and a spanning tree of open doors
+        assert len(locked) == env.num_locked_rooms == len(rooms) - len(unlocked)
+        assert len(doors) - len(locked) == len(unlocked) - 1
+
+        # Doors count as passable: every door and object can be reached
+        reachable = reachable_cells(env.grid, env.agent_pos)
+        assert all(tuple(door.cur_pos) in reachable for door in doors)
+        assert not unreachable_objects(env)
+
+    stats = env.generation_stats
+    assert stats.attempts == stats.levels == 2
+
+
+def test_crowded_rooms_keep_objects_reachable():
+    # Small rooms full of lava leave little space for victims
+    env = PickupVictimEnv(
+        room_size=5, num_rows=4, num_cols=4, lava_per_room=3, render_mode=None
+    )
+    for seed in range(10):
+        env.reset(seed=seed)
+        assert not unreachable_objects(env)
+
+
+def test_max_steps_from_new_level():
+    env = make_env(4)
+    env.reset(seed=0)
+    first = env.max_steps
+    env.reset(seed=1)
+    env.reset(seed=0)
+    assert env.max_steps == first
+
+
+def test_linear_scaling():
+    per_room = {}
+    for size in (5, 20):
+        env = make_env(size)
+        env.reset(seed=0)
+        start = time.perf_counter()
+        env.reset(seed=1)
+        per_room[size] = (time.perf_counter() - start) / size**2
+        print(f"  {size}x{size}: {per_room[size] * 1e3:.2f} ms per room")
+    # Generous bound; quadratic generation would be ~16x
+    assert per_room[20] < 4 * per_room[5]
+
+
+if __name__ == "__main__":
+    test_rooms_connected_without_restarts()
+    test_crowded_rooms_keep_objects_reachable()
+    test_max_steps_from_new_level()
+    test_linear_scaling()
+    print("✅ Large room grids generate in linear time")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test that lava placement never cuts off doors, keys or free cells.
+"""
+
+import sys
+from pathlib import Path
+
+import gymnasium as gym
+from minigrid.core.grid import Grid
+from minigrid.core.roomgrid import RoomGrid
+from minigrid.core.world_object import Door, Key, Lava
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game.sar.env import PickupVictimEnv
+from src.game.sar.reachability import can_block, is_passable, reachable_cells
+from src.game.sar.utils import LavaPlacer
+
+
+def test_can_block_local_cases():
+    grid = Grid(7, 5)
+    grid.wall_rect(0, 0, 7, 5)
+
+    # Open interior: blocking the middle keeps its neighbours connected
+    assert can_block(grid, 3, 2)
+
+    # One-wide corridor: blocking any cell of it splits it
+    grid.horz_wall(1, 1, 5)
+    grid.horz_wall(1, 3, 5)
+    assert not can_block(grid, 3, 2)
+
+    # Dead end next to a key: the key would be cut off
+    grid = Grid(5, 3)
+    grid.wall_rect(0, 0, 5, 3)
+    grid.set(1, 1, Key("red"))
+    assert not can_block(grid, 2, 1)
+
+    # Cell in front of a door
+    grid = Grid(7, 5)
+    grid.wall_rect(0, 0, 7, 5)
+    grid.vert_wall(3, 0, 5)
+    grid.set(3, 2, Door("red"))
+    assert not can_block(grid, 2, 2)
+    assert can_block(grid, 1, 1)
+
+
+def test_dense_lava_keeps_level_connected():
+    """Even when rooms are flooded, every object stays reachable."""
+    env = PickupVictimEnv(
+        room_size=6, num_rows=3, num_cols=3, render_mode=None, add_lava=False
+    )
+    placer = LavaPlacer(lava_per_room=20)
+
+    for seed in range(10):
+        gym.Env.reset(env, seed=seed)
+        RoomGrid._gen_grid(env, env.width, env.height)
+        env.agent_pos = (1, 1)
+        env.connect_all()
+
+        placed = sum(
+            placer.place_in_room(env, i, j) for i in range(3) for j in range(3)
+        )
+        assert placed > 0
+
+        passable = [
+            (x, y)
+            for x in range(env.width)
+            for y in range(env.height)
+            if is_passable(env.grid, x, y)
+            and not isinstance(env.grid.get(x, y), Door)
+        ]
+        reach = reachable_cells(env.grid, passable[0])
+        assert set(passable) <= reach
+        for x in range(env.width):
+            for y in range(env.height):
+                cell = env.grid.get(x, y)
+                if cell is not None and cell.type != "wall":
+                    assert (x, y) in reach, f"{cell.type} at {(x, y)} cut off"
+
+        lava = sum(isinstance(c, Lava) for c in env.grid.grid)
+        print(f"  seed {seed}: {lava} lava tiles, all objects reachable")
+
+
+if __name__ == "__main__":
+    test_can_block_local_cases()
+    test_dense_lava_keeps_level_connected()
+    print("✅ Lava placement preserves connectivity")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test that LayoutCache restores generated layouts, evicts least recently used
+ones and misses once settings or generator code change.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game.sar.cache import LayoutCache
+from src.game.sar.env import PickupVictimEnv
+from src.game.sar.utils import VictimPlacer
+
+
+def make_env(**kwargs):
+    kwargs.setdefault(
+        "victim_placer", VictimPlacer(num_fake_victims=2, num_real_victims=1)
+    )
+    return PickupVictimEnv(
+        room_size=6, num_rows=3, num_cols=3, render_mode=None, **kwargs
+    )
+
+
+class LeftFacingPlacer(VictimPlacer):
+    """Placer with the default parameters that places other victims."""
+
+    def victim_for(self, level_gen, room):
+        return self.victims["left"]
+
+
+def test_restores_generated_layout():
+    generated = make_env()
+    cached = make_env(layout_cache=LayoutCache())
+    for seed in (3, 4, 3, 4):
+        obs, _ = generated.reset(seed=seed)
+        cached_obs, _ = cached.reset(seed=seed)
+        assert (cached.grid.encode() == generated.grid.encode()).all()
+        assert (cached_obs["image"] == obs["image"]).all()
+        assert cached.agent_pos == generated.agent_pos
+        assert cached.mission == generated.mission
+        assert (
+            cached.np_random.bit_generator.state
+            == generated.np_random.bit_generator.state
+        )
+
+    stats = cached.layout_cache.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (2, 2, 2)
+
+    # Resets without a seed bypass the cache
+    cached.reset()
+    assert cached.layout_cache.stats()["misses"] == 2
+
+
+def test_lru_eviction():
+    cache = LayoutCache(max_levels=2)
+    env = make_env(layout_cache=cache)
+    for seed in (0, 1, 0, 2):
+        env.reset(seed=seed)
+    # Seed 1 was least recently used when seed 2 came in
+    assert len(cache) == 2 and cache.evictions == 1
+    assert cache.get(env, 0) is not None
+    assert cache.get(env, 1) is None
+
+
+def test_disk_tier_and_invalidation():
+    with tempfile.TemporaryDirectory() as path:
+        env = make_env(layout_cache=LayoutCache(path=path))
+        env.reset(seed=5)
+        expected = env.grid.encode()
+
+        # A new process sees the layout on disk
+        fresh = LayoutCache(path=path)
+        env = make_env(layout_cache=fresh)
+        env.reset(seed=5)
+        assert fresh.disk_hits == 1
+        assert (env.grid.encode() == expected).all()
+
+        # Other settings, placers or generator code: a different key
+        assert fresh.get(make_env(locked_room_prob=0.2), 5) is None
+        placer = VictimPlacer(2, 1, important_victim="down")
+        assert fresh.get(make_env(victim_placer=placer), 5) is None
+        assert fresh.get(make_env(victim_placer=LeftFacingPlacer(2, 1)), 5) is None
+        assert LayoutCache(path=path, fingerprint="edited").get(env, 5) is None
+
+
+if __name__ == "__main__":
+    test_restores_generated_layout()
+    test_lru_eviction()
+    test_disk_tier_and_invalidation()
+    print("✅ Layout cache restores generated layouts")
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Test lazy rooms: contents depend only on the seed and the room, victims of
+unfilled rooms still count towards the mission, and resets get cheaper.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game.sar.cache import LayoutCache
+from src.game.sar.env import PickupVictimEnv
+from src.game.sar.reachability import reachable_cells
+
+
+def make_env(size=6, lazy_rooms=True, room_size=6, **kwargs):
+    return PickupVictimEnv(
+        room_size=room_size,
+        num_rows=size,
+        num_cols=size,
+        lazy_rooms=lazy_rooms,
+        render_mode=None,
+        **kwargs,
+    )
+
+
+def clear_victims(env):
+    for pos in list(env.grid.positions["victim"]):
+        env.grid.set(*pos, None)
+
+
+def test_contents_independent_of_fill_order():
+    forward, backward = make_env(), make_env()
+    forward.reset(seed=3)
+    backward.reset(seed=3)
+    rooms = [(i, j) for i, j, _ in forward._rooms()]
+    for i, j in rooms:
+        forward.materialize_room(i, j)
+    for i, j in reversed(rooms):
+        backward.materialize_room(i, j)
+    assert np.array_equal(forward.grid.encode(), backward.grid.encode())
+
+    # Filling rooms does not draw from the episode's RNG
+    draws = [env.np_random.integers(1 << 30) for env in (forward, backward)]
+    assert draws[0] == draws[1]
+
+
+def test_only_seen_rooms_are_filled():
+    env = make_env(8)
+    env.reset(seed=0)
+    filled = len(env._materialized_rooms)
+    assert 1 <= filled < 64
+    assert env.grid.count("victim") == filled
+
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        env.step(int(rng.integers(0, 3)))
+    assert len(env._materialized_rooms) >= filled
+
+
+def test_pending_victims_count_towards_mission():
+    env = make_env(4)
+    env.reset(seed=1)
+    total = 16 * env.victim_placer.num_real_victims
+    assert env.instrs.num_victims == total
+    assert env.get_mission_status()["remaining_victims"] == total
+
+    # Rescuing every victim in sight does not finish the mission
+    clear_victims(env)
+    assert env.instrs.verify(None) == "continue"
+    assert env.engine is None or not env.engine._mission_complete()
+
+    env.materialize_all()
+    assert env.pending_victims == 0
+    assert env.get_mission_status()["remaining_victims"] == env.grid.count("victim")
+    clear_victims(env)
+    assert env.instrs.verify(None) == "success"
+
+
+def test_filled_rooms_stay_reachable():
+    configs = [
+        dict(size=10, lava_per_room=2, seeds=range(2, 5)),
+        # Small rooms full of lava and keys, where fills get redrawn
+        dict(size=4, room_size=5, lava_per_room=3, seeds=range(20)),
+    ]
+    for config in configs:
+        seeds = config.pop("seeds")
+        env = make_env(**config)
+        for seed in seeds:
+            env.reset(seed=seed)
+            env.materialize_all()
+            assert env.grid.get(*env.agent_pos) is None
+
+            reachable = reachable_cells(env.grid, env.agent_pos)
+            unreachable = [
+                pos
+                for category in ("key", "victim", "fake_victim")
+                for pos in env.grid.positions[category]
+                if pos not in reachable
+            ]
+            assert not unreachable, (config, seed, unreachable)
+
+
+def test_backends_fill_the_same_rooms():
+    envs = [make_env(5, backend=backend) for backend in ("object", "array")]
+    for env in envs:
+        env.reset(seed=4)
+    rng = np.random.default_rng(1)
+    for _ in range(100):
+        action = int(rng.integers(0, 3))
+        for env in envs:
+            env.step(action)
+    assert envs[0]._materialized_rooms == envs[1]._materialized_rooms
+    assert np.array_equal(envs[0].grid.encode(), envs[1].grid.encode())
+
+
+def test_state_restores_filled_rooms():
+    env = make_env(5)
+    env.reset(seed=5)
+    state = env.get_state()
+    filled = env._materialized_rooms
+    env.materialize_all()
+    env.set_state(state)
+    assert env._materialized_rooms == filled
+    assert env.grid.count("victim") == len(filled)
+
+
+def test_rejects_stored_levels():
+    try:
+        make_env(layout_cache=LayoutCache())
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("lazy_rooms with a layout cache should raise")
+
+
+def test_lazy_reset_is_cheaper():
+    times = {}
+    for lazy in (False, True):
+        env = make_env(24, lazy_rooms=lazy)
+        env.reset(seed=0)
+        start = time.perf_counter()
+        env.reset(seed=1)
+        times[lazy] = time.perf_counter() - start
+        print(f"  lazy_rooms={lazy}: {times[lazy] * 1e3:.1f} ms per reset")
+    assert times[True] < times[False]
+
+
+if __name__ == "__main__":
+    test_contents_independent_of_fill_order()
+    test_only_seen_rooms_are_filled()
+    test_pending_victims_count_towards_mission()
+    test_filled_rooms_stay_reachable()
+    test_backends_fill_the_same_rooms()
+    test_state_restores_filled_rooms()
+    test_rejects_stored_levels()
+    test_lazy_reset_is_cheaper()
+    print("✅ Lazy rooms fill deterministically and keep the mission honest")
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Test in-place level mutation: edits keep every level solvable, keep the
+instruction and grid bookkeeping in sync, and cost far less than a reset.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from minigrid.core.grid import Grid
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game.sar.env import PickupVictimEnv
+from src.game.sar.pool import LevelPool
+from src.game.sar.reachability import NEIGHBORS
+
+
+def make_env(size=5, **kwargs):
+    return PickupVictimEnv(
+        room_size=6, num_rows=size, num_cols=size, render_mode=None, **kwargs
+    )
+
+
+def solve(env):
+    """
+    Cells reached by walking from the agent and opening locked doors with
+    the keys picked up on the way, and the objects next to them.
+    """
+    grid = env.grid
+    keys = set()
+    seen = {tuple(env.agent_pos)}
+    stack = [tuple(env.agent_pos)]
+    waiting = []
+    touched = set()
+    while stack:
+        x, y = stack.pop()
+        for dx, dy in NEIGHBORS:
+            pos = (x + dx, y + dy)
+            if pos in seen:
+                continue
+            cell = grid.get(*pos)
+            if cell is not None and cell.type == "door" and cell.is_locked:
+                if cell.color not in keys:
+                    waiting.append(pos)
+                    continue
+            elif cell is not None and cell.type != "door":
+                touched.add(pos)
+                if cell.type == "key":
+                    keys.add(cell.color)
+                continue
+            seen.add(pos)
+            stack.append(pos)
+        if not stack:
+            # Doors whose key turned up since they were first met
+            stack = [pos for pos in waiting if grid.get(*pos).color in keys]
+            waiting = [pos for pos in waiting if grid.get(*pos).color not in keys]
+            seen.update(stack)
+    return seen, touched
+
+
+def test_random_mutations_keep_level_solvable():
+    env = make_env(6)
+    env.reset(seed=0)
+    applied = env.mutate(300)
+    ops = {op for op, _, _ in applied}
+    assert ops == {"add", "remove", "move", "toggle_lock"}
+
+    seen, touched = solve(env)
+    doors = env.grid.positions["door"]
+    assert doors <= seen
+    objects = [
+        pos
+        for category in ("key", "victim", "fake_victim")
+        for pos in env.grid.positions[category]
+    ]
+    unreachable = [pos for pos in objects if pos not in touched]
+    assert not unreachable, unreachable
+
+    # Each locked door still has a key of its colour
+    for color in {env.grid.get(*pos).color for pos in doors}:
+        locked = sum(
+            env.grid.get(*pos).is_locked and env.grid.get(*pos).color == color
+            for pos in doors
+        )
+        keys = sum(
+            env.grid.get(*pos).color == color for pos in env.grid.positions["key"]
+        )
+        assert keys >= locked
+
+
+def test_stored_levels_mutate_like_generated_ones():
+    generated = make_env(lava_per_room=2)
+    pool = LevelPool.for_env(generated)
+    pooled = make_env(lava_per_room=2, level_pool=pool)
+    generated.reset(seed=4)
+    pool.record(4, generated)
+    pooled.reset(seed=4)
+
+    # Loaded rooms hold no objects; lava is found on the grid
+    lava = generated.mutator.positions("lava")
+    assert lava and pooled.mutator.positions("lava") == lava
+
+    pooled.mutate(200)
+    _, touched = solve(pooled)
+    assert all(
+        pos in touched
+        for category in ("key", "victim", "fake_victim")
+        for pos in pooled.grid.positions[category]
+    )
+
+
+def test_instruction_follows_victims():
+    env = make_env()
+    env.reset(seed=1)
+    total = env.instrs.num_victims
+    mutator = env.mutator
+
+    pos = mutator.add("victim", room=(0, 0))
+    assert pos is not None and env.instrs.num_victims == total + 1
+    mutator.remove(pos)
+    assert env.instrs.num_victims == total
+    assert str(total) in env.mission
+
+    victim = mutator.positions("victim")[0]
+    new_pos = mutator.move(victim, room=(1, 1))
+    assert env.grid.get(*victim) is None and env.grid.count("victim") == total
+    assert env.room_from_pos(*new_pos) is env.get_room(1, 1)
+
+
+def test_toggle_lock_adds_and_removes_key():
+    env = make_env()
+    env.reset(seed=2)
+    mutator = env.mutator
+    door_pos = next(
+        pos for pos in sorted(env.grid.positions["door"])
+        if not env.grid.get(*pos).is_locked
+    )
+    door = env.grid.get(*door_pos)
+    keys = env.grid.count("key")
+
+    key_pos = mutator.toggle_lock(door_pos)
+    assert door.is_locked and env.grid.count("key") == keys + 1
+    assert env.grid.get(*key_pos).color == door.color
+    assert env.room_from_pos(*key_pos) in [
+        env.get_room(i, j) for i, j in mutator.reachable_rooms()
+    ]
+
+    mutator.toggle_lock(door_pos)
+    assert not door.is_locked and env.grid.count("key") == keys
+
+
+def test_unlocking_inner_door_keeps_chain_locked():
+    # Three rooms in a row with the agent at one end
+    env = PickupVictimEnv(room_size=6, num_rows=1, num_cols=3, render_mode=None)
+    seed = 0
+    while True:
+        env.reset(seed=seed)
+        if env.room_from_pos(*env.agent_pos) is not env.get_room(1, 0):
+            break
+        seed += 1
+    near = 0 if env.room_from_pos(*env.agent_pos) is env.get_room(0, 0) else 2
+    far = 2 - near
+    # Door 0 of a room is on its right
+    outer = env.get_room(min(near, 1), 0).door_pos[0]
+    inner = env.get_room(min(far, 1), 0).door_pos[0]
+
+    mutator = env.mutator
+    for pos in (inner, outer):
+        if not env.grid.get(*pos).is_locked:
+            mutator.toggle_lock(pos)
+    assert env.get_room(1, 0).locked and env.get_room(far, 0).locked
+
+    # The far room still opens only into a locked room
+    mutator.toggle_lock(inner)
+    assert env.get_room(1, 0).locked and env.get_room(far, 0).locked
+    assert not env.get_room(near, 0).locked
+    assert mutator.solvable()
+
+    mutator.toggle_lock(outer)
+    assert not any(room.locked for _, _, room in env._rooms())
+
+
+def test_arrays_stay_in_sync():
+    env = make_env(grid_arrays=True)
+    env.reset(seed=3)
+    env.mutate(100)
+    assert np.array_equal(env.grid.encode(), Grid.encode(env.grid))
+
+
+def test_mutation_is_cheaper_than_reset():
+    env = make_env(10)
+    env.reset(seed=0)
+    start = time.perf_counter()
+    env.reset(seed=1)
+    reset = time.perf_counter() - start
+
+    start = time.perf_counter()
+    env.mutate(200)
+    mutation = (time.perf_counter() - start) / 200
+    print(f"  reset {reset * 1e3:.1f} ms, mutation {mutation * 1e3:.3f} ms")
+    # Typically ~1000x; bound kept loose for slow machines
+    assert mutation * 50 < reset
+
+
+if __name__ == "__main__":
+    test_random_mutations_keep_level_solvable()
+    test_stored_levels_mutate_like_generated_ones()
+    test_instruction_follows_victims()
+    test_toggle_lock_adds_and_removes_key()
+    test_unlocking_inner_door_keeps_chain_locked()
+    test_arrays_stay_in_sync()
+    test_mutation_is_cheaper_than_reset()
+    print("✅ Level mutations stay solvable and cheap")
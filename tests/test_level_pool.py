@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Test that levels loaded from a LevelPool play exactly like the generated ones.
+"""
+
+import sys
+import tempfile
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game.sar.env import PickupVictimEnv
+from src.game.sar.pool import LevelPool
+from src.game.sar.utils import VictimPlacer
+
+
+def make_env(**kwargs):
+    kwargs.setdefault(
+        "victim_placer", VictimPlacer(num_fake_victims=2, num_real_victims=1)
+    )
+    return PickupVictimEnv(
+        room_size=6, num_rows=3, num_cols=3, render_mode=None, **kwargs
+    )
+
+
+def test_pooled_level_matches_generated():
+    for backend in ("object", "array"):
+        generated = make_env(backend=backend)
+        pool = LevelPool.for_env(generated)
+        pooled = make_env(backend=backend, level_pool=pool)
+        rng = np.random.default_rng(0)
+
+        for seed in range(3):
+            obs, _ = generated.reset(seed=seed)
+            pool.record(seed, generated)
+            pooled_obs, _ = pooled.reset(seed=seed)
+
+            assert (pooled.grid.encode() == generated.grid.encode()).all()
+            assert (pooled_obs["image"] == obs["image"]).all()
+            assert pooled.mission == generated.mission
+            assert pooled.max_steps == generated.max_steps
+            assert [room.locked for row in pooled.room_grid for room in row] == [
+                room.locked for row in generated.room_grid for room in row
+            ]
+            # The RNG continues from where generation left it
+            assert (
+                pooled.np_random.bit_generator.state
+                == generated.np_random.bit_generator.state
+            )
+
+            for _ in range(200):
+                action = int(rng.integers(0, 6))
+                expected = generated.step(action)
+                result = pooled.step(action)
+                assert (result[0]["image"] == expected[0]["image"]).all()
+                assert result[1:4] == expected[1:4]
+                if expected[2] or expected[3]:
+                    break
+
+        assert pool.stats()["hits"] == 3
+
+
+def test_locked_rooms_are_stored():
+    """
+    With two rooms and one locked, the unlocked room's only door is the
+    locked one; the flags come from the level, not from the doors.
+    """
+    generated = PickupVictimEnv(
+        room_size=6, num_rows=1, num_cols=2, locked_room_prob=0.5, render_mode=None
+    )
+    pool = LevelPool.for_env(generated)
+    with tempfile.TemporaryDirectory() as path:
+        for seed in range(4):
+            generated.reset(seed=seed)
+            pool.record(seed, generated)
+        pool.save(path)
+        pooled = PickupVictimEnv(
+            room_size=6,
+            num_rows=1,
+            num_cols=2,
+            locked_room_prob=0.5,
+            render_mode=None,
+            level_pool=LevelPool.load(path),
+        )
+        for seed in range(4):
+            generated.reset(seed=seed)
+            pooled.reset(seed=seed)
+            locked = [room.locked for room in pooled.room_grid[0]]
+            assert locked == [room.locked for room in generated.room_grid[0]]
+            assert sorted(locked) == [False, True]
+
+
+def test_save_load_and_stats():
+    pool = LevelPool.generate(
+        3,
+        seed=10,
+        room_size=6,
+        num_rows=3,
+        num_cols=3,
+        victim_placer=VictimPlacer(num_fake_victims=2, num_real_victims=1),
+        render_mode=None,
+    )
+    with tempfile.TemporaryDirectory() as path:
+        pool.save(path)
+        loaded = LevelPool.load(path)
+        assert isinstance(loaded.level(0)[0], np.memmap)
+        assert len(loaded) == 3 and 11 in loaded
+
+        env = make_env(level_pool=loaded)
+        env.reset(seed=11)
+        assert (env.grid.encode() == pool.level(1)[0]).all()
+
+        # Unknown seed: generated and added; no seed: sampled from the pool
+        env.reset(seed=99)
+        assert 99 in loaded
+        env.reset()
+        stats = loaded.stats()
+        assert (stats["hits"], stats["misses"], stats["size"]) == (2, 1, 4)
+
+
+class LeftFacingPlacer(VictimPlacer):
+    """Placer with the default parameters that places other victims."""
+
+    def victim_for(self, level_gen, room):
+        return self.victims["left"]
+
+
+def test_incompatible_pool_rejected():
+    pool = LevelPool.for_env(make_env())
+    for kwargs in (
+        {"locked_room_prob": 0.2},
+        {"victim_placer": VictimPlacer(2, 1, important_victim="down")},
+        {"victim_placer": LeftFacingPlacer(2, 1)},
+    ):
+        try:
+            make_env(level_pool=pool, **kwargs)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"expected ValueError for a pool without {kwargs}")
+
+
+def test_background_refill():
+    env = make_env()
+    pool = LevelPool.for_env(env)
+    pool.start_refill(
+        2,
+        seed=5,
+        room_size=6,
+        num_rows=3,
+        num_cols=3,
+        victim_placer=VictimPlacer(num_fake_victims=2, num_real_victims=1),
+        render_mode=None,
+    )
+    assert pool.refilling
+    while pool.refilling:
+        pool.poll(timeout=30)
+    assert len(pool) == 2 and 5 in pool and 6 in pool
+
+
+def make_custom_env(**kwargs):
+    """Env with non-default settings throughout."""
+    settings = dict(
+        room_size=5,
+        num_rows=2,
+        num_cols=2,
+        lava_per_room=1,
+        victim_placer=VictimPlacer(1, 2, important_victim="left"),
+        render_mode=None,
+    )
+    return PickupVictimEnv(**(settings | kwargs))
+
+
+def test_refill_uses_pool_settings():
+    env = make_custom_env()
+    pool = LevelPool.for_env(env)
+    # No env_fn or env_kwargs: the refill env takes the pool's settings
+    pool.start_refill(2)
+    while pool.refilling:
+        pool.poll(timeout=30)
+    assert len(pool) == 2
+
+    env.level_pool = pool
+    env.reset(seed=0)
+    assert pool.stats()["hits"] == 1
+    fresh = make_custom_env()
+    fresh.reset(seed=0)
+    assert np.array_equal(env.grid.encode(), fresh.grid.encode())
+
+    # Envs that do not fit are refused before any process starts
+    for kwargs in ({"room_size": 6}, {"lava_per_room": 2}):
+        try:
+            pool.start_refill(1, env_fn=partial(make_custom_env, **kwargs))
+        except ValueError:
+            assert not pool.refilling
+        else:
+            raise AssertionError(f"expected ValueError for a refill with {kwargs}")
+
+    custom = LevelPool.for_env(make_env(victim_placer=LeftFacingPlacer(2, 1)))
+    try:
+        custom.start_refill(1)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError for a custom placer")
+
+
+if __name__ == "__main__":
+    test_pooled_level_matches_generated()
+    test_locked_rooms_are_stored()
+    test_save_load_and_stats()
+    test_incompatible_pool_rejected()
+    test_background_refill()
+    test_refill_uses_pool_settings()
+    print("✅ Level pool reproduces generated levels")
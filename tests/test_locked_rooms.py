@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test rejection-free locked-room and key placement.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import gymnasium as gym
+from minigrid.core.roomgrid import RoomGrid
+from minigrid.core.world_object import Door, Key
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game.sar.env import PickupVictimEnv
+
+
+def make_env(size, locked_room_prob):
+    return PickupVictimEnv(
+        room_size=6,
+        num_rows=size,
+        num_cols=size,
+        locked_room_prob=locked_room_prob,
+        add_lava=False,
+        render_mode=None,
+    )
+
+
+def lock_rooms(env, seed):
+    """Lay out an empty room grid and run add_locked_rooms on it."""
+    gym.Env.reset(env, seed=seed)
+    RoomGrid._gen_grid(env, env.width, env.height)
+    env.add_locked_rooms(env.num_locked_rooms)
+
+
+def test_locks_and_keys():
+    env = make_env(4, 0.75)
+    for seed in range(20):
+        lock_rooms(env, seed)
+
+        doors = [obj for obj in env.grid.grid if isinstance(obj, Door)]
+        keys = [obj for obj in env.grid.grid if isinstance(obj, Key)]
+        assert len(doors) == env.num_locked_rooms
+        assert all(door.is_locked for door in doors)
+        assert sorted(k.color for k in keys) == sorted(d.color for d in doors)
+
+        # Keys lie in unlocked rooms, within the per-room cap
+        key_rooms = [env.room_from_pos(*key.cur_pos) for key in keys]
+        for room in key_rooms:
+            assert not room.locked
+            assert key_rooms.count(room) <= env.max_keys_per_room
+
+
+def test_full_generation_high_lock_probability():
+    env = make_env(3, 0.7)
+    for seed in range(3):
+        env.reset(seed=seed)
+        doors = [obj for obj in env.grid.grid if isinstance(obj, Door)]
+        assert sum(door.is_locked for door in doors) >= env.num_locked_rooms
+
+
+def test_impossible_request():
+    for size, prob in ((1, 0.5), (3, 1.0), (4, 0.9)):
+        try:
+            make_env(size, prob)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"expected ValueError for {size}x{size}, {prob}")
+
+
+def test_linear_scaling():
+    for size in (4, 8, 16):
+        env = make_env(size, 0.5)
+        start = time.perf_counter()
+        lock_rooms(env, 0)
+        elapsed = time.perf_counter() - start
+        print(
+            f"  {size}x{size}: {env.num_locked_rooms} locked "
+            f"in {elapsed * 1e3:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    test_locks_and_keys()
+    test_full_generation_high_lock_probability()
+    test_impossible_request()
+    test_linear_scaling()
+    print("✅ Locked rooms placed without rejection")
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Test the opt-in PhaseProfiler instrumentation.
+"""
+
+import io
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game.core.profiling import PhaseProfiler
+from src.game.sar.env import PickupVictimEnv
+from src.game.sar.pool import LevelPool
+from src.game.sar.utils import VictimPlacer
+
+
+def make_env(**kwargs):
+    return PickupVictimEnv(
+        room_size=5,
+        num_rows=2,
+        num_cols=2,
+        victim_placer=VictimPlacer(num_fake_victims=1, num_real_victims=1),
+        render_mode="rgb_array",
+        **kwargs,
+    )
+
+
+def run_episode(env, steps=50):
+    env.reset(seed=0)
+    for i in range(steps):
+        _, _, terminated, truncated, _ = env.step(i % 6)
+        env.render()
+        if terminated or truncated:
+            env.reset()
+
+
+def test_phases_recorded():
+    env = make_env()
+    profiler = PhaseProfiler()
+    profiler.attach(env)
+    run_episode(env)
+
+    stats = profiler.stats()
+    for phase in ("reset", "step", "gen_mission", "gen_obs", "render", "camera"):
+        assert phase in stats, f"missing phase {phase}"
+    assert stats["step"]["count"] == 50
+    assert stats["render"]["count"] == 50
+    assert stats["gen_mission"]["count"] >= stats["reset"]["count"]
+    for s in stats.values():
+        assert 0 <= s["p50"] <= s["p99"]
+        assert s["total"] >= s["mean"] > 0
+
+    print(profiler.report())
+
+
+def test_detach_restores_methods():
+    env = make_env()
+    profiler = PhaseProfiler()
+    profiler.attach(env)
+    profiler.detach(env)
+    assert "step" not in env.__dict__ and "gen_obs" not in env.__dict__
+
+    run_episode(env, steps=10)
+    assert profiler.stats() == {}
+
+
+def test_periodic_dump():
+    stream = io.StringIO()
+    env = make_env(backend="array")
+    profiler = PhaseProfiler(dump_interval=0, stream=stream)
+    profiler.attach(env)
+    run_episode(env, steps=3)
+
+    assert stream.getvalue().count("phase") == 3
+    assert "engine_gen_obs" in profiler.stats()
+
+
+def test_verify_timed_on_stored_and_mutated_levels():
+    env = make_env()
+    pool = LevelPool.for_env(env)
+    env.level_pool = pool
+    profiler = PhaseProfiler()
+    profiler.attach(env)
+    pickup = env.actions.pickup
+
+    # A miss generates and records the level, so the next reset is a hit
+    env.reset(seed=0)
+    env.reset(seed=0)
+    assert pool.stats()["hits"] == 1
+    env.step(pickup)
+    verified = profiler.counts.get("verify", 0)
+    assert verified > 0
+
+    # Mutations rebuild the instruction when victims change
+    instrs = env.instrs
+    while env.instrs is instrs:
+        env.mutate()
+    env.step(pickup)
+    assert profiler.counts["verify"] > verified
+
+
+def test_merge():
+    first, second = PhaseProfiler(), PhaseProfiler(max_samples=2)
+    first.record("step", 1.0)
+    for seconds in (2.0, 3.0, 4.0):
+        second.record("step", seconds)
+    second.record("render", 5.0)
+
+    first.merge(second)
+    assert first.counts == {"step": 4, "render": 1}
+    assert first.totals["step"] == 10.0
+    # Samples the other profiler no longer kept are not recovered
+    assert list(first.samples["step"]) == [1.0, 3.0, 4.0]
+
+
+if __name__ == "__main__":
+    test_phases_recorded()
+    test_detach_restores_methods()
+    test_periodic_dump()
+    test_verify_timed_on_stored_and_mutated_levels()
+    test_merge()
+    print("✅ PhaseProfiler records per-phase timings")
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Test that the incremental Reachability engine agrees with a full flood fill.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+from minigrid.core.world_object import Ball, Door, Key, Lava, Wall
+from minigrid.envs.babyai.core.roomgrid_level import RejectSampling, RoomGridLevel
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game.sar.env import PickupVictimEnv
+from src.game.sar.grid import SARGrid
+from src.game.sar.reachability import Reachability, reachable_cells
+from src.game.sar.utils import VictimPlacer
+
+
+def flood(grid, start, unblocking):
+    """Reference reachability by BFS, honouring ``unblocking``."""
+    if not unblocking:
+        return reachable_cells(grid, start)
+
+    def passable(x, y):
+        cell = grid.get(x, y)
+        return cell is None or cell.type == "door" or cell.can_pickup()
+
+    seen, stack = set(), [tuple(start)]
+    while stack:
+        x, y = stack.pop()
+        if (x, y) in seen or not (0 <= x < grid.width and 0 <= y < grid.height):
+            continue
+        seen.add((x, y))
+        if passable(x, y) or (x, y) == tuple(start):
+            stack.extend(((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)))
+    return seen
+
+
+def test_matches_flood_fill_under_random_edits():
+    objects = [None, None, Wall, Lava, lambda: Key("red"), lambda: Ball("red"),
+               lambda: Door("red")]
+    for unblocking in (False, True):
+        rng = random.Random(unblocking)
+        for _ in range(5):
+            grid = SARGrid(12, 12)
+            grid.wall_rect(0, 0, 12, 12)
+            grid.reachability = Reachability(grid, unblocking=unblocking)
+            start = (1, 1)
+
+            for _ in range(300):
+                x, y = rng.randint(1, 10), rng.randint(1, 10)
+                if (x, y) == start:
+                    continue
+                make = rng.choice(objects)
+                grid.set(x, y, make and make())
+
+                expected = flood(grid, start, unblocking)
+                engine = grid.reachability
+                for cy in range(12):
+                    for cx in range(12):
+                        assert engine.is_reachable((cx, cy), start) == (
+                            (cx, cy) in expected
+                        ), (unblocking, cx, cy)
+
+
+def test_check_matches_roomgrid_level():
+    env = PickupVictimEnv(room_size=6, num_rows=3, num_cols=3, render_mode=None)
+    for seed in range(10):
+        env.reset(seed=seed)
+        expected = RoomGridLevel.check_objs_reachable(env, raise_exc=False)
+        assert env.check_objs_reachable(raise_exc=False) == expected
+
+        # Wall in a victim: both checks must reject the level
+        victim = next(iter(env.get_all_victims()))
+        x, y = victim.cur_pos
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            if env.grid.get(x + dx, y + dy) is None:
+                env.grid.set(x + dx, y + dy, Wall())
+        assert not RoomGridLevel.check_objs_reachable(env, raise_exc=False)
+        assert not env.check_objs_reachable(raise_exc=False)
+        try:
+            env.check_objs_reachable()
+            assert False, "expected RejectSampling"
+        except RejectSampling:
+            pass
+
+
+def test_set_state_marks_stale():
+    env = PickupVictimEnv(room_size=6, num_rows=3, num_cols=3, render_mode=None)
+    env.reset(seed=0)
+    state = env.get_state()
+    victim = next(iter(env.get_all_victims()))
+    env.grid.set(*victim.cur_pos, None)
+    env.set_state(state)
+    assert env.grid.reachability.stale
+    expected = tuple(victim.cur_pos) in reachable_cells(env.grid, env.agent_pos)
+    assert env.is_reachable(victim.cur_pos) == expected
+
+
+def test_placed_victims_stay_reachable():
+    """With room to spare, place_in_room never cuts anything off."""
+    env = PickupVictimEnv(
+        room_size=8,
+        num_rows=3,
+        num_cols=3,
+        victim_placer=VictimPlacer(num_fake_victims=2, num_real_victims=1),
+        render_mode=None,
+    )
+    for seed in range(10):
+        env.reset(seed=seed)
+        assert env.grid.reachability.check(env.agent_pos)
+        reachable = reachable_cells(env.grid, env.agent_pos)
+        for pos in env.grid.positions["victim"] | env.grid.positions["fake_victim"]:
+            assert pos in reachable
+
+
+def test_room_local_updates_match_flood_fill():
+    """Window tests and repair_box keep the components exact on big grids."""
+    env = PickupVictimEnv(room_size=6, num_rows=8, num_cols=8, render_mode=None)
+    for seed in range(3):
+        env.reset(seed=seed)
+        engine = env.grid.reachability
+        assert not engine.stale
+        expected = reachable_cells(env.grid, env.agent_pos)
+        for y in range(env.height):
+            for x in range(env.width):
+                assert engine.is_reachable((x, y), env.agent_pos) == (
+                    (x, y) in expected
+                ), (seed, x, y)
+
+
+if __name__ == "__main__":
+    test_matches_flood_fill_under_random_edits()
+    test_check_matches_roomgrid_level()
+    test_set_state_marks_stale()
+    test_placed_victims_stay_reachable()
+    test_room_local_updates_match_flood_fill()
+    print("✅ Reachability engine matches flood fill")
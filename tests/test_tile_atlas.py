@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test the tile atlas: victims drawn from cached masks and atlas tiles are
+pixel-identical to MiniGrid's own rendering, and tiles are drawn once.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+from minigrid.core.constants import COLOR_NAMES, COLORS
+from minigrid.core.grid import Grid
+from minigrid.core.world_object import Door, Key, Lava, Wall
+from minigrid.utils.rendering import fill_coords, point_in_rect
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game.core.atlas import TILE_ATLAS, TileAtlas
+from src.game.sar.objects import FakeVictim, Victim, decode
+
+
+def all_victims():
+    victims = [Victim(direction) for direction in Victim._COORDS]
+    victims += [FakeVictim(*key) for key in FakeVictim._COORDS]
+    return victims
+
+
+def legacy_render(victim, img):
+    """VictimBase.render before the atlas: fill each rectangle per pixel."""
+    for coords in victim._get_render_coords():
+        fill_coords(img, point_in_rect(*coords), COLORS[victim.color])
+    return img
+
+
+def test_victim_masks_match_fill_coords():
+    for victim in all_victims():
+        for size in (24, 96):
+            expected = legacy_render(victim, np.zeros((size, size, 3), np.uint8))
+            actual = victim.render(np.zeros((size, size, 3), np.uint8))
+            assert np.array_equal(actual, expected), victim.type
+
+
+def test_atlas_tiles_match_render_tile():
+    atlas = TileAtlas(decode=decode)
+    objects = all_victims() + [
+        None,
+        Wall(),
+        Lava(),
+        Key("yellow"),
+        Door("red"),
+        Door("blue", is_open=True),
+        Door("green", is_locked=True),
+    ]
+    for obj in objects:
+        for agent_dir in (None, 0, 1, 2, 3):
+            for highlight in (False, True):
+                expected = Grid.render_tile(obj, agent_dir, highlight, tile_size=8)
+                tile = atlas.tile(obj, agent_dir, highlight, tile_size=8)
+                assert np.array_equal(tile, expected.astype(np.uint8))
+
+
+def test_tiles_are_drawn_once():
+    atlas = TileAtlas(decode=decode)
+    victims = all_victims()
+    atlas.warm(victims, tile_size=8)
+    assert len(atlas) == len(victims) * 10 and atlas.misses == len(atlas)
+
+    # Code lookups hit the tiles drawn from objects
+    for victim in victims:
+        tile = atlas.tile_for_code(victim.encode(), 2, True, 8)
+        assert not tile.flags.writeable
+    assert atlas.misses == len(atlas) and atlas.hits == len(victims)
+
+
+def test_shared_atlas_decodes_victims():
+    for obj in all_victims() + [Door(color) for color in COLOR_NAMES[:2]]:
+        tile = TILE_ATLAS.tile_for_code(obj.encode(), tile_size=8)
+        assert np.array_equal(tile, Grid.render_tile(obj, tile_size=8).astype(np.uint8))
+
+
+if __name__ == "__main__":
+    test_victim_masks_match_fill_coords()
+    test_atlas_tiles_match_render_tile()
+    test_tiles_are_drawn_once()
+    test_shared_atlas_decodes_victims()
+    print("✅ Tile atlas matches MiniGrid rendering and draws each tile once")
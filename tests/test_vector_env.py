@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Test that the batched vector env reproduces PickupVictimEnv.step.
+"""
+
+import copy
+import gc
+import sys
+from functools import partial
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game.sar.env import PickupVictimEnv
+from src.game.sar.utils import VictimPlacer
+from src.game.sar.vector import PickupVictimVecEnv, SharedMemoryVecEnv
+
+
+def test_vector_env_matches_single_envs():
+    """Rewards, terminations and observations match stepping each env alone."""
+    num_envs = 4
+    vec = PickupVictimVecEnv(
+        num_envs,
+        room_size=5,
+        num_rows=2,
+        num_cols=2,
+        victim_placer=VictimPlacer(num_fake_victims=1, num_real_victims=1),
+        render_mode=None,
+    )
+    vec.reset(seed=0)
+    rng = np.random.default_rng(0)
+
+    for _ in range(300):
+        actions = rng.integers(0, 6, size=num_envs)
+        refs = [copy.deepcopy(env) for env in vec.envs]
+
+        obs, rewards, terms, truncs, infos = vec.step(actions)
+        final = infos["final_observation"]
+
+        for i, ref in enumerate(refs):
+            ref_obs, ref_reward, ref_term, ref_trunc, _ = ref.step(int(actions[i]))
+            assert rewards[i] == np.float32(ref_reward)
+            assert terms[i] == ref_term
+            assert truncs[i] == ref_trunc
+            assert infos["_final_observation"][i] == (ref_term or ref_trunc)
+            # The terminal observation of a reset env is kept in the infos
+            if ref_term or ref_trunc:
+                assert (final["image"][i] == ref_obs["image"]).all()
+                assert final["direction"][i] == ref_obs["direction"]
+            else:
+                assert (obs["image"][i] == ref_obs["image"]).all()
+                assert obs["direction"][i] == ref_obs["direction"]
+
+
+def test_numpy_seeds():
+    vec = PickupVictimVecEnv(3, room_size=5, num_rows=2, num_cols=2, render_mode=None)
+    expected = vec.reset(seed=7)[0]["image"].copy()
+    for seed in (np.int64(7), np.arange(7, 10), [7, np.int32(8), 9]):
+        assert (vec.reset(seed=seed)[0]["image"] == expected).all()
+
+
+def test_shared_memory_vec_env():
+    """Workers write observations and rewards into the shared buffers."""
+    num_envs = 6
+    vec = SharedMemoryVecEnv(
+        num_envs,
+        num_workers=3,
+        room_size=5,
+        num_rows=2,
+        num_cols=2,
+        victim_placer=VictimPlacer(num_fake_victims=1, num_real_victims=1),
+        render_mode=None,
+    )
+    try:
+        expected = vec.reset(seed=0)[0]["image"].copy()
+        obs, _ = vec.reset(seed=np.int64(0))
+        assert (obs["image"] == expected).all()
+        assert obs["image"].shape == (num_envs, 7, 7, 3)
+        assert obs["image"].any(axis=(1, 2, 3)).all()
+
+        rng = np.random.default_rng(0)
+        for _ in range(50):
+            obs, rewards, terms, truncs, infos = vec.step(rng.integers(0, 6, num_envs))
+            assert set(rewards.tolist()) <= {0.0, 1.0, -0.5, 2.0}
+            assert obs["image"].any(axis=(1, 2, 3)).all()
+            done = infos["_final_observation"]
+            assert (done == (terms | truncs)).all()
+            assert infos["final_observation"]["image"][done].any(axis=(1, 2, 3)).all()
+    finally:
+        vec.close()
+
+
+class CrashingEnv(PickupVictimEnv):
+    def step(self, action):
+        raise ValueError("crashed while stepping")
+
+
+def unlinked(names):
+    for name in names:
+        try:
+            shared_memory.SharedMemory(name=name).close()
+        except FileNotFoundError:
+            continue
+        return False
+    return True
+
+
+def test_worker_errors_reach_the_parent():
+    env_fn = partial(
+        CrashingEnv, room_size=5, num_rows=2, num_cols=2, render_mode=None
+    )
+    vec = SharedMemoryVecEnv(2, num_workers=2, env_fn=env_fn)
+    names = [block.name for block in vec._blocks]
+    vec.reset(seed=0)
+    try:
+        vec.step([0, 0])
+    except RuntimeError as error:
+        assert "crashed while stepping" in str(error)
+    else:
+        raise AssertionError("expected the worker's error")
+
+    # A dead worker is reported too, and close still frees the buffers
+    vec.processes[0].kill()
+    vec.processes[0].join()
+    try:
+        vec.reset(seed=0)
+    except RuntimeError as error:
+        assert "exited" in str(error)
+    else:
+        raise AssertionError("expected an error for the dead worker")
+    vec.close()
+    assert unlinked(names)
+
+    # Buffers are freed when an env is collected without close
+    vec = SharedMemoryVecEnv(2, num_workers=1, env_fn=env_fn)
+    names = [block.name for block in vec._blocks]
+    vec.reset(seed=0)
+    del vec
+    gc.collect()
+    assert unlinked(names)
+
+
+if __name__ == "__main__":
+    test_vector_env_matches_single_envs()
+    test_numpy_seeds()
+    test_shared_memory_vec_env()
+    test_worker_errors_reach_the_parent()
+    print("✅ Vector env matches single-env stepping")
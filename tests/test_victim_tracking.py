@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test that the grid's live victim/key/door bookkeeping matches a full scan.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.game.sar.env import PickupVictimEnv
+from src.game.sar.grid import SARGrid
+from src.game.sar.utils import VictimPlacer
+
+
+def scan_positions(env, obj_types):
+    """Positions of all objects of the given types, found by scanning."""
+    positions = set()
+    for x in range(env.width):
+        for y in range(env.height):
+            if isinstance(env.grid.get(x, y), obj_types):
+                positions.add((x, y))
+    return positions
+
+
+def check_tracking(env):
+    for category, obj_types in SARGrid.CATEGORIES.items():
+        assert env.grid.positions[category] == scan_positions(env, obj_types), category
+
+
+def test_tracking_after_reset():
+    """Counters match the grid right after generation."""
+    env = PickupVictimEnv(
+        room_size=6,
+        num_rows=3,
+        num_cols=3,
+        victim_placer=VictimPlacer(num_fake_victims=2, num_real_victims=2),
+        render_mode=None,
+    )
+
+    for seed in range(5):
+        env.reset(seed=seed)
+        assert isinstance(env.grid, SARGrid)
+        check_tracking(env)
+        print(f"  Seed {seed}: {env.grid.count('victim')} victims tracked")
+
+
+def test_tracking_during_episode():
+    """Counters follow pickups, drops and rescues during random play."""
+    env = PickupVictimEnv(
+        room_size=6,
+        num_rows=2,
+        num_cols=2,
+        victim_placer=VictimPlacer(num_fake_victims=2, num_real_victims=2),
+        render_mode=None,
+    )
+    env.reset(seed=0)
+    rng = random.Random(0)
+
+    for _ in range(500):
+        _, _, terminated, truncated, _ = env.step(rng.randint(0, 5))
+        check_tracking(env)
+        status = env.get_mission_status()
+        assert status["remaining_victims"] == len(env.get_all_victims())
+        if terminated or truncated:
+            env.reset()
+
+
+if __name__ == "__main__":
+    test_tracking_after_reset()
+    test_tracking_during_episode()
+    print("✅ Victim bookkeeping matches full grid scans")